@@ -1,16 +1,101 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from typing import Sequence
 
+import pandas as pd
+from fastapi import APIRouter, HTTPException
+
+from backend.data import supply_plan_repository
 from backend.data.models import (
+    BullwhipBatchRequest,
+    BullwhipBatchResponse,
     BullwhipDiagnosticsRequest,
     BullwhipDiagnosticsResponse,
+    BullwhipMonitorSnapshot,
+    BullwhipObservationRequest,
+)
+from backend.engines.bullwhip import (
+    bullwhip_monitor,
+    bullwhip_table,
+    compute_bullwhip_index,
+    echelon_frame,
 )
-from backend.engines.bullwhip import compute_bullwhip_index
 
 router = APIRouter()
 
 
+def _batch_response(table: pd.DataFrame, keys: Sequence[str], top: int | None) -> BullwhipBatchResponse:
+    if top is not None:
+        table = table.head(top)
+    metrics = table[["demand_variance", "order_variance", "amplification_index"]]
+    metrics = metrics.astype(object).where(metrics.notna(), None)
+    return BullwhipBatchResponse(
+        keys={key: table[key].astype(str).tolist() for key in keys},
+        observations=table["observations"].tolist(),
+        demand_variance=metrics["demand_variance"].tolist(),
+        order_variance=metrics["order_variance"].tolist(),
+        amplification_index=metrics["amplification_index"].tolist(),
+        rank=table["rank"].tolist(),
+    )
+
+
 @router.post("/diagnostics", response_model=BullwhipDiagnosticsResponse)
 def bullwhip_diagnostics(payload: BullwhipDiagnosticsRequest) -> BullwhipDiagnosticsResponse:
-    return compute_bullwhip_index(payload.demand, payload.orders)
\ No newline at end of file
+    return compute_bullwhip_index(payload.demand, payload.orders)
+
+
+@router.post("/diagnostics/batch", response_model=BullwhipBatchResponse)
+def bullwhip_diagnostics_batch(payload: BullwhipBatchRequest) -> BullwhipBatchResponse:
+    keys = ["product_id", "location_id"]
+    frame = pd.DataFrame(payload.model_dump(exclude={"top"}))
+    return _batch_response(bullwhip_table(frame, keys), keys, payload.top)
+
+
+@router.get("/diagnostics/supply-plans", response_model=BullwhipBatchResponse)
+def bullwhip_diagnostics_supply_plans(plan_id: str | None = None, top: int | None = None) -> BullwhipBatchResponse:
+    plans = supply_plan_repository.list_supply_plans()
+    if plan_id is not None:
+        plans = [plan for plan in plans if plan.id == plan_id]
+        if not plans:
+            raise HTTPException(status_code=404, detail="Supply plan not found")
+    keys = ["plan_id", "supplier_id", "node_id"]
+    try:
+        table = bullwhip_table(echelon_frame(plans), keys)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _batch_response(table, keys, top)
+
+
+@router.get("/monitor", response_model=list[BullwhipMonitorSnapshot])
+def list_bullwhip_monitors() -> list[BullwhipMonitorSnapshot]:
+    return bullwhip_monitor.snapshots()
+
+
+@router.post("/monitor/{sku}/{echelon}", response_model=BullwhipMonitorSnapshot)
+def observe_bullwhip(sku: str, echelon: str, payload: BullwhipObservationRequest) -> BullwhipMonitorSnapshot:
+    try:
+        return bullwhip_monitor.observe(
+            sku,
+            echelon,
+            payload.demand,
+            payload.orders,
+            alpha=payload.alpha,
+            window=payload.window,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.get("/monitor/{sku}/{echelon}", response_model=BullwhipMonitorSnapshot)
+def get_bullwhip_monitor(sku: str, echelon: str) -> BullwhipMonitorSnapshot:
+    snapshot = bullwhip_monitor.snapshot(sku, echelon)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="No observations for this SKU and echelon")
+    return snapshot
+
+
+@router.delete("/monitor/{sku}/{echelon}")
+def reset_bullwhip_monitor(sku: str, echelon: str) -> dict[str, bool]:
+    if not bullwhip_monitor.reset(sku, echelon):
+        raise HTTPException(status_code=404, detail="No observations for this SKU and echelon")
+    return {"deleted": True}
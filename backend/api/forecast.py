@@ -1,13 +1,125 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from typing import Dict, Iterator, List
 
-from backend.data.models import ForecastRequest, ForecastResponse
-from backend.engines.forecasting import run_forecast
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from backend.data.adapters.sample_loader import load_demand_panel
+from backend.data.models import (
+    BacktestMethodResult,
+    BacktestRequest,
+    BacktestResponse,
+    ForecastBatchRequest,
+    ForecastBatchResponse,
+    ForecastCacheStats,
+    ForecastRequest,
+    ForecastResponse,
+    ForecastUpdateRequest,
+)
+from backend.engines.backtest import run_backtest
+from backend.engines.forecasting import (
+    forecast_cache_stats,
+    iter_forecast_batch,
+    run_forecast,
+    run_forecast_batch,
+    update_forecast,
+)
 
 router = APIRouter()
 
 
 @router.post("/run", response_model=ForecastResponse)
 def run_forecast_endpoint(payload: ForecastRequest) -> ForecastResponse:
-    return run_forecast(payload.method, payload.series, payload.horizon)
\ No newline at end of file
+    return run_forecast(
+        payload.method,
+        payload.series,
+        payload.horizon,
+        interval_paths=payload.interval_paths,
+        interval_seed=payload.interval_seed,
+    )
+
+
+@router.post("/update", response_model=ForecastResponse)
+def update_forecast_endpoint(payload: ForecastUpdateRequest) -> ForecastResponse:
+    return update_forecast(
+        payload.method,
+        payload.series,
+        payload.new_observations,
+        payload.horizon,
+        refit=payload.refit,
+        interval_paths=payload.interval_paths,
+        interval_seed=payload.interval_seed,
+    )
+
+
+@router.post("/backtest", response_model=BacktestResponse)
+def backtest_endpoint(payload: BacktestRequest) -> BacktestResponse:
+    results = []
+    for method in payload.methods:
+        try:
+            backtest = run_backtest(
+                method,
+                payload.series,
+                payload.horizon,
+                min_train_size=payload.min_train_size,
+                step=payload.step,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        results.append(
+            BacktestMethodResult(
+                method=method,
+                origins=backtest.origins.tolist(),
+                per_origin=backtest.per_origin(),
+                aggregate=backtest.aggregate(),
+            )
+        )
+    return BacktestResponse(results=results)
+
+
+def _resolve_batch_series(payload: ForecastBatchRequest) -> Dict[str, List[float]]:
+    if payload.series:
+        return {item.series_id: item.series for item in payload.series}
+    try:
+        return load_demand_panel(payload.product_id, payload.location_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+@router.post("/batch", response_model=ForecastBatchResponse)
+def run_forecast_batch_endpoint(payload: ForecastBatchRequest) -> ForecastBatchResponse:
+    series = _resolve_batch_series(payload)
+    results = run_forecast_batch(
+        payload.method,
+        series,
+        payload.horizon,
+        max_workers=payload.max_workers,
+    )
+    failed = sum(1 for item in results if item.error is not None)
+    return ForecastBatchResponse(
+        results=results,
+        succeeded=len(results) - failed,
+        failed=failed,
+    )
+
+
+@router.post("/batch/stream")
+def stream_forecast_batch_endpoint(payload: ForecastBatchRequest) -> StreamingResponse:
+    series = _resolve_batch_series(payload)
+
+    def lines() -> Iterator[str]:
+        for item in iter_forecast_batch(
+            payload.method,
+            series,
+            payload.horizon,
+            max_workers=payload.max_workers,
+        ):
+            yield item.model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get("/cache", response_model=ForecastCacheStats)
+def forecast_cache_endpoint() -> ForecastCacheStats:
+    return forecast_cache_stats()
@@ -1,15 +1,37 @@
 from __future__ import annotations
 
+from typing import Iterator
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from backend.data.models import (
+    InventoryFrontierRequest,
+    InventoryFrontierResponse,
+    InventoryMonteCarloRequest,
+    InventoryMonteCarloResponse,
+    InventoryOptimizeRequest,
+    InventoryOptimizeResponse,
+    InventoryPolicyBatchRequest,
+    InventoryPolicyBatchResponse,
     InventoryPolicyRequest,
     InventoryPolicyResponse,
+    InventorySimulationBatchItem,
+    InventorySimulationBatchRequest,
     InventorySimulationRequest,
     InventorySimulationResponse,
+    PolicyCandidateResult,
+    SimulationTraceModel,
     StockoutEventModel,
 )
-from backend.engines.inventory import compute_policy
+from backend.engines.inventory import (
+    compute_policy,
+    compute_policy_batch,
+    policy_notes,
+    service_level_frontier,
+)
+from backend.engines.monte_carlo import run_monte_carlo_simulation
+from backend.engines.policy_search import optimize_qr_policy
 from backend.engines.simulation import run_single_item_simulation
 
 router = APIRouter()
@@ -20,11 +42,41 @@ def compute_inventory_policy(payload: InventoryPolicyRequest) -> InventoryPolicy
     return compute_policy(payload)
 
 
-@router.post("/simulate", response_model=InventorySimulationResponse)
-def simulate_inventory(payload: InventorySimulationRequest) -> InventorySimulationResponse:
-    if not payload.demand_profile:
-        raise HTTPException(status_code=400, detail="Demand profile cannot be empty.")
+@router.post("/policy/batch", response_model=InventoryPolicyBatchResponse)
+def compute_inventory_policy_batch(payload: InventoryPolicyBatchRequest) -> InventoryPolicyBatchResponse:
+    columns = payload.model_dump(exclude={"method", "sku"})
+    try:
+        policy = compute_policy_batch(payload.method, columns)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return InventoryPolicyBatchResponse(
+        sku=payload.sku,
+        policy={name: values.tolist() for name, values in policy.items()},
+        notes=policy_notes(payload.method),
+    )
 
+
+@router.post("/policy/frontier", response_model=InventoryFrontierResponse)
+def compute_service_level_frontier(payload: InventoryFrontierRequest) -> InventoryFrontierResponse:
+    columns = payload.model_dump(exclude={"method", "sku", "service_levels"})
+    try:
+        frontier = service_level_frontier(payload.method, columns, payload.service_levels)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return InventoryFrontierResponse(
+        sku=payload.sku,
+        service_levels=frontier.service_levels.tolist(),
+        safety_stock=frontier.safety_stock.tolist(),
+        holding_cost=frontier.holding_cost.tolist(),
+        expected_shortage=frontier.expected_shortage.tolist(),
+        shortage_cost=frontier.shortage_cost.tolist(),
+        total_cost=frontier.total_cost.tolist(),
+        optimal_service_level=frontier.optimal_service_level.tolist(),
+        optimal_total_cost=frontier.optimal_total_cost.tolist(),
+    )
+
+
+def _simulate(payload: InventorySimulationRequest) -> InventorySimulationResponse:
     report = run_single_item_simulation(
         demand_profile=payload.demand_profile,
         initial_inventory=payload.initial_inventory,
@@ -34,13 +86,92 @@ def simulate_inventory(payload: InventorySimulationRequest) -> InventorySimulati
         seed=payload.seed,
     )
 
+    periods = report.stockout_periods
     stockouts = [
-        StockoutEventModel(time=event.time, shortfall=event.shortfall)
-        for event in report.stockouts
+        StockoutEventModel(time=time, shortfall=shortfall)
+        for time, shortfall in zip(periods.tolist(), report.trace.lost[periods - 1].tolist())
     ]
 
     return InventorySimulationResponse(
         demand_served=report.demand_served,
         demand_lost=report.demand_lost,
         stockouts=stockouts,
-    )
\ No newline at end of file
+        trace=SimulationTraceModel(**report.trace.to_columns()) if payload.trace else None,
+    )
+
+
+@router.post("/simulate", response_model=InventorySimulationResponse)
+def simulate_inventory(payload: InventorySimulationRequest) -> InventorySimulationResponse:
+    if not payload.demand_profile:
+        raise HTTPException(status_code=400, detail="Demand profile cannot be empty.")
+    return _simulate(payload)
+
+
+@router.post("/simulate/monte-carlo", response_model=InventoryMonteCarloResponse)
+def simulate_inventory_monte_carlo(payload: InventoryMonteCarloRequest) -> InventoryMonteCarloResponse:
+    try:
+        report = run_monte_carlo_simulation(
+            demand_profile=payload.demand_profile,
+            initial_inventory=payload.initial_inventory,
+            reorder_point=payload.reorder_point,
+            order_quantity=payload.order_quantity,
+            lead_time=payload.lead_time,
+            replications=payload.replications,
+            demand_cv=payload.demand_cv,
+            lead_time_std=payload.lead_time_std,
+            seed=payload.seed,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    summary = report.summary()
+    return InventoryMonteCarloResponse(
+        replications=report.replications,
+        demand_served=summary["demand_served"],
+        demand_lost=summary["demand_lost"],
+        fill_rate=summary["fill_rate"],
+        cycle_service_level=summary["cycle_service_level"],
+    )
+
+
+@router.post("/optimize", response_model=InventoryOptimizeResponse)
+def optimize_inventory_policy(payload: InventoryOptimizeRequest) -> InventoryOptimizeResponse:
+    try:
+        result = optimize_qr_policy(**payload.model_dump())
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    best = result.best_index
+    return InventoryOptimizeResponse(
+        reorder_point=float(result.reorder_point[best]),
+        order_quantity=float(result.order_quantity[best]),
+        expected_cost=float(result.mean_cost[best]),
+        std_error=result.best_std_error,
+        rounds=result.rounds,
+        paths_simulated=result.paths_simulated,
+        candidates=[
+            PolicyCandidateResult(
+                reorder_point=float(reorder_point),
+                order_quantity=float(order_quantity),
+                mean_cost=float(mean_cost),
+                replications=int(replications),
+            )
+            for reorder_point, order_quantity, mean_cost, replications in zip(
+                result.reorder_point, result.order_quantity, result.mean_cost, result.replications
+            )
+        ],
+    )
+
+
+@router.post("/simulate/stream")
+def stream_inventory_simulations(payload: InventorySimulationBatchRequest) -> StreamingResponse:
+    def lines() -> Iterator[str]:
+        for scenario in payload.scenarios:
+            try:
+                item = InventorySimulationBatchItem(
+                    scenario_id=scenario.scenario_id,
+                    result=_simulate(scenario),
+                )
+            except ValueError as exc:
+                item = InventorySimulationBatchItem(scenario_id=scenario.scenario_id, error=str(exc))
+            yield item.model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+from backend.api import inventory, optimization, supply_plans
+from backend.data import job_repository
+from backend.data.models import (
+    AggregatePlanRequest,
+    InventoryMonteCarloRequest,
+    InventoryOptimizeRequest,
+    InventorySimulationRequest,
+    JobModel,
+    JobStatus,
+    JobSubmitRequest,
+    MakeToOrderScenarioRequest,
+    NetworkSimulationRequest,
+)
+from backend.engines.jobs import job_queue
+
+router = APIRouter()
+
+
+@dataclass(frozen=True)
+class _EndpointJob:
+    """Runs an API endpoint in a job worker; ``path_params`` are read from the payload."""
+
+    request: Type[BaseModel]
+    endpoint: Callable[..., BaseModel]
+    path_params: Tuple[str, ...] = ()
+
+    def validate(self, payload: Dict[str, Any]) -> BaseModel:
+        missing = [name for name in self.path_params if not isinstance(payload.get(name), str)]
+        if missing:
+            msg = f"Job payload is missing {', '.join(missing)}."
+            raise ValueError(msg)
+        return self.request.model_validate(payload)
+
+    def __call__(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        request = self.validate(payload)
+        try:
+            response = self.endpoint(*(payload[name] for name in self.path_params), request)
+        except HTTPException as exc:
+            raise ValueError(exc.detail) from exc
+        return response.model_dump(mode="json")
+
+
+_JOBS: Dict[str, _EndpointJob] = {
+    "inventory.simulate": _EndpointJob(InventorySimulationRequest, inventory.simulate_inventory),
+    "inventory.monte-carlo": _EndpointJob(InventoryMonteCarloRequest, inventory.simulate_inventory_monte_carlo),
+    "inventory.optimize": _EndpointJob(InventoryOptimizeRequest, inventory.optimize_inventory_policy),
+    "optimization.scenarios": _EndpointJob(
+        MakeToOrderScenarioRequest, optimization.solve_optimization_scenarios
+    ),
+    "supply-plans.simulate": _EndpointJob(
+        NetworkSimulationRequest, supply_plans.simulate_supply_plan, ("plan_id",)
+    ),
+    "supply-plans.aggregate-plan": _EndpointJob(
+        AggregatePlanRequest, supply_plans.plan_supply_plan_orders, ("plan_id",)
+    ),
+}
+for _kind, _handler in _JOBS.items():
+    job_queue.register(_kind, _handler)
+
+
+def _job(job: JobModel | None) -> JobModel:
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return job
+
+
+@router.get("/kinds", response_model=list[str])
+def list_job_kinds() -> list[str]:
+    return job_queue.kinds
+
+
+@router.post("/", response_model=JobModel, status_code=status.HTTP_202_ACCEPTED)
+def submit_job(payload: JobSubmitRequest) -> JobModel:
+    job = _JOBS.get(payload.kind)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown job kind '{payload.kind}'.")
+    try:
+        job.validate(payload.payload)
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors(include_url=False)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return job_queue.submit(payload.kind, payload.payload)
+
+
+@router.get("/", response_model=list[JobModel])
+def list_jobs(
+    job_status: Optional[JobStatus] = Query(default=None, alias="status"),
+    limit: int = Query(default=100, ge=1, le=1_000),
+) -> list[JobModel]:
+    return job_repository.list_jobs(status=job_status, limit=limit)
+
+
+@router.get("/{job_id}", response_model=JobModel)
+def get_job(job_id: str, wait: float = Query(default=0.0, ge=0, le=60)) -> JobModel:
+    if wait > 0:
+        return _job(job_queue.wait(job_id, wait))
+    return _job(job_repository.get_job(job_id))
+
+
+@router.delete("/{job_id}", response_model=JobModel)
+def cancel_job(job_id: str) -> JobModel:
+    return _job(job_queue.cancel(job_id))
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+import numpy as np
+from fastapi import APIRouter, HTTPException, status
+
+from backend.data.models import (
+    CapacitySweepRequest,
+    CapacitySweepResponse,
+    MakeToOrderRequest,
+    MakeToOrderScenarioRequest,
+    MakeToOrderScenarioResponse,
+    OptimizationResultModel,
+    OptimizationSessionResponse,
+    OptimizationSessionUpdateRequest,
+)
+from backend.engines.optimization import (
+    CapacityConstraint,
+    MakeToOrderSession,
+    OptimizationResult,
+    Product,
+    optimization_sessions,
+    solve_make_to_order_scenarios,
+)
+
+router = APIRouter()
+
+
+def _result_model(result: OptimizationResult) -> OptimizationResultModel:
+    return OptimizationResultModel(
+        objective=result.objective,
+        production_plan=result.production_plan,
+        shadow_prices=result.shadow_prices,
+        build_seconds=result.build_seconds,
+        solve_seconds=result.solve_seconds,
+    )
+
+
+def _nullable(values: np.ndarray) -> List[Optional[float]]:
+    return [None if np.isnan(value) else value for value in values.tolist()]
+
+
+def _session(session_id: str) -> MakeToOrderSession:
+    session = optimization_sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Optimization session not found")
+    return session
+
+
+@router.post("/sessions", response_model=OptimizationSessionResponse, status_code=status.HTTP_201_CREATED)
+def create_optimization_session(payload: MakeToOrderRequest) -> OptimizationSessionResponse:
+    try:
+        session = MakeToOrderSession.from_products(
+            [Product(**product.model_dump()) for product in payload.products],
+            [CapacityConstraint(**capacity.model_dump()) for capacity in payload.capacities],
+        )
+        result = session.solve()
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return OptimizationSessionResponse(
+        session_id=optimization_sessions.add(session),
+        result=_result_model(result),
+    )
+
+
+@router.patch("/sessions/{session_id}", response_model=OptimizationSessionResponse)
+def update_optimization_session(
+    session_id: str, payload: OptimizationSessionUpdateRequest
+) -> OptimizationSessionResponse:
+    session = _session(session_id)
+    with session.lock:
+        try:
+            result = session.update(payload.capacity_limits, payload.contribution_margins)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return OptimizationSessionResponse(session_id=session_id, result=_result_model(result))
+
+
+@router.post("/sessions/{session_id}/sweep", response_model=CapacitySweepResponse)
+def sweep_optimization_session(session_id: str, payload: CapacitySweepRequest) -> CapacitySweepResponse:
+    session = _session(session_id)
+    with session.lock:
+        try:
+            sweep = session.sweep(payload.capacity, payload.limits)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return CapacitySweepResponse(
+        capacity=sweep.capacity,
+        limits=sweep.limits.tolist(),
+        objective=sweep.objective.tolist(),
+        production_plan=dict(zip(session.product_names, sweep.production_plan.T.tolist())),
+        shadow_prices=dict(zip(session.capacity_names, sweep.shadow_prices.T.tolist())),
+        breakpoints=sweep.breakpoints.tolist(),
+        iterations=sweep.iterations.tolist(),
+    )
+
+
+@router.delete("/sessions/{session_id}")
+def delete_optimization_session(session_id: str) -> dict[str, bool]:
+    if not optimization_sessions.remove(session_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Optimization session not found")
+    return {"deleted": True}
+
+
+@router.post("/scenarios", response_model=MakeToOrderScenarioResponse)
+def solve_optimization_scenarios(payload: MakeToOrderScenarioRequest) -> MakeToOrderScenarioResponse:
+    try:
+        batch = solve_make_to_order_scenarios(
+            [Product(**product.model_dump()) for product in payload.products],
+            [CapacityConstraint(**capacity.model_dump()) for capacity in payload.capacities],
+            [(scenario.capacity_limits, scenario.contribution_margins) for scenario in payload.scenarios],
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return MakeToOrderScenarioResponse(
+        scenarios=[scenario.name for scenario in payload.scenarios],
+        objective=_nullable(batch.objective),
+        production_plan={
+            name: _nullable(column) for name, column in zip(batch.product_names, batch.production_plan.T)
+        },
+        shadow_prices={name: _nullable(column) for name, column in zip(batch.capacity_names, batch.shadow_prices.T)},
+        unique_scenarios=batch.unique_scenarios,
+        solve_seconds=batch.solve_seconds,
+    )
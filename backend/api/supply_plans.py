@@ -1,13 +1,27 @@
 from __future__ import annotations
 
+import math
+
 from fastapi import APIRouter, HTTPException, status
 
 from backend.data import supply_plan_repository
 from backend.data.models import (
+    AggregatePlanLinkResult,
+    AggregatePlanRequest,
+    AggregatePlanResponse,
+    NetworkNodeSimulationResult,
+    NetworkSimulationRequest,
+    NetworkSimulationResponse,
+    SafetyStockNodeResult,
+    SafetyStockPlacementRequest,
+    SafetyStockPlacementResponse,
     SupplyPlanCreateRequest,
     SupplyPlanModel,
     SupplyPlanUpdateRequest,
 )
+from backend.engines.aggregate_planning import apply_aggregate_plan, plan_aggregate_supply
+from backend.engines.multi_echelon import apply_placement, optimize_safety_stock
+from backend.engines.network_simulation import simulate_supply_network
 
 router = APIRouter()
 
@@ -44,3 +58,120 @@ def delete_supply_plan(plan_id: str) -> dict[str, bool]:
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Supply plan not found")
     return {"deleted": True}
+
+
+@router.post("/{plan_id}/safety-stock", response_model=SafetyStockPlacementResponse)
+def place_safety_stock(plan_id: str, payload: SafetyStockPlacementRequest) -> SafetyStockPlacementResponse:
+    plan = supply_plan_repository.get_supply_plan(plan_id)
+    if plan is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Supply plan not found")
+    try:
+        placement = optimize_safety_stock(
+            plan,
+            max_service_time_days=payload.max_service_time_days,
+            days_per_period=payload.days_per_period,
+            holding_rate=payload.holding_rate,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    nodes = apply_placement(plan, placement)
+    if payload.persist:
+        plan = supply_plan_repository.update_supply_plan(plan_id, SupplyPlanUpdateRequest(nodes=nodes)) or plan
+    else:
+        plan = plan.model_copy(update={"nodes": nodes})
+
+    return SafetyStockPlacementResponse(
+        plan=plan,
+        total_holding_cost=placement.total_holding_cost,
+        nodes=[
+            SafetyStockNodeResult(
+                node_id=node_id,
+                inbound_service_days=int(placement.inbound_service_days[index]),
+                outbound_service_days=int(placement.outbound_service_days[index]),
+                net_replenishment_days=int(placement.net_replenishment_days[index]),
+                safety_stock=float(placement.safety_stock[index]),
+                reorder_point=float(placement.reorder_point[index]),
+                holding_cost=float(placement.holding_cost[index]),
+            )
+            for index, node_id in enumerate(placement.node_ids)
+        ],
+    )
+
+
+@router.post("/{plan_id}/simulate", response_model=NetworkSimulationResponse)
+def simulate_supply_plan(plan_id: str, payload: NetworkSimulationRequest) -> NetworkSimulationResponse:
+    plan = supply_plan_repository.get_supply_plan(plan_id)
+    if plan is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Supply plan not found")
+    try:
+        report = simulate_supply_network(
+            plan,
+            periods=payload.periods,
+            days_per_period=payload.days_per_period,
+            profile_days_per_period=payload.profile_days_per_period,
+            demand_cv=payload.demand_cv,
+            seed=payload.seed,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    bullwhip = report.bullwhip
+    return NetworkSimulationResponse(
+        plan_id=plan_id,
+        periods=payload.periods,
+        nodes=[
+            NetworkNodeSimulationResult(
+                node_id=node_id,
+                fill_rate=float(report.fill_rate[index]),
+                stockout_periods=int(report.stockout_periods[index]),
+                external_demand=float(report.external_demand[index]),
+                external_lost=float(report.external_lost[index]),
+                average_on_hand=float(report.average_on_hand[index]),
+                bullwhip=None if math.isnan(bullwhip[index]) else float(bullwhip[index]),
+            )
+            for index, node_id in enumerate(report.node_ids)
+        ],
+    )
+
+
+@router.post("/{plan_id}/aggregate-plan", response_model=AggregatePlanResponse)
+def plan_supply_plan_orders(plan_id: str, payload: AggregatePlanRequest) -> AggregatePlanResponse:
+    plan = supply_plan_repository.get_supply_plan(plan_id)
+    if plan is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Supply plan not found")
+    try:
+        result = plan_aggregate_supply(
+            plan,
+            days_per_period=payload.days_per_period,
+            holding_cost=payload.holding_cost,
+            shortage_cost=payload.shortage_cost,
+            order_cost=payload.order_cost,
+            time_limit_seconds=payload.time_limit_seconds,
+            gap=payload.gap,
+            threads=payload.threads,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    nodes = apply_aggregate_plan(plan, result)
+    if payload.persist:
+        plan = supply_plan_repository.update_supply_plan(plan_id, SupplyPlanUpdateRequest(nodes=nodes)) or plan
+    else:
+        plan = plan.model_copy(update={"nodes": nodes})
+
+    return AggregatePlanResponse(
+        plan=plan,
+        periods=result.periods,
+        objective=result.objective,
+        status=result.status,
+        links=[
+            AggregatePlanLinkResult(node_id=node_id, supplier_id=supplier_id, orders=result.orders[index].tolist())
+            for index, (node_id, supplier_id) in enumerate(result.links)
+        ],
+        unmet_demand={
+            node_id: float(result.shortage[index].sum()) for index, node_id in enumerate(result.node_ids)
+        },
+        build_seconds=result.build_seconds,
+        solve_seconds=result.solve_seconds,
+    )
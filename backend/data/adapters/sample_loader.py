@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 import pandas as pd
 
@@ -36,7 +36,34 @@ def load_demand_series(product_id: str, location_id: str) -> List[float]:
     return series
 
 
+def series_key(product_id: str, location_id: str) -> str:
+    return f"{product_id}:{location_id}"
+
+
+def load_demand_panel(
+    product_id: str | None = None,
+    location_id: str | None = None,
+) -> Dict[str, List[float]]:
+    """Load every demand series matching the filters, keyed by ``product:location``."""
+    demand = load_table("demand.csv")
+    if product_id is not None:
+        demand = demand[demand["product_id"] == product_id]
+    if location_id is not None:
+        demand = demand[demand["location_id"] == location_id]
+    if demand.empty:
+        msg = f"No demand series for product={product_id} location={location_id}"
+        raise ValueError(msg)
+
+    panel: Dict[str, List[float]] = {}
+    ordered = demand.sort_values(["product_id", "location_id", "date"])
+    for (product, location), group in ordered.groupby(["product_id", "location_id"], sort=False):
+        panel[series_key(str(product), str(location))] = group["quantity"].astype(float).tolist()
+    return panel
+
+
 __all__ = [
     "load_table",
+    "load_demand_panel",
     "load_demand_series",
+    "series_key",
 ]
\ No newline at end of file
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+
+from backend.data.models import ForecastStateModel
+
+_DEFAULT_PATH = Path(__file__).resolve().parent / "forecast_states.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS forecast_states (
+    key TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+)
+"""
+
+
+def _store_path() -> Path:
+    return Path(os.getenv("SUPPLYCHAINOS_FORECAST_STATE_PATH", str(_DEFAULT_PATH)))
+
+
+def _connect() -> sqlite3.Connection:
+    path = _store_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute(_SCHEMA)
+    return connection
+
+
+def get_state(key: str) -> ForecastStateModel | None:
+    with closing(_connect()) as connection:
+        row = connection.execute("SELECT state FROM forecast_states WHERE key = ?", (key,)).fetchone()
+    return None if row is None else ForecastStateModel.model_validate_json(row[0])
+
+
+def save_state(key: str, state: ForecastStateModel, replaces: str | None = None) -> None:
+    """Store ``state`` under ``key``, dropping the superseded ``replaces`` entry."""
+
+    with closing(_connect()) as connection:
+        with connection:
+            connection.execute("BEGIN")
+            connection.execute(
+                "INSERT OR REPLACE INTO forecast_states (key, state, updated_at) VALUES (?, ?, ?)",
+                (key, state.model_dump_json(), datetime.now(timezone.utc).isoformat()),
+            )
+            if replaces is not None and replaces != key:
+                connection.execute("DELETE FROM forecast_states WHERE key = ?", (replaces,))
+
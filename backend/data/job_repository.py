@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import uuid
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from backend.data.models import JobModel, JobStatus
+
+_DEFAULT_PATH = Path(__file__).resolve().parent / "jobs.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT
+)
+"""
+_COLUMNS = "id, kind, status, result, error, created_at, started_at, finished_at"
+
+
+def _store_path() -> Path:
+    return Path(os.getenv("SUPPLYCHAINOS_JOBS_PATH", str(_DEFAULT_PATH)))
+
+
+def _connect() -> sqlite3.Connection:
+    path = _store_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Worker processes write results while the API reads: WAL lets both proceed.
+    connection = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute(_SCHEMA)
+    return connection
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _to_model(row: Tuple[Any, ...]) -> JobModel:
+    job_id, kind, status, result, error, created_at, started_at, finished_at = row
+    return JobModel(
+        id=job_id,
+        kind=kind,
+        status=status,
+        result=None if result is None else json.loads(result),
+        error=error,
+        created_at=created_at,
+        started_at=started_at,
+        finished_at=finished_at,
+    )
+
+
+def create_job(kind: str, payload: Dict[str, Any]) -> JobModel:
+    job = JobModel(id=uuid.uuid4().hex, kind=kind, status=JobStatus.QUEUED, created_at=_now())
+    with closing(_connect()) as connection:
+        connection.execute(
+            "INSERT INTO jobs (id, kind, status, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+            (job.id, job.kind, job.status.value, json.dumps(payload), job.created_at),
+        )
+    return job
+
+
+def get_job(job_id: str) -> JobModel | None:
+    with closing(_connect()) as connection:
+        row = connection.execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    return None if row is None else _to_model(row)
+
+
+def list_jobs(status: JobStatus | None = None, limit: int = 100) -> List[JobModel]:
+    query = f"SELECT {_COLUMNS} FROM jobs"
+    params: Tuple[str, ...] = ()
+    if status is not None:
+        query += " WHERE status = ?"
+        params = (status.value,)
+    query += " ORDER BY created_at DESC LIMIT ?"
+    with closing(_connect()) as connection:
+        rows = connection.execute(query, (*params, limit)).fetchall()
+    return [_to_model(row) for row in rows]
+
+
+def mark_running(job_id: str) -> bool:
+    """Move a queued job to running; False when it was cancelled meanwhile."""
+
+    with closing(_connect()) as connection:
+        cursor = connection.execute(
+            "UPDATE jobs SET status = 'running', started_at = ? WHERE id = ? AND status = 'queued'",
+            (_now(), job_id),
+        )
+    return cursor.rowcount == 1
+
+
+def finish_job(
+    job_id: str,
+    status: JobStatus,
+    result: Dict[str, Any] | None = None,
+    error: str | None = None,
+) -> bool:
+    """Record a job's outcome unless it has already finished.
+
+    The first outcome wins, so a cancellation and a worker finishing at the
+    same moment cannot overwrite one another.
+    """
+
+    with closing(_connect()) as connection:
+        cursor = connection.execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? "
+            "WHERE id = ? AND status IN ('queued', 'running')",
+            (status.value, None if result is None else json.dumps(result), error, _now(), job_id),
+        )
+    return cursor.rowcount == 1
+
+
+def fail_unfinished_jobs(error: str) -> int:
+    """Mark every queued or running job failed; returns how many were marked."""
+
+    with closing(_connect()) as connection:
+        cursor = connection.execute(
+            "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? "
+            "WHERE status IN ('queued', 'running')",
+            (error, _now()),
+        )
+    return cursor.rowcount
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Annotated, Any, ClassVar, Dict, FrozenSet, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator, model_validator
 
@@ -11,6 +11,7 @@ class ForecastMethod(str, Enum):
     ETS = "ets"
     CROSTON = "croston"
     ARIMA = "arima"
+    AUTO = "auto"
 
 
 class ForecastMetrics(BaseModel):
@@ -23,6 +24,13 @@ class ForecastRequest(BaseModel):
     method: ForecastMethod
     series: List[float] = Field(..., min_length=2)
     horizon: int = Field(4, gt=0, le=52)
+    interval_paths: Optional[int] = Field(
+        default=None,
+        ge=100,
+        le=100_000,
+        description="Bootstrap paths for p50/p90/p95 prediction intervals; omitted means point forecasts only.",
+    )
+    interval_seed: int = 0
 
     @field_validator("series")
     @classmethod
@@ -43,12 +51,127 @@ class ForecastRequest(BaseModel):
         return self
 
 
+class ForecastUpdateRequest(BaseModel):
+    method: ForecastMethod
+    series: List[float] = Field(..., min_length=2, description="History the stored fit was built on.")
+    new_observations: List[float] = Field(..., min_length=1)
+    horizon: int = Field(4, gt=0, le=52)
+    refit: bool = Field(
+        default=False,
+        description="Re-estimate parameters warm-started from the stored fit instead of filtering only.",
+    )
+    interval_paths: Optional[int] = Field(
+        default=None,
+        ge=100,
+        le=100_000,
+        description="Bootstrap paths for p50/p90/p95 prediction intervals; omitted means point forecasts only.",
+    )
+    interval_seed: int = 0
+
+    @model_validator(mode="after")
+    def check_horizon(self) -> "ForecastUpdateRequest":
+        if self.horizon >= len(self.series):
+            msg = "Horizon must be smaller than the historical series length."
+            raise ValueError(msg)
+        return self
+
+
+class ForecastStateModel(BaseModel):
+    """Fitted parameters and filter state persisted between forecast updates."""
+
+    method: ForecastMethod
+    params: List[float] = Field(..., description="ARIMA parameters, or [alpha] for ETS.")
+    state: List[float] = Field(..., description="Predicted state after the last observation (ETS: [level]).")
+    state_cov: List[List[float]] = Field(default_factory=list)
+    residuals: List[float] = Field(default_factory=list, description="Latest one-step residuals of the fit.")
+
+
+class ModelSelectionReport(BaseModel):
+    selected: ForecastMethod
+    demand_class: str = Field(..., description="Syntetos-Boylan class: smooth, erratic, intermittent or lumpy.")
+    adi: float = Field(..., description="Average inter-demand interval.")
+    cv2: float = Field(..., description="Squared coefficient of variation of non-zero demand.")
+    fitted: List[ForecastMethod]
+    skipped: Dict[str, str] = Field(default_factory=dict, description="Pruned candidates and why.")
+    timings_ms: Dict[str, float] = Field(default_factory=dict)
+    scores: Dict[str, float] = Field(default_factory=dict, description="Holdout MASE per fitted candidate.")
+
+
 class ForecastResponse(BaseModel):
     model_config = ConfigDict(protected_namespaces=())
 
     forecast: List[float]
     metrics: ForecastMetrics
     model_summary: Dict[str, float] = Field(default_factory=dict)
+    selection: Optional[ModelSelectionReport] = None
+    intervals: Dict[str, List[float]] = Field(
+        default_factory=dict,
+        description="Bootstrap quantile paths keyed p50/p90/p95.",
+    )
+
+
+class BacktestRequest(BaseModel):
+    methods: List[ForecastMethod] = Field(..., min_length=1)
+    series: List[float] = Field(..., min_length=3)
+    horizon: int = Field(4, gt=0, le=52)
+    min_train_size: Optional[int] = Field(default=None, ge=2)
+    step: int = Field(1, gt=0)
+
+
+class BacktestMethodResult(BaseModel):
+    method: ForecastMethod
+    origins: List[int]
+    per_origin: List[ForecastMetrics]
+    aggregate: ForecastMetrics
+
+
+class BacktestResponse(BaseModel):
+    results: List[BacktestMethodResult]
+
+
+class ForecastCacheStats(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+    ttl_seconds: float
+
+
+class ForecastSeriesInput(BaseModel):
+    series_id: str = Field(..., min_length=1)
+    series: List[float] = Field(..., min_length=2)
+
+
+class ForecastBatchRequest(BaseModel):
+    method: ForecastMethod
+    horizon: int = Field(4, gt=0, le=52)
+    series: List[ForecastSeriesInput] = Field(
+        default_factory=list,
+        description="Series to forecast. When empty, series are resolved from the demand table.",
+    )
+    product_id: Optional[str] = None
+    location_id: Optional[str] = None
+    max_workers: Optional[int] = Field(default=None, ge=1, le=64)
+
+    @model_validator(mode="after")
+    def check_unique_ids(self) -> "ForecastBatchRequest":
+        ids = [item.series_id for item in self.series]
+        if len(ids) != len(set(ids)):
+            msg = "Series identifiers must be unique within a batch."
+            raise ValueError(msg)
+        return self
+
+
+class ForecastBatchItem(BaseModel):
+    series_id: str
+    result: Optional[ForecastResponse] = None
+    error: Optional[str] = None
+
+
+class ForecastBatchResponse(BaseModel):
+    results: List[ForecastBatchItem]
+    succeeded: int
+    failed: int
 
 
 class InventoryMethod(str, Enum):
@@ -75,7 +198,73 @@ class InventoryPolicyResponse(BaseModel):
     notes: str = ""
 
 
-class InventorySimulationRequest(BaseModel):
+ServiceLevel = Annotated[float, Field(ge=0.5, le=0.999)]
+
+
+class InventoryPolicyBatchRequest(BaseModel):
+    """Column arrays of ``InventoryPolicyRequest`` fields, one entry per SKU."""
+
+    method: InventoryMethod
+    sku: Optional[List[str]] = None
+    annual_demand: Optional[List[Optional[float]]] = None
+    demand_rate: Optional[List[Optional[float]]] = None
+    lead_time: Optional[List[Optional[float]]] = None
+    holding_cost: Optional[List[Optional[float]]] = None
+    ordering_cost: Optional[List[Optional[float]]] = None
+    service_level: Optional[List[ServiceLevel]] = None
+    demand_std: Optional[List[Optional[float]]] = None
+    underage_cost: Optional[List[Optional[float]]] = None
+    overage_cost: Optional[List[Optional[float]]] = None
+
+    non_columns: ClassVar[FrozenSet[str]] = frozenset({"method"})
+
+    @model_validator(mode="after")
+    def check_lengths(self) -> "InventoryPolicyBatchRequest":
+        lengths = {
+            len(values)
+            for name, values in self
+            if name not in self.non_columns and values is not None
+        }
+        if len(lengths) != 1 or 0 in lengths:
+            msg = "Batch columns must be non-empty and share the same length."
+            raise ValueError(msg)
+        return self
+
+
+class InventoryPolicyBatchResponse(BaseModel):
+    sku: Optional[List[str]] = None
+    policy: Dict[str, List[float]]
+    notes: str = ""
+
+
+class InventoryFrontierRequest(InventoryPolicyBatchRequest):
+    non_columns: ClassVar[FrozenSet[str]] = frozenset({"method", "service_levels"})
+
+    shortage_cost: Optional[List[Optional[float]]] = Field(
+        default=None, description="(Q,R) penalty per unit short."
+    )
+    service_levels: List[Annotated[float, Field(gt=0, lt=1)]] = Field(
+        default_factory=lambda: [round(0.5 + 0.01 * step, 2) for step in range(50)],
+        min_length=1,
+        max_length=1000,
+    )
+
+
+class InventoryFrontierResponse(BaseModel):
+    sku: Optional[List[str]] = None
+    service_levels: List[float]
+    safety_stock: List[List[float]]
+    holding_cost: List[List[float]]
+    expected_shortage: List[List[float]]
+    shortage_cost: List[List[float]]
+    total_cost: List[List[float]]
+    optimal_service_level: List[float]
+    optimal_total_cost: List[float]
+
+
+class InventorySimulationInputs(BaseModel):
+    """(R, Q) policy and demand shared by the single-run and Monte Carlo simulations."""
+
     demand_profile: List[float] = Field(..., min_length=1)
     initial_inventory: float = Field(..., ge=0)
     reorder_point: float
@@ -84,15 +273,115 @@ class InventorySimulationRequest(BaseModel):
     seed: Optional[int] = None
 
 
+class InventorySimulationRequest(InventorySimulationInputs):
+    trace: bool = Field(default=False, description="Include the per-period state as columns.")
+
+
 class StockoutEventModel(BaseModel):
     time: float
     shortfall: float
 
 
+class SimulationTraceModel(BaseModel):
+    """Per-period simulation state as parallel columns."""
+
+    period: List[int]
+    demand: List[float]
+    on_hand: List[float]
+    on_order: List[float]
+    served: List[float]
+    lost: List[float]
+
+
 class InventorySimulationResponse(BaseModel):
     demand_served: float
     demand_lost: float
     stockouts: List[StockoutEventModel]
+    trace: Optional[SimulationTraceModel] = None
+
+
+class InventorySimulationScenario(InventorySimulationRequest):
+    scenario_id: str = Field(..., min_length=1)
+
+
+class InventorySimulationBatchRequest(BaseModel):
+    scenarios: List[InventorySimulationScenario] = Field(..., min_length=1)
+
+
+class InventorySimulationBatchItem(BaseModel):
+    scenario_id: str
+    result: Optional[InventorySimulationResponse] = None
+    error: Optional[str] = None
+
+
+class InventoryMonteCarloRequest(InventorySimulationInputs):
+    replications: int = Field(default=1000, ge=1, le=100_000)
+    demand_cv: float = Field(default=0.0, ge=0, description="Demand std as a fraction of the profile.")
+    lead_time_std: float = Field(default=0.0, ge=0, description="Lead time std in periods.")
+
+
+class DistributionSummary(BaseModel):
+    mean: float
+    std: float
+    p05: float
+    p50: float
+    p95: float
+
+
+class InventoryMonteCarloResponse(BaseModel):
+    replications: int
+    demand_served: DistributionSummary
+    demand_lost: DistributionSummary
+    fill_rate: DistributionSummary
+    cycle_service_level: DistributionSummary
+
+
+class InventoryOptimizeRequest(BaseModel):
+    demand_profile: List[float] = Field(..., min_length=1)
+    initial_inventory: float = Field(..., ge=0)
+    lead_time: int = Field(..., ge=0)
+    reorder_points: List[float] = Field(..., min_length=1, max_length=200)
+    order_quantities: List[Annotated[float, Field(gt=0)]] = Field(..., min_length=1, max_length=200)
+    holding_cost: float = Field(..., ge=0, description="Per unit on hand at the end of a period.")
+    shortage_cost: float = Field(..., ge=0, description="Per unit of lost demand.")
+    ordering_cost: float = Field(default=0.0, ge=0)
+    demand_cv: float = Field(default=0.0, ge=0)
+    lead_time_std: float = Field(default=0.0, ge=0)
+    initial_replications: int = Field(default=50, ge=2)
+    max_replications: int = Field(default=2000, ge=2, le=100_000)
+    confidence: float = Field(default=0.95, gt=0.5, lt=1)
+    seed: Optional[int] = None
+
+    # Candidates x replications bound on the cost samples kept while racing.
+    max_cost_samples: ClassVar[int] = 20_000_000
+
+    @model_validator(mode="after")
+    def check_budget(self) -> "InventoryOptimizeRequest":
+        candidates = len(self.reorder_points) * len(self.order_quantities)
+        if candidates * self.max_replications > self.max_cost_samples:
+            msg = (
+                f"{candidates} candidates x {self.max_replications} replications exceeds "
+                f"{self.max_cost_samples} cost samples; shrink the grid or the replication budget."
+            )
+            raise ValueError(msg)
+        return self
+
+
+class PolicyCandidateResult(BaseModel):
+    reorder_point: float
+    order_quantity: float
+    mean_cost: float
+    replications: int
+
+
+class InventoryOptimizeResponse(BaseModel):
+    reorder_point: float
+    order_quantity: float
+    expected_cost: float
+    std_error: float
+    rounds: int
+    paths_simulated: int
+    candidates: List[PolicyCandidateResult]
 
 
 class BullwhipDiagnosticsRequest(BaseModel):
@@ -115,6 +404,65 @@ class BullwhipDiagnosticsResponse(BaseModel):
     order_variance: float
 
 
+class BullwhipBatchRequest(BaseModel):
+    """Long-format columns, one entry per (SKU-location, period) observation."""
+
+    product_id: List[str] = Field(..., min_length=1)
+    location_id: List[str] = Field(..., min_length=1)
+    demand: List[float] = Field(..., min_length=1)
+    orders: List[float] = Field(..., min_length=1)
+    top: Optional[int] = Field(default=None, ge=1, description="Return only the worst amplifiers.")
+
+    @model_validator(mode="after")
+    def check_lengths(self) -> "BullwhipBatchRequest":
+        if len({len(self.product_id), len(self.location_id), len(self.demand), len(self.orders)}) != 1:
+            msg = "Batch columns must share the same length."
+            raise ValueError(msg)
+        return self
+
+
+class BullwhipBatchResponse(BaseModel):
+    """Diagnostics per series as column arrays, ranked worst amplifier first."""
+
+    keys: Dict[str, List[str]]
+    observations: List[int]
+    demand_variance: List[Optional[float]]
+    order_variance: List[Optional[float]]
+    amplification_index: List[Optional[float]]
+    rank: List[int]
+
+
+class BullwhipObservationRequest(BaseModel):
+    demand: List[float] = Field(..., min_length=1)
+    orders: List[float] = Field(..., min_length=1)
+    alpha: Optional[float] = Field(
+        default=None, gt=0, le=1, description="Enables the exponentially weighted index for a new stream."
+    )
+    window: Optional[int] = Field(
+        default=None, ge=2, description="Enables the rolling-window index for a new stream."
+    )
+
+    @field_validator("orders")
+    @classmethod
+    def validate_lengths(cls, value: List[float], info: ValidationInfo) -> List[float]:
+        demand = info.data.get("demand", [])
+        if demand and len(value) != len(demand):
+            msg = "Orders and demand must have the same length."
+            raise ValueError(msg)
+        return value
+
+
+class BullwhipMonitorSnapshot(BaseModel):
+    sku: str
+    echelon: str
+    observations: int
+    amplification_index: Optional[float] = None
+    demand_variance: Optional[float] = None
+    order_variance: Optional[float] = None
+    ew_amplification_index: Optional[float] = None
+    rolling_amplification_index: Optional[float] = None
+
+
 class KPIResponse(BaseModel):
     customer_service_level: float
     fill_rate: float
@@ -281,3 +629,179 @@ class SupplyPlanUpdateRequest(BaseModel):
     nodes: Optional[List[SupplyNodePlanModel]] = None
     risks: Optional[List[RiskEntryModel]] = None
     kpi_targets: Optional[List[KpiTargetModel]] = None
+
+
+class SafetyStockPlacementRequest(BaseModel):
+    max_service_time_days: int = Field(default=0, ge=0)
+    days_per_period: float = Field(default=30.0, gt=0)
+    holding_rate: float = Field(default=0.25, gt=0)
+    persist: bool = True
+
+
+class SafetyStockNodeResult(BaseModel):
+    node_id: str
+    inbound_service_days: int
+    outbound_service_days: int
+    net_replenishment_days: int
+    safety_stock: float
+    reorder_point: float
+    holding_cost: float
+
+
+class SafetyStockPlacementResponse(BaseModel):
+    plan: SupplyPlanModel
+    total_holding_cost: float
+    nodes: List[SafetyStockNodeResult]
+
+
+class NetworkSimulationRequest(BaseModel):
+    periods: int = Field(default=104, ge=2, le=5_000)
+    days_per_period: float = Field(default=7.0, gt=0)
+    profile_days_per_period: float = Field(
+        default=30.0, gt=0, description="Length in days of one demand_profile period."
+    )
+    demand_cv: float = Field(default=0.0, ge=0)
+    seed: Optional[int] = None
+
+
+class NetworkNodeSimulationResult(BaseModel):
+    node_id: str
+    fill_rate: float
+    stockout_periods: int
+    external_demand: float
+    external_lost: float
+    average_on_hand: float
+    bullwhip: Optional[float] = None
+
+
+class NetworkSimulationResponse(BaseModel):
+    plan_id: str
+    periods: int
+    nodes: List[NetworkNodeSimulationResult]
+
+
+class AggregatePlanRequest(BaseModel):
+    days_per_period: float = Field(default=30.0, gt=0, description="Length in days of one demand_profile period.")
+    holding_cost: float = Field(default=1.0, ge=0, description="Cost per unit carried into the next period.")
+    shortage_cost: float = Field(default=1_000.0, ge=0, description="Penalty per unit of demand left unmet.")
+    order_cost: float = Field(default=0.0, ge=0, description="Fixed cost per order placed on a source.")
+    time_limit_seconds: Optional[float] = Field(default=None, gt=0)
+    gap: Optional[float] = Field(default=None, ge=0, lt=1, description="Relative MIP gap at which CBC stops.")
+    threads: Optional[int] = Field(default=None, ge=1)
+    persist: bool = True
+
+
+class AggregatePlanLinkResult(BaseModel):
+    node_id: str
+    supplier_id: str
+    orders: List[float]
+
+
+class AggregatePlanResponse(BaseModel):
+    plan: SupplyPlanModel
+    periods: List[str]
+    objective: float
+    status: str
+    links: List[AggregatePlanLinkResult]
+    unmet_demand: Dict[str, float]
+    build_seconds: float
+    solve_seconds: float
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class JobModel(BaseModel):
+    id: str
+    kind: str
+    status: JobStatus
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+
+class JobSubmitRequest(BaseModel):
+    kind: str = Field(..., min_length=1, description="Registered job kind, e.g. 'inventory.monte-carlo'.")
+    payload: Dict[str, Any] = Field(default_factory=dict, description="Request body of the job kind.")
+
+
+class ProductInput(BaseModel):
+    name: str = Field(..., min_length=1)
+    contribution_margin: float
+    capacity_usage: Dict[str, float] = Field(default_factory=dict)
+
+
+class CapacityInput(BaseModel):
+    name: str = Field(..., min_length=1)
+    limit: float
+
+
+class MakeToOrderRequest(BaseModel):
+    products: List[ProductInput] = Field(..., min_length=1)
+    capacities: List[CapacityInput] = Field(..., min_length=1)
+
+
+class MakeToOrderScenario(BaseModel):
+    name: Optional[str] = None
+    capacity_limits: Dict[str, float] = Field(default_factory=dict)
+    contribution_margins: Dict[str, float] = Field(default_factory=dict)
+
+
+class MakeToOrderScenarioRequest(MakeToOrderRequest):
+    scenarios: List[MakeToOrderScenario] = Field(..., min_length=1, max_length=10_000)
+
+
+class MakeToOrderScenarioResponse(BaseModel):
+    """Scenario results as columns, one entry per submitted scenario.
+
+    Entries are null for scenarios whose LP has no optimal solution.
+    """
+
+    scenarios: List[Optional[str]]
+    objective: List[Optional[float]]
+    production_plan: Dict[str, List[Optional[float]]]
+    shadow_prices: Dict[str, List[Optional[float]]]
+    unique_scenarios: int
+    solve_seconds: float
+
+
+class OptimizationResultModel(BaseModel):
+    objective: float
+    production_plan: Dict[str, float]
+    shadow_prices: Dict[str, float]
+    build_seconds: float = 0.0
+    solve_seconds: float = 0.0
+
+
+class OptimizationSessionResponse(BaseModel):
+    session_id: str
+    result: OptimizationResultModel
+
+
+class OptimizationSessionUpdateRequest(BaseModel):
+    capacity_limits: Dict[str, float] = Field(default_factory=dict)
+    contribution_margins: Dict[str, float] = Field(default_factory=dict)
+
+
+class CapacitySweepRequest(BaseModel):
+    capacity: str = Field(..., min_length=1)
+    limits: List[float] = Field(..., min_length=2, max_length=1000)
+
+
+class CapacitySweepResponse(BaseModel):
+    """Sweep results as columns, one entry per limit in ascending order."""
+
+    capacity: str
+    limits: List[float]
+    objective: List[float]
+    production_plan: Dict[str, List[float]]
+    shadow_prices: Dict[str, List[float]]
+    breakpoints: List[float]
+    iterations: List[int]
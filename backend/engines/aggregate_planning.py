@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+from scipy import sparse  # type: ignore[import-untyped]
+
+from backend.data.models import ReplenishmentEventModel, SupplyNodePlanModel, SupplyPlanModel
+from backend.engines.optimization import solve_sparse_milp
+
+# Share of the time limit the LP relaxation may use; the MILP gets whatever
+# the model build, relaxation and rounding leave, but never less than
+# ``_MIN_MILP_SECONDS`` so CBC can still load and check the warm start.
+_RELAXATION_SHARE = 0.5
+_MIN_MILP_SECONDS = 1.0
+
+
+@dataclass
+class AggregatePlan:
+    """Optimal multi-period orders for every (node, source) link of a supply plan.
+
+    ``orders`` is (links x periods) and indexed like ``links``; ``inventory``
+    and ``shortage`` are (nodes x periods) and indexed like ``node_ids``.
+    """
+
+    periods: List[str]
+    node_ids: List[str]
+    links: List[Tuple[str, str]]
+    orders: np.ndarray
+    receipts: np.ndarray
+    inventory: np.ndarray
+    shortage: np.ndarray
+    objective: float
+    status: str
+    build_seconds: float
+    solve_seconds: float
+
+
+class _Columns:
+    """Column offsets of each variable block in the flattened model."""
+
+    def __init__(self, n_links: int, n_nodes: int, n_switches: int, periods: int) -> None:
+        self.periods = periods
+        self.orders = 0
+        self.inventory = n_links * periods
+        self.shortage = self.inventory + n_nodes * periods
+        self.switches = self.shortage + n_nodes * periods
+        self.size = self.switches + n_switches * periods
+
+    def block(self, offset: int, rows: np.ndarray, period: np.ndarray) -> np.ndarray:
+        return offset + rows * self.periods + period
+
+
+def _rounded_plan(
+    relaxed: np.ndarray,
+    link_node: np.ndarray,
+    link_supplier: np.ndarray,
+    lead: np.ndarray,
+    lot: np.ndarray,
+    min_qty: np.ndarray,
+    max_qty: np.ndarray,
+    demand: np.ndarray,
+    initial: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """Round relaxed orders into a feasible (orders, inventory, shortage) plan.
+
+    Orders are rounded to whole lots and dropped below the minimum order
+    quantity. Nodes are visited suppliers first; each period a node serves
+    its own demand, then ships its children's orders capped by the stock it
+    has left, so no inventory goes negative. Returns None when internal
+    sources form a cycle.
+    """
+
+    n_nodes, n_periods = demand.shape
+    lots = np.where(lot > 0, lot, 1.0)
+    capped = np.where(lot > 0, np.floor(max_qty / lots) * lots, max_qty)
+    whole = np.round(relaxed / lots[:, np.newaxis]) * lots[:, np.newaxis]
+    wanted = np.minimum(np.where(lot[:, np.newaxis] > 0, whole, relaxed), capped[:, np.newaxis])
+    wanted[wanted < min_qty[:, np.newaxis]] = 0.0
+
+    internal = np.flatnonzero(link_supplier >= 0)
+    pending = np.bincount(link_node[internal], minlength=n_nodes)
+    ready = [node for node in range(n_nodes) if pending[node] == 0]
+    orders = np.where(link_supplier[:, np.newaxis] < 0, wanted, 0.0)
+    receipts = np.zeros((n_nodes, n_periods))
+    for link in np.flatnonzero(link_supplier < 0):
+        arrive = n_periods - lead[link]
+        if arrive > 0:
+            receipts[link_node[link], lead[link] :] += orders[link, :arrive]
+    inventory = np.zeros((n_nodes, n_periods))
+    shortage = np.zeros((n_nodes, n_periods))
+
+    visited = 0
+    while ready:
+        node = ready.pop()
+        visited += 1
+        children = internal[link_supplier[internal] == node]
+        available = initial[node]
+        for period in range(n_periods):
+            available += receipts[node, period]
+            served = min(demand[node, period], available)
+            shortage[node, period] = demand[node, period] - served
+            available -= served
+            for link in children:
+                quantity = min(wanted[link, period], available)
+                if lot[link] > 0:
+                    quantity = np.floor(quantity / lot[link]) * lot[link]
+                if quantity < min_qty[link]:
+                    quantity = 0.0
+                orders[link, period] = quantity
+                available -= quantity
+                if period + lead[link] < n_periods:
+                    receipts[link_node[link], period + lead[link]] += quantity
+            inventory[node, period] = available
+        for link in children:
+            pending[link_node[link]] -= 1
+            if pending[link_node[link]] == 0:
+                ready.append(int(link_node[link]))
+    if visited < n_nodes:
+        return None
+    return orders, inventory, shortage
+
+
+def plan_aggregate_supply(
+    plan: SupplyPlanModel,
+    days_per_period: float = 30.0,
+    holding_cost: float = 1.0,
+    shortage_cost: float = 1_000.0,
+    order_cost: float = 0.0,
+    time_limit_seconds: float | None = None,
+    gap: float | None = None,
+    threads: int | None = None,
+) -> AggregatePlan:
+    """Plan orders per period across a supply plan with a MILP.
+
+    Periods are the sorted union of the nodes' demand profile labels. Every
+    node keeps an inventory balance: stock carried in, plus receipts ordered
+    a source lead time earlier, minus its own demand and the orders its
+    downstream nodes place on it, equals stock carried out. Unmet own demand
+    is lost at ``shortage_cost`` per unit. Orders respect each source's
+    ``max_order_qty``, ``min_order_qty`` (whenever an order is placed) and
+    ``lot_size`` multiples. Nodes start with their policy's safety stock.
+
+    The model is assembled as sparse coefficient arrays with index
+    arithmetic per variable block and solved by ``solve_sparse_milp`` under
+    the given CBC time limit, relative gap and thread count. The MILP is
+    warm started from its LP relaxation rounded to a feasible plan, so a
+    time limit still returns a usable plan. ``time_limit_seconds`` bounds
+    the whole call: build, relaxation and MILP share it.
+    """
+
+    started = time.perf_counter()
+
+    if days_per_period <= 0 or min(holding_cost, shortage_cost, order_cost) < 0:
+        msg = "Period length must be positive and costs non-negative."
+        raise ValueError(msg)
+    node_ids = [node.node_id for node in plan.nodes]
+    if not node_ids or len(set(node_ids)) != len(node_ids):
+        msg = "Supply plan needs nodes with unique identifiers."
+        raise ValueError(msg)
+    node_index = {node_id: index for index, node_id in enumerate(node_ids)}
+
+    periods = sorted({period.period for node in plan.nodes for period in node.demand_profile})
+    if not periods:
+        msg = "Supply plan has no demand periods to plan."
+        raise ValueError(msg)
+    period_index = {label: index for index, label in enumerate(periods)}
+    n_nodes, n_periods = len(node_ids), len(periods)
+
+    demand = np.zeros((n_nodes, n_periods))
+    for node in plan.nodes:
+        for period in node.demand_profile:
+            demand[node_index[node.node_id], period_index[period.period]] += period.forecast_units
+    initial = np.array([node.inventory_policy.safety_stock or 0.0 for node in plan.nodes])
+
+    sources = [(node, source) for node in plan.nodes for source in node.supply_sources]
+    if not sources:
+        msg = "Supply plan has no supply sources to order from."
+        raise ValueError(msg)
+    n_links = len(sources)
+    link_node = np.array([node_index[node.node_id] for node, _ in sources])
+    link_supplier = np.array([node_index.get(source.supplier_id, -1) for _, source in sources])
+    lead = np.array(
+        [int(np.ceil((source.lead_time_days or 0) / days_per_period)) for _, source in sources]
+    )
+    unit_cost = np.array([source.unit_cost or 0.0 for _, source in sources])
+    min_qty = np.array([source.min_order_qty or 0.0 for _, source in sources])
+    max_qty = np.array(
+        [np.inf if source.max_order_qty is None else source.max_order_qty for _, source in sources]
+    )
+    lot = np.array([source.lot_size or 0.0 for _, source in sources])
+    if np.any(min_qty > max_qty):
+        msg = "A source's minimum order quantity exceeds its maximum."
+        raise ValueError(msg)
+
+    switch_links = np.flatnonzero((min_qty > 0) | (order_cost > 0))
+    columns = _Columns(n_links, n_nodes, switch_links.size, n_periods)
+    big_m = np.where(np.isinf(max_qty), demand.sum() + np.maximum(lot, min_qty), max_qty)
+
+    period_grid = np.arange(n_periods)
+    link_grid, time_grid = np.meshgrid(np.arange(n_links), period_grid, indexing="ij")
+    node_grid, node_time = np.meshgrid(np.arange(n_nodes), period_grid, indexing="ij")
+    order_cols = columns.block(columns.orders, link_grid, time_grid)
+    parts_row: List[np.ndarray] = []
+    parts_col: List[np.ndarray] = []
+    parts_val: List[np.ndarray] = []
+
+    def add(rows: np.ndarray, cols: np.ndarray, value: float | np.ndarray) -> None:
+        rows, cols = np.ravel(rows), np.ravel(cols)
+        parts_row.append(rows)
+        parts_col.append(cols)
+        parts_val.append(np.broadcast_to(np.ravel(value) if np.ndim(value) else value, rows.shape))
+
+    # Inventory balance, one row per (node, period).
+    balance_rows = node_grid * n_periods + node_time
+    add(balance_rows, columns.block(columns.inventory, node_grid, node_time), 1.0)
+    add(balance_rows[:, 1:], columns.block(columns.inventory, node_grid[:, :-1], node_time[:, :-1]), -1.0)
+    add(balance_rows, columns.block(columns.shortage, node_grid, node_time), -1.0)
+    arrives = time_grid + lead[:, np.newaxis] < n_periods
+    add(
+        link_node[link_grid[arrives]] * n_periods + (time_grid + lead[:, np.newaxis])[arrives],
+        order_cols[arrives],
+        -1.0,
+    )
+    internal = link_supplier[link_grid] >= 0
+    add(link_supplier[link_grid[internal]] * n_periods + time_grid[internal], order_cols[internal], 1.0)
+    balance_rhs = -demand
+    balance_rhs[:, 0] += initial
+    n_rows = n_nodes * n_periods
+    rhs = [balance_rhs.ravel()]
+    senses = ["="] * n_rows
+
+    # Order switches: min_qty * placed <= order <= max_qty * placed.
+    if switch_links.size:
+        switch_cols = columns.block(columns.switches, np.arange(switch_links.size)[:, np.newaxis], period_grid)
+        for bound, sense in ((min_qty, ">"), (big_m, "<")):
+            switch_rows = n_rows + np.arange(switch_links.size * n_periods).reshape(switch_links.size, n_periods)
+            add(switch_rows, order_cols[switch_links], 1.0)
+            add(switch_rows, switch_cols, -np.repeat(bound[switch_links], n_periods))
+            n_rows += switch_rows.size
+            rhs.append(np.zeros(switch_rows.size))
+            senses += [sense] * switch_rows.size
+
+    matrix = sparse.csr_matrix(
+        (np.concatenate(parts_val), (np.concatenate(parts_row), np.concatenate(parts_col))),
+        shape=(n_rows, columns.size),
+    )
+
+    cost = np.zeros(columns.size)
+    cost[order_cols.ravel()] = np.repeat(unit_cost, n_periods)
+    cost[columns.inventory : columns.shortage] = holding_cost
+    cost[columns.shortage : columns.switches] = shortage_cost
+    cost[columns.switches :] = order_cost
+
+    lower = np.zeros(columns.size)
+    upper = np.full(columns.size, np.inf)
+    upper[order_cols.ravel()] = np.repeat(max_qty, n_periods)
+    upper[columns.shortage : columns.switches] = demand.ravel()
+    upper[columns.switches :] = 1.0
+    integer = np.zeros(columns.size, dtype=bool)
+    integer[columns.switches :] = True
+
+    # Lot-sized orders are solved for as an integer number of lots: scaling
+    # their columns by the lot size avoids a linking row per order.
+    scale = np.ones(columns.size)
+    lot_cols = order_cols[lot > 0].ravel()
+    scale[lot_cols] = np.repeat(lot[lot > 0], n_periods)
+    integer[lot_cols] = True
+    matrix = matrix @ sparse.diags(scale)
+    cost *= scale
+    upper /= scale
+    upper[lot_cols] = np.floor(upper[lot_cols])
+
+    # CBC struggles to find any integer plan over long horizons, so it is
+    # started from the LP relaxation rounded onto lots and available stock.
+    bounds = np.concatenate(rhs)
+    relaxed = solve_sparse_milp(
+        cost,
+        matrix,
+        senses,
+        bounds,
+        lower,
+        upper,
+        np.zeros_like(integer),
+        time_limit_seconds=None if time_limit_seconds is None else time_limit_seconds * _RELAXATION_SHARE,
+    )
+    rounded = _rounded_plan(
+        (relaxed.values * scale)[order_cols],
+        link_node,
+        link_supplier,
+        lead,
+        lot,
+        min_qty,
+        max_qty,
+        demand,
+        initial,
+    )
+    start = None
+    if rounded is not None:
+        start = np.zeros(columns.size)
+        start[order_cols] = rounded[0]
+        start[columns.inventory : columns.shortage] = rounded[1].ravel()
+        start[columns.shortage : columns.switches] = rounded[2].ravel()
+        start[columns.switches :] = (rounded[0][switch_links] > 0).ravel()
+        start /= scale
+
+    remaining = None
+    if time_limit_seconds is not None:
+        remaining = max(time_limit_seconds - (time.perf_counter() - started), _MIN_MILP_SECONDS)
+    solution = solve_sparse_milp(
+        cost,
+        matrix,
+        senses,
+        bounds,
+        lower,
+        upper,
+        integer,
+        time_limit_seconds=remaining,
+        gap=gap,
+        threads=threads,
+        start=start,
+    )
+    values = solution.values * scale
+    orders = values[order_cols]
+    receipts = np.zeros((n_nodes, n_periods))
+    np.add.at(
+        receipts,
+        (link_node[link_grid[arrives]], (time_grid + lead[:, np.newaxis])[arrives]),
+        orders[arrives],
+    )
+    return AggregatePlan(
+        periods=periods,
+        node_ids=node_ids,
+        links=[(node.node_id, source.supplier_id) for node, source in sources],
+        orders=orders,
+        receipts=receipts,
+        inventory=values[columns.inventory : columns.shortage].reshape(n_nodes, n_periods),
+        shortage=values[columns.shortage : columns.switches].reshape(n_nodes, n_periods),
+        objective=solution.objective,
+        status=solution.status,
+        build_seconds=relaxed.build_seconds + solution.build_seconds,
+        solve_seconds=relaxed.solve_seconds + solution.solve_seconds,
+    )
+
+
+def apply_aggregate_plan(plan: SupplyPlanModel, result: AggregatePlan) -> List[SupplyNodePlanModel]:
+    """Return the plan's nodes with their replenishment schedules replaced by the optimized orders."""
+
+    link_nodes = np.array([result.node_ids.index(node_id) for node_id, _ in result.links])
+    placed = np.zeros((len(result.node_ids), len(result.periods)))
+    np.add.at(placed, link_nodes, result.orders)
+
+    nodes = []
+    for index, node in enumerate(plan.nodes):
+        schedule = [
+            ReplenishmentEventModel(
+                period=period,
+                planned_order_units=round(float(placed[index, column]), 2),
+                expected_receipt_units=round(float(result.receipts[index, column]), 2),
+                projected_on_hand=round(float(result.inventory[index, column]), 2),
+            )
+            for column, period in enumerate(result.periods)
+        ]
+        nodes.append(node.model_copy(update={"schedule": schedule}))
+    return nodes
+
+
+__all__ = ["AggregatePlan", "apply_aggregate_plan", "plan_aggregate_supply"]
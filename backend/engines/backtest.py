@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.typing import ArrayLike
+
+from backend.data.models import ForecastMethod, ForecastMetrics
+from backend.engines.forecasting import calculate_metrics, fit_forecast
+from backend.engines.intermittent import croston_path
+
+_MODEL_METHODS = frozenset({ForecastMethod.ETS, ForecastMethod.ARIMA})
+
+
+@dataclass
+class BacktestResult:
+    """Holdout metrics for every (series, origin) pair of a rolling-origin backtest.
+
+    ``origins`` holds the training length at each origin; metric arrays have
+    shape ``(n_series, n_origins)``.
+    """
+
+    method: ForecastMethod
+    origins: np.ndarray
+    mape: np.ndarray
+    mase: np.ndarray
+    bias: np.ndarray
+
+    def per_origin(self) -> List[ForecastMetrics]:
+        mape, mase, bias = (np.nanmean(values, axis=0) for values in (self.mape, self.mase, self.bias))
+        return [
+            ForecastMetrics(mape=float(a), mase=float(b), bias=float(c))
+            for a, b, c in zip(mape, mase, bias)
+        ]
+
+    def aggregate(self) -> ForecastMetrics:
+        return ForecastMetrics(
+            mape=float(np.nanmean(self.mape)),
+            mase=float(np.nanmean(self.mase)),
+            bias=float(np.nanmean(self.bias)),
+        )
+
+
+def rolling_origins(
+    data: np.ndarray,
+    horizon: int,
+    min_train_size: int,
+    step: int = 1,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Origins and their holdout windows as a strided view of ``data``.
+
+    The returned windows have shape ``(n_series, n_origins, horizon)`` and share
+    memory with ``data``; no window is copied.
+    """
+
+    n_periods = data.shape[1]
+    last_origin = n_periods - horizon
+    if min_train_size < 1 or min_train_size > last_origin:
+        msg = "Series are too short for the requested horizon and minimum training size."
+        raise ValueError(msg)
+    origins = np.arange(min_train_size, last_origin + 1, step)
+    windows = sliding_window_view(data, horizon, axis=1)[:, min_train_size : last_origin + 1 : step]
+    return origins, windows
+
+
+def _vectorized_metrics(
+    data: np.ndarray,
+    origins: np.ndarray,
+    actual: np.ndarray,
+    forecast: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    errors = forecast - actual
+
+    nonzero = actual != 0
+    ratios = np.abs(np.divide(errors, actual, out=np.zeros(errors.shape), where=nonzero))
+    counts = nonzero.sum(axis=2)
+    mape = np.where(counts > 0, ratios.sum(axis=2) / np.maximum(counts, 1) * 100, 0.0)
+
+    # Mean absolute one-step naive error over each origin's training window.
+    abs_diffs = np.abs(np.diff(data, axis=1))
+    cumulative = np.concatenate([np.zeros((data.shape[0], 1)), np.cumsum(abs_diffs, axis=1)], axis=1)
+    n_diffs = origins - 1
+    denom = np.divide(
+        cumulative[:, n_diffs],
+        n_diffs,
+        out=np.ones((data.shape[0], origins.size)),
+        where=n_diffs > 0,
+    )
+    denom[denom == 0] = 1.0
+    mase = np.abs(errors).mean(axis=2) / denom
+
+    bias = errors.mean(axis=2)
+    return mape, mase, bias
+
+
+def _model_backtest(
+    method: ForecastMethod,
+    data: np.ndarray,
+    origins: np.ndarray,
+    horizon: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    shape = (data.shape[0], origins.size)
+    mape, mase, bias = np.full(shape, np.nan), np.full(shape, np.nan), np.full(shape, np.nan)
+    for row, series in enumerate(data):
+        for col, origin in enumerate(origins):
+            train = series[:origin]
+            try:
+                # Every origin is fitted once, so keep these out of the shared fit cache.
+                forecast, _ = fit_forecast(method, train, horizon, cache=False)
+            except ValueError:
+                continue
+            metrics = calculate_metrics(train, series[origin : origin + horizon], forecast)
+            mape[row, col], mase[row, col], bias[row, col] = metrics.mape, metrics.mase, metrics.bias
+    return mape, mase, bias
+
+
+def run_backtest(
+    method: ForecastMethod,
+    series: ArrayLike,
+    horizon: int,
+    min_train_size: int | None = None,
+    step: int = 1,
+) -> BacktestResult:
+    """Rolling-origin backtest of ``method`` over one series or a series matrix.
+
+    Naive and Croston forecasts for every origin come out of a single
+    vectorized pass; ETS and ARIMA fall back to one fit per origin.
+    """
+
+    data = np.asarray(series, dtype=float)
+    if data.ndim == 1:
+        data = data[np.newaxis, :]
+    if horizon < 1 or step < 1:
+        msg = "Horizon and step must be positive."
+        raise ValueError(msg)
+    origins, actual = rolling_origins(data, horizon, min_train_size or max(2, horizon), step)
+
+    if method is ForecastMethod.NAIVE:
+        forecast = data[:, origins - 1, np.newaxis]
+    elif method is ForecastMethod.CROSTON:
+        forecast = croston_path(data)[:, origins - 1, np.newaxis]
+    elif method in _MODEL_METHODS:
+        mape, mase, bias = _model_backtest(method, data, origins, horizon)
+        return BacktestResult(method=method, origins=origins, mape=mape, mase=mase, bias=bias)
+    else:
+        msg = f"Unsupported forecast method: {method}"
+        raise ValueError(msg)
+
+    mape, mase, bias = _vectorized_metrics(data, origins, actual, forecast)
+    return BacktestResult(method=method, origins=origins, mape=mape, mase=mase, bias=bias)
+
+
+__all__ = ["BacktestResult", "rolling_origins", "run_backtest"]
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
 import numpy as np
+import pandas as pd
 
-from backend.data.models import BullwhipDiagnosticsResponse
+from backend.data.models import BullwhipDiagnosticsResponse, BullwhipMonitorSnapshot, SupplyPlanModel
+from backend.engines.supply_network import primary_source
 
 
 def compute_bullwhip_index(demand, orders) -> BullwhipDiagnosticsResponse:
@@ -22,4 +28,264 @@ def compute_bullwhip_index(demand, orders) -> BullwhipDiagnosticsResponse:
     )
 
 
-__all__ = ["compute_bullwhip_index"]
\ No newline at end of file
+def bullwhip_table(
+    frame: pd.DataFrame,
+    keys: Sequence[str],
+    demand: str = "demand",
+    orders: str = "orders",
+) -> pd.DataFrame:
+    """Amplification index for every group of a long (one row per period) table.
+
+    Variances of all groups come out of one grouped pass. Rows are ranked by
+    amplification, worst first; groups with fewer than two observations or no
+    demand variance have a NaN index and rank last.
+    """
+
+    missing = [column for column in (*keys, demand, orders) if column not in frame.columns]
+    if missing:
+        msg = f"Missing columns for bullwhip diagnostics: {', '.join(missing)}"
+        raise ValueError(msg)
+
+    grouped = frame.groupby(list(keys), sort=False, observed=True)
+    variances = grouped[[demand, orders]].var(ddof=1)
+    demand_var = variances[demand].to_numpy(dtype=float)
+    order_var = variances[orders].to_numpy(dtype=float)
+    amplification = np.divide(
+        order_var, demand_var, out=np.full(demand_var.shape, np.nan), where=demand_var > 0
+    )
+
+    table = pd.DataFrame(
+        {
+            "observations": grouped.size().to_numpy(),
+            "demand_variance": demand_var,
+            "order_variance": order_var,
+            "amplification_index": amplification,
+        },
+        index=variances.index,
+    ).reset_index()
+    table = table.sort_values("amplification_index", ascending=False, na_position="last", kind="stable")
+    table["rank"] = np.arange(1, len(table) + 1)
+    return table.reset_index(drop=True)
+
+
+def echelon_frame(plans: Sequence[SupplyPlanModel]) -> pd.DataFrame:
+    """Long table of (plan, supplier, node) links with each node's demand and planned orders.
+
+    A node's demand profile is what it sees from downstream; its schedule's
+    planned orders are what it passes to its primary supplier. The two are
+    matched on period label.
+    """
+
+    rows: List[Tuple[str, str, str, str, float, float]] = []
+    for plan in plans:
+        node_ids = {node.node_id: node for node in plan.nodes}
+        for node in plan.nodes:
+            source = primary_source(node, node_ids)
+            if source is None:
+                continue
+            orders = {event.period: event.planned_order_units for event in node.schedule}
+            rows.extend(
+                (plan.id, source.supplier_id, node.node_id, period.period, period.forecast_units, orders[period.period])
+                for period in node.demand_profile
+                if period.period in orders
+            )
+    return pd.DataFrame(rows, columns=["plan_id", "supplier_id", "node_id", "period", "demand", "orders"])
+
+
+@dataclass
+class RunningMoments:
+    """Welford mean and sum of squared deviations over every observation."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def push(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float | None:
+        return self.m2 / (self.count - 1) if self.count > 1 else None
+
+
+@dataclass
+class EWMoments:
+    """Exponentially weighted mean and variance with smoothing factor ``alpha``."""
+
+    alpha: float
+    count: int = 0
+    mean: float = 0.0
+    var: float = 0.0
+
+    def push(self, value: float) -> None:
+        self.count += 1
+        if self.count == 1:
+            self.mean = value
+            return
+        delta = value - self.mean
+        increment = self.alpha * delta
+        self.mean += increment
+        self.var = (1.0 - self.alpha) * (self.var + delta * increment)
+
+    @property
+    def variance(self) -> float | None:
+        return self.var if self.count > 1 else None
+
+
+@dataclass
+class RollingMoments:
+    """Mean and variance of the last ``window`` observations, kept in a ring buffer."""
+
+    window: int
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    _buffer: List[float] = field(default_factory=list, repr=False)
+
+    def push(self, value: float) -> None:
+        if len(self._buffer) < self.window:
+            self._buffer.append(value)
+            delta = value - self.mean
+            self.mean += delta / len(self._buffer)
+            self.m2 += delta * (value - self.mean)
+        else:
+            slot = self.count % self.window
+            dropped = self._buffer[slot]
+            self._buffer[slot] = value
+            previous = self.mean
+            self.mean += (value - dropped) / self.window
+            self.m2 = max(self.m2 + (value - dropped) * (value - self.mean + dropped - previous), 0.0)
+        self.count += 1
+
+    @property
+    def variance(self) -> float | None:
+        size = len(self._buffer)
+        return self.m2 / (size - 1) if size > 1 else None
+
+
+def _ratio(orders: float | None, demand: float | None) -> float | None:
+    if orders is None or not demand:
+        return None
+    return orders / demand
+
+
+@dataclass
+class BullwhipTracker:
+    """Running demand and order moments for one (SKU, echelon) stream."""
+
+    demand: RunningMoments = field(default_factory=RunningMoments)
+    orders: RunningMoments = field(default_factory=RunningMoments)
+    ew_demand: EWMoments | None = None
+    ew_orders: EWMoments | None = None
+    rolling_demand: RollingMoments | None = None
+    rolling_orders: RollingMoments | None = None
+
+    @classmethod
+    def create(cls, alpha: float | None = None, window: int | None = None) -> "BullwhipTracker":
+        if alpha is not None and not 0 < alpha <= 1:
+            msg = "Alpha must lie in (0, 1]."
+            raise ValueError(msg)
+        if window is not None and window < 2:
+            msg = "Rolling window must hold at least two observations."
+            raise ValueError(msg)
+        return cls(
+            ew_demand=EWMoments(alpha) if alpha is not None else None,
+            ew_orders=EWMoments(alpha) if alpha is not None else None,
+            rolling_demand=RollingMoments(window) if window is not None else None,
+            rolling_orders=RollingMoments(window) if window is not None else None,
+        )
+
+    def push(self, demand: float, orders: float) -> None:
+        for moments, value in (
+            (self.demand, demand),
+            (self.orders, orders),
+            (self.ew_demand, demand),
+            (self.ew_orders, orders),
+            (self.rolling_demand, demand),
+            (self.rolling_orders, orders),
+        ):
+            if moments is not None:
+                moments.push(float(value))
+
+    def snapshot(self, sku: str, echelon: str) -> BullwhipMonitorSnapshot:
+        return BullwhipMonitorSnapshot(
+            sku=sku,
+            echelon=echelon,
+            observations=self.demand.count,
+            amplification_index=_ratio(self.orders.variance, self.demand.variance),
+            demand_variance=self.demand.variance,
+            order_variance=self.orders.variance,
+            ew_amplification_index=(
+                _ratio(self.ew_orders.variance, self.ew_demand.variance)
+                if self.ew_orders is not None and self.ew_demand is not None
+                else None
+            ),
+            rolling_amplification_index=(
+                _ratio(self.rolling_orders.variance, self.rolling_demand.variance)
+                if self.rolling_orders is not None and self.rolling_demand is not None
+                else None
+            ),
+        )
+
+
+class BullwhipMonitor:
+    """Thread-safe registry of bullwhip trackers keyed by (SKU, echelon)."""
+
+    def __init__(self) -> None:
+        self._trackers: Dict[Tuple[str, str], BullwhipTracker] = {}
+        self._lock = threading.Lock()
+
+    def observe(
+        self,
+        sku: str,
+        echelon: str,
+        demand: List[float],
+        orders: List[float],
+        alpha: float | None = None,
+        window: int | None = None,
+    ) -> BullwhipMonitorSnapshot:
+        """Push paired observations; ``alpha`` and ``window`` apply when the stream is new."""
+
+        if len(demand) != len(orders):
+            msg = "Orders and demand must have the same length."
+            raise ValueError(msg)
+        with self._lock:
+            tracker = self._trackers.get((sku, echelon))
+            if tracker is None:
+                tracker = BullwhipTracker.create(alpha=alpha, window=window)
+                self._trackers[(sku, echelon)] = tracker
+            for demand_value, order_value in zip(demand, orders):
+                tracker.push(demand_value, order_value)
+            return tracker.snapshot(sku, echelon)
+
+    def snapshot(self, sku: str, echelon: str) -> BullwhipMonitorSnapshot | None:
+        with self._lock:
+            tracker = self._trackers.get((sku, echelon))
+            return None if tracker is None else tracker.snapshot(sku, echelon)
+
+    def snapshots(self) -> List[BullwhipMonitorSnapshot]:
+        with self._lock:
+            return [tracker.snapshot(*key) for key, tracker in self._trackers.items()]
+
+    def reset(self, sku: str, echelon: str) -> bool:
+        with self._lock:
+            return self._trackers.pop((sku, echelon), None) is not None
+
+
+bullwhip_monitor = BullwhipMonitor()
+
+
+__all__ = [
+    "BullwhipMonitor",
+    "BullwhipTracker",
+    "EWMoments",
+    "RollingMoments",
+    "RunningMoments",
+    "bullwhip_monitor",
+    "bullwhip_table",
+    "compute_bullwhip_index",
+    "echelon_frame",
+]
\ No newline at end of file
@@ -1,12 +1,35 @@
 from __future__ import annotations
 
-from typing import Dict, List, Sequence, Tuple
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Sequence, Set, Tuple
 
 import numpy as np
 from statsmodels.tsa.arima.model import ARIMA  # type: ignore[import-untyped]
+from statsmodels.tsa.arima_process import arma2ma  # type: ignore[import-untyped]
 from statsmodels.tsa.holtwinters import ExponentialSmoothing, SimpleExpSmoothing  # type: ignore[import-untyped]
 
-from backend.data.models import ForecastMethod, ForecastMetrics, ForecastResponse
+from backend.data import forecast_state_repository
+from backend.data.models import (
+    ForecastBatchItem,
+    ForecastCacheStats,
+    ForecastMethod,
+    ForecastMetrics,
+    ForecastResponse,
+    ForecastStateModel,
+    ModelSelectionReport,
+)
+from backend.engines.intermittent import croston_path
 
 
 def _train_test(series: Sequence[float], horizon: int) -> Tuple[np.ndarray, np.ndarray]:
@@ -24,20 +47,155 @@ def _naive_forecast(train: np.ndarray, horizon: int) -> Tuple[List[float], Dict[
     return [last_value for _ in range(horizon)], {"alpha": 1.0}
 
 
-def _ets_forecast(train: np.ndarray, horizon: int) -> Tuple[List[float], Dict[str, float]]:
+class _FitCache:
+    """Thread-safe LRU cache of fitted models with a time-to-live."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, fit: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), fit)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> ForecastCacheStats:
+        with self._lock:
+            return ForecastCacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                ttl_seconds=self.ttl_seconds,
+            )
+
+
+_FIT_CACHE = _FitCache(
+    maxsize=int(os.getenv("SUPPLYCHAINOS_FORECAST_CACHE_SIZE", "256")),
+    ttl_seconds=float(os.getenv("SUPPLYCHAINOS_FORECAST_CACHE_TTL", "900")),
+)
+
+
+def _fingerprint(method: ForecastMethod, train: np.ndarray) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(method.value.encode("utf-8"))
+    digest.update(np.ascontiguousarray(train, dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+def _cached_fit(
+    method: ForecastMethod,
+    train: np.ndarray,
+    fitter: Callable[[np.ndarray], Any],
+    cache: bool = True,
+) -> Any:
+    if not cache:
+        return fitter(train)
+    key = _fingerprint(method, train)
+    fit = _FIT_CACHE.get(key)
+    if fit is None:
+        fit = fitter(train)
+        _FIT_CACHE.put(key, fit)
+    return fit
+
+
+def forecast_cache_stats() -> ForecastCacheStats:
+    return _FIT_CACHE.stats()
+
+
+def clear_forecast_cache() -> None:
+    _FIT_CACHE.clear()
+
+
+def _fit_ets(train: np.ndarray) -> Any:
     try:
         model = ExponentialSmoothing(train, trend=None, seasonal=None)
-        fit = model.fit(optimized=True)
+        return model.fit(optimized=True)
     except ValueError:
         model = SimpleExpSmoothing(train)
-        fit = model.fit(optimized=True)
+        return model.fit(optimized=True)
+
+
+def _ets_forecast(
+    train: np.ndarray, horizon: int, cache: bool = True
+) -> Tuple[List[float], Dict[str, float]]:
+    fit = _cached_fit(ForecastMethod.ETS, train, _fit_ets, cache)
     forecast = fit.forecast(horizon)
-    alpha = float(getattr(fit, "smoothing_level", 0.1) or 0.1)
-    return forecast.tolist(), {"alpha": alpha}
+    return forecast.tolist(), {"alpha": _smoothing_level(fit)}
+
+
+def _smoothing_level(fit: Any) -> float:
+    params = getattr(fit, "params", {})
+    return float(params.get("smoothing_level", 0.1) or 0.1)
+
+
+# Trailing one-step residuals kept per stored series for bootstrap intervals, so
+# the state (and each update's cost) does not grow with the history.
+_MAX_STORED_RESIDUALS = 104
+
+
+def _trailing_residuals(residuals: Sequence[float] | np.ndarray) -> List[float]:
+    return [float(value) for value in residuals[-_MAX_STORED_RESIDUALS:]]
+
+
+def _ets_state(train: np.ndarray) -> ForecastStateModel:
+    fit = _cached_fit(ForecastMethod.ETS, train, _fit_ets)
+    alpha = _smoothing_level(fit)
+    return ForecastStateModel(
+        method=ForecastMethod.ETS,
+        params=[alpha],
+        state=[float(fit.level[-1])],
+        residuals=_trailing_residuals(
+            _one_step_residuals(ForecastMethod.ETS, train, {"alpha": alpha})
+        ),
+    )
+
 
+def _extend_ets(stored: ForecastStateModel, new_observations: np.ndarray) -> ForecastStateModel:
+    alpha = stored.params[0]
+    level = stored.state[0]
+    residuals = []
+    for value in new_observations:
+        residuals.append(float(value) - level)
+        level += alpha * residuals[-1]
+    return ForecastStateModel(
+        method=ForecastMethod.ETS,
+        params=[alpha],
+        state=[level],
+        residuals=_trailing_residuals([*stored.residuals, *residuals]),
+    )
 
-def _croston_forecast(train: np.ndarray, horizon: int) -> Tuple[List[float], Dict[str, float]]:
-    alpha = 0.1
+
+def _croston_forecast(
+    train: np.ndarray, horizon: int, alpha: float = 0.1
+) -> Tuple[List[float], Dict[str, float]]:
     d_hat: float | None = None
     p_hat: float | None = None
     interval = 1.0
@@ -58,23 +216,67 @@ def _croston_forecast(train: np.ndarray, horizon: int) -> Tuple[List[float], Dic
     return [float(forecast_value)] * horizon, {"alpha": alpha}
 
 
-def _arima_forecast(train: np.ndarray, horizon: int) -> Tuple[List[float], Dict[str, float]]:
+def _fit_arima(train: np.ndarray) -> Any:
+    return ARIMA(train, order=(1, 1, 1)).fit()
+
+
+def _check_arima_length(train: np.ndarray) -> None:
     if train.size < 4:
         msg = "ARIMA requires at least four observations."
         raise ValueError(msg)
-    model = ARIMA(train, order=(1, 1, 1))
-    fit = model.fit()
-    forecast = fit.forecast(horizon)
 
-    summary = {
+
+def _arima_summary(fit: Any) -> Dict[str, float]:
+    return {
         "sigma2": float(getattr(fit, "sigma2", 0.0)),
         "ar1": float(fit.arparams[0]) if getattr(fit, "arparams", np.array([])).size else 0.0,
         "ma1": float(fit.maparams[0]) if getattr(fit, "maparams", np.array([])).size else 0.0,
     }
-    return forecast.tolist(), summary
 
 
-def _calculate_metrics(
+def _arima_forecast(
+    train: np.ndarray, horizon: int, cache: bool = True
+) -> Tuple[List[float], Dict[str, float]]:
+    _check_arima_length(train)
+    fit = _cached_fit(ForecastMethod.ARIMA, train, _fit_arima, cache)
+    forecast = fit.forecast(horizon)
+    return forecast.tolist(), _arima_summary(fit)
+
+
+def _arima_state(fit: Any, residuals: np.ndarray) -> ForecastStateModel:
+    return ForecastStateModel(
+        method=ForecastMethod.ARIMA,
+        params=np.asarray(fit.params, dtype=float).tolist(),
+        state=fit.predicted_state[:, -1].tolist(),
+        state_cov=fit.predicted_state_cov[:, :, -1].tolist(),
+        residuals=_trailing_residuals(residuals),
+    )
+
+
+def _extend_arima(
+    stored: ForecastStateModel | None, new_observations: np.ndarray, train: np.ndarray, refit: bool
+) -> Tuple[Any, ForecastStateModel]:
+    """Return the updated ARIMA fit of ``train`` and its state to persist.
+
+    Without ``refit`` the stored parameters are kept and only the new
+    observations are run through the Kalman filter, starting from the stored
+    predicted state. Missing state falls back to a plain fit of ``train``.
+    """
+
+    if stored is None:
+        fit = _cached_fit(ForecastMethod.ARIMA, train, _fit_arima)
+    elif refit:
+        fit = ARIMA(train, order=(1, 1, 1)).fit(start_params=np.asarray(stored.params))
+    else:
+        model = ARIMA(new_observations, order=(1, 1, 1))
+        model.ssm.initialize_known(np.asarray(stored.state), np.asarray(stored.state_cov))
+        fit = model.filter(np.asarray(stored.params))
+        residuals = np.concatenate([stored.residuals, np.asarray(fit.resid, dtype=float)])
+        return fit, _arima_state(fit, residuals)
+    return fit, _arima_state(fit, np.asarray(fit.resid, dtype=float)[1:])
+
+
+def calculate_metrics(
     train: np.ndarray,
     actual: np.ndarray,
     forecast: Sequence[float],
@@ -97,23 +299,370 @@ def _calculate_metrics(
     return ForecastMetrics(mape=mape, mase=mase, bias=bias)
 
 
-def run_forecast(method: ForecastMethod, series: Sequence[float], horizon: int) -> ForecastResponse:
-    train, actual = _train_test(series, horizon)
+_Forecaster = Callable[[np.ndarray, int], Tuple[List[float], Dict[str, float]]]
 
-    if method is ForecastMethod.NAIVE:
-        forecast, summary = _naive_forecast(train, horizon)
-    elif method is ForecastMethod.ETS:
-        forecast, summary = _ets_forecast(train, horizon)
-    elif method is ForecastMethod.CROSTON:
-        forecast, summary = _croston_forecast(train, horizon)
-    elif method is ForecastMethod.ARIMA:
-        forecast, summary = _arima_forecast(train, horizon)
+# Syntetos-Boylan cut-offs for demand classification.
+_ADI_CUTOFF = 1.32
+_CV2_CUTOFF = 0.49
+# Below this holdout MASE the naive forecast is good enough to skip model fits.
+_NAIVE_MASE_BOUND = 0.5
+
+
+def classify_demand(train: np.ndarray) -> Tuple[str, float, float]:
+    """Classify a series as smooth, erratic, intermittent or lumpy from ADI and CV²."""
+
+    nonzero = train[train > 0]
+    if nonzero.size == 0:
+        return "intermittent", float("inf"), 0.0
+    adi = float(train.size / nonzero.size)
+    cv2 = float((nonzero.std() / nonzero.mean()) ** 2)
+    if adi < _ADI_CUTOFF:
+        demand_class = "smooth" if cv2 < _CV2_CUTOFF else "erratic"
     else:
+        demand_class = "intermittent" if cv2 < _CV2_CUTOFF else "lumpy"
+    return demand_class, adi, cv2
+
+
+def _evaluate_candidate(
+    forecaster: _Forecaster,
+    train: np.ndarray,
+    actual: np.ndarray,
+    horizon: int,
+) -> Tuple[List[float], Dict[str, float], ForecastMetrics, float]:
+    started = time.perf_counter()
+    forecast, summary = forecaster(train, horizon)
+    metrics = calculate_metrics(train, actual, forecast)
+    return forecast, summary, metrics, (time.perf_counter() - started) * 1000
+
+
+def _auto_forecast(train: np.ndarray, actual: np.ndarray, horizon: int) -> ForecastResponse:
+    """Pick the candidate with the lowest holdout MASE.
+
+    Naive runs first and bounds the search: when it is already good enough the
+    model fits are skipped, and ARIMA is skipped for intermittent or lumpy
+    demand. Remaining candidates are evaluated concurrently.
+    """
+
+    demand_class, adi, cv2 = classify_demand(train)
+    outcomes = {
+        ForecastMethod.NAIVE: _evaluate_candidate(_naive_forecast, train, actual, horizon)
+    }
+    skipped: Dict[str, str] = {}
+    candidates = [ForecastMethod.CROSTON, ForecastMethod.ETS, ForecastMethod.ARIMA]
+    if outcomes[ForecastMethod.NAIVE][2].mase <= _NAIVE_MASE_BOUND:
+        for method in (ForecastMethod.ETS, ForecastMethod.ARIMA):
+            candidates.remove(method)
+            skipped[method.value] = f"naive MASE within bound {_NAIVE_MASE_BOUND}"
+    elif demand_class in ("intermittent", "lumpy"):
+        candidates.remove(ForecastMethod.ARIMA)
+        skipped[ForecastMethod.ARIMA.value] = f"{demand_class} demand"
+
+    with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+        futures = {
+            method: pool.submit(_evaluate_candidate, _FORECASTERS[method], train, actual, horizon)
+            for method in candidates
+        }
+        for method, future in futures.items():
+            try:
+                outcomes[method] = future.result()
+            except Exception as exc:  # noqa: BLE001 - a failed candidate only drops out
+                skipped[method.value] = f"fit failed: {exc}"
+
+    selected = min(outcomes, key=lambda method: outcomes[method][2].mase)
+    forecast, summary, metrics, _ = outcomes[selected]
+    report = ModelSelectionReport(
+        selected=selected,
+        demand_class=demand_class,
+        adi=adi,
+        cv2=cv2,
+        fitted=list(outcomes),
+        skipped=skipped,
+        timings_ms={method.value: outcome[3] for method, outcome in outcomes.items()},
+        scores={method.value: outcome[2].mase for method, outcome in outcomes.items()},
+    )
+    return ForecastResponse(
+        forecast=list(forecast),
+        metrics=metrics,
+        model_summary=summary,
+        selection=report,
+    )
+
+
+_FORECASTERS: Dict[ForecastMethod, _Forecaster] = {
+    ForecastMethod.NAIVE: _naive_forecast,
+    ForecastMethod.ETS: _ets_forecast,
+    ForecastMethod.CROSTON: _croston_forecast,
+    ForecastMethod.ARIMA: _arima_forecast,
+}
+
+
+def fit_forecast(
+    method: ForecastMethod,
+    train: Sequence[float],
+    horizon: int,
+    cache: bool = True,
+) -> Tuple[List[float], Dict[str, float]]:
+    """Point forecast and model summary of ``method`` fitted on ``train``.
+
+    ``cache=False`` fits without reading or filling the shared fit cache, for
+    one-off fits such as backtest origins that would only evict useful entries.
+    """
+
+    data = np.asarray(train, dtype=float)
+    if method is ForecastMethod.ETS:
+        return _ets_forecast(data, horizon, cache)
+    if method is ForecastMethod.ARIMA:
+        return _arima_forecast(data, horizon, cache)
+    forecaster = _FORECASTERS.get(method)
+    if forecaster is None:
         msg = f"Unsupported forecast method: {method}"
         raise ValueError(msg)
+    return forecaster(data, horizon)
+
+
+_INTERVAL_QUANTILES = (50, 90, 95)
+
+
+def _one_step_residuals(
+    method: ForecastMethod, train: np.ndarray, summary: Dict[str, float]
+) -> np.ndarray:
+    if method is ForecastMethod.NAIVE:
+        return np.diff(train)
+    if method is ForecastMethod.CROSTON:
+        path = croston_path(train, summary["alpha"])[0]
+        return train[1:] - path[:-1]
+    if method is ForecastMethod.ETS:
+        alpha = summary["alpha"]
+        level = float(train[0])
+        residuals = np.empty(train.size - 1)
+        for index, value in enumerate(train[1:]):
+            residuals[index] = value - level
+            level += alpha * residuals[index]
+        return residuals
+    fit = _cached_fit(ForecastMethod.ARIMA, train, _fit_arima)
+    return np.asarray(fit.resid, dtype=float)[1:]
+
+
+def _psi_weights(method: ForecastMethod, summary: Dict[str, float], horizon: int) -> np.ndarray:
+    """MA(infinity) weights mapping future one-step errors onto h-step errors."""
+
+    if method is ForecastMethod.NAIVE:
+        return np.ones(horizon)
+    if method is ForecastMethod.ARIMA:
+        ar = np.convolve([1.0, -summary["ar1"]], [1.0, -1.0])
+        return np.asarray(arma2ma(ar, [1.0, summary["ma1"]], lags=horizon), dtype=float)
+    psi = np.full(horizon, summary["alpha"])
+    psi[0] = 1.0
+    return psi
+
+
+def bootstrap_intervals(
+    forecast: Sequence[float],
+    residuals: np.ndarray,
+    psi: np.ndarray,
+    n_paths: int,
+    seed: int = 0,
+) -> Dict[str, List[float]]:
+    """Quantiles of ``n_paths`` simulated paths from resampled residuals.
+
+    Resampled one-step errors (n_paths x horizon) are propagated through the
+    psi weights with a single matrix product.
+    """
+
+    point = np.asarray(forecast, dtype=float)
+    horizon = point.size
+    centered = residuals - residuals.mean() if residuals.size else np.zeros(1)
+    draws = np.random.default_rng(seed).choice(centered, size=(n_paths, horizon))
+
+    lag = np.arange(horizon)[np.newaxis, :] - np.arange(horizon)[:, np.newaxis]
+    propagation = np.where(lag >= 0, psi[np.clip(lag, 0, None)], 0.0)
+    paths = np.maximum(point + draws @ propagation, 0.0)
+
+    quantiles = np.percentile(paths, _INTERVAL_QUANTILES, axis=0)
+    return {f"p{q}": row.tolist() for q, row in zip(_INTERVAL_QUANTILES, quantiles)}
+
+
+def run_forecast(
+    method: ForecastMethod,
+    series: Sequence[float],
+    horizon: int,
+    interval_paths: int | None = None,
+    interval_seed: int = 0,
+) -> ForecastResponse:
+    train, actual = _train_test(series, horizon)
+
+    if method is ForecastMethod.AUTO:
+        response = _auto_forecast(train, actual, horizon)
+    else:
+        forecaster = _FORECASTERS.get(method)
+        if forecaster is None:
+            msg = f"Unsupported forecast method: {method}"
+            raise ValueError(msg)
+        forecast, summary = forecaster(train, horizon)
+        metrics = calculate_metrics(train, actual, forecast)
+        response = ForecastResponse(forecast=list(forecast), metrics=metrics, model_summary=summary)
+
+    if interval_paths:
+        fitted = response.selection.selected if response.selection else method
+        summary = response.model_summary
+        response.intervals = bootstrap_intervals(
+            response.forecast,
+            _one_step_residuals(fitted, train, summary),
+            _psi_weights(fitted, summary, horizon),
+            interval_paths,
+            interval_seed,
+        )
+    return response
+
+
+def update_forecast(
+    method: ForecastMethod,
+    series: Sequence[float],
+    new_observations: Sequence[float],
+    horizon: int,
+    refit: bool = False,
+    interval_paths: int | None = None,
+    interval_seed: int = 0,
+) -> ForecastResponse:
+    """Forecast ``series + new_observations`` by updating the stored state of ``series``.
+
+    The fitted parameters, filter state and latest one-step residuals (at
+    most ``_MAX_STORED_RESIDUALS``) of every updated series are persisted in
+    the forecast state store, keyed by the training window. ARIMA runs only
+    the new observations through the state-space filter with the stored
+    parameters (or re-estimates them warm-started from those parameters when
+    ``refit`` is set); ETS continues the smoothing recursion from the stored
+    level. A series without stored state is fitted once on the full window.
+    Cheap methods are simply rerun.
+    """
+
+    full = [*series, *new_observations]
+    if method not in (ForecastMethod.ETS, ForecastMethod.ARIMA):
+        return run_forecast(method, full, horizon, interval_paths=interval_paths, interval_seed=interval_seed)
+
+    previous_train, _ = _train_test(series, horizon)
+    train, actual = _train_test(full, horizon)
+    appended = train[previous_train.size :]
+    previous_key = _fingerprint(method, previous_train)
+    stored = forecast_state_repository.get_state(previous_key)
+
+    if method is ForecastMethod.ETS:
+        state = _ets_state(train) if stored is None else _extend_ets(stored, appended)
+        forecast = [state.state[0]] * horizon
+        summary = {"alpha": state.params[0]}
+    else:
+        _check_arima_length(train)
+        fit, state = _extend_arima(stored, appended, train, refit)
+        forecast = fit.forecast(horizon).tolist()
+        summary = _arima_summary(fit)
+    forecast_state_repository.save_state(_fingerprint(method, train), state, replaces=previous_key)
+
+    metrics = calculate_metrics(train, actual, forecast)
+    response = ForecastResponse(forecast=forecast, metrics=metrics, model_summary=summary)
+    if interval_paths:
+        response.intervals = bootstrap_intervals(
+            forecast,
+            np.asarray(state.residuals, dtype=float),
+            _psi_weights(method, summary, horizon),
+            interval_paths,
+            interval_seed,
+        )
+    return response
+
+
+_BatchTask = Tuple[str, ForecastMethod, List[float], int]
+
+
+def default_batch_workers() -> int:
+    configured = os.getenv("SUPPLYCHAINOS_FORECAST_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    return os.cpu_count() or 1
+
+
+def _forecast_task(task: _BatchTask) -> ForecastBatchItem:
+    series_id, method, series, horizon = task
+    try:
+        result = run_forecast(method, series, horizon)
+    except Exception as exc:  # noqa: BLE001 - a bad series must not fail the batch
+        return ForecastBatchItem(series_id=series_id, error=str(exc) or type(exc).__name__)
+    return ForecastBatchItem(series_id=series_id, result=result)
+
+
+def _batch_tasks(
+    method: ForecastMethod,
+    series: Mapping[str, Sequence[float]],
+    horizon: int,
+) -> Iterator[_BatchTask]:
+    for series_id, values in series.items():
+        yield series_id, method, [float(value) for value in values], horizon
+
+
+def iter_forecast_batch(
+    method: ForecastMethod,
+    series: Mapping[str, Sequence[float]],
+    horizon: int,
+    max_workers: int | None = None,
+) -> Iterator[ForecastBatchItem]:
+    """Yield batch results as soon as each series finishes, in completion order.
+
+    At most a few tasks per worker are in flight at once, so memory stays flat
+    however large the batch is.
+    """
+
+    tasks = _batch_tasks(method, series, horizon)
+    workers = min(max_workers or default_batch_workers(), max(len(series), 1))
+    if workers <= 1:
+        for task in tasks:
+            yield _forecast_task(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Set[Future[ForecastBatchItem]] = set()
+        for task in tasks:
+            pending.add(pool.submit(_forecast_task, task))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def run_forecast_batch(
+    method: ForecastMethod,
+    series: Mapping[str, Sequence[float]],
+    horizon: int,
+    max_workers: int | None = None,
+) -> List[ForecastBatchItem]:
+    """Forecast many series, fanning the model fits out over a process pool.
+
+    Results keep the input order. Failures are reported per series instead of
+    aborting the batch.
+    """
+
+    tasks = list(_batch_tasks(method, series, horizon))
+    workers = min(max_workers or default_batch_workers(), len(tasks))
+    if workers <= 1:
+        return [_forecast_task(task) for task in tasks]
 
-    metrics = _calculate_metrics(train, actual, forecast)
-    return ForecastResponse(forecast=list(forecast), metrics=metrics, model_summary=summary)
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_forecast_task, tasks, chunksize=chunksize))
 
 
-__all__ = ["run_forecast"]
\ No newline at end of file
+__all__ = [
+    "bootstrap_intervals",
+    "calculate_metrics",
+    "classify_demand",
+    "clear_forecast_cache",
+    "default_batch_workers",
+    "fit_forecast",
+    "forecast_cache_stats",
+    "iter_forecast_batch",
+    "run_forecast",
+    "run_forecast_batch",
+    "update_forecast",
+]
\ No newline at end of file
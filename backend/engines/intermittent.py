@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+@dataclass
+class IntermittentForecast:
+    """Per-series one-step-ahead demand rates for a batch of series."""
+
+    croston: np.ndarray
+    sba: np.ndarray
+    tsb: np.ndarray
+    alpha: np.ndarray
+    beta: np.ndarray
+
+
+def _as_matrix(demand: ArrayLike) -> np.ndarray:
+    data = np.asarray(demand, dtype=float)
+    if data.ndim == 1:
+        data = data[np.newaxis, :]
+    if data.ndim != 2 or data.shape[1] == 0:
+        msg = "Demand must be a non-empty (n_series x n_periods) array."
+        raise ValueError(msg)
+    return data
+
+
+def _as_vector(value: ArrayLike, n_series: int, name: str) -> np.ndarray:
+    vector = np.broadcast_to(np.asarray(value, dtype=float), (n_series,)).copy()
+    if np.any((vector <= 0) | (vector > 1)):
+        msg = f"{name} must lie in (0, 1]."
+        raise ValueError(msg)
+    return vector
+
+
+def _croston_step(
+    value: np.ndarray,
+    state: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    alpha: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    d_hat, p_hat, interval, seen = state
+    positive = value > 0
+    first = positive & ~seen
+    update = positive & seen
+
+    d_hat = np.where(first, value, np.where(update, d_hat + alpha * (value - d_hat), d_hat))
+    p_hat = np.where(first, interval, np.where(update, p_hat + alpha * (interval - p_hat), p_hat))
+    interval = np.where(positive, 1.0, interval + 1.0)
+    return d_hat, p_hat, interval, seen | positive
+
+
+def _initial_state(n_series: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    return (
+        np.zeros(n_series),
+        np.zeros(n_series),
+        np.ones(n_series),
+        np.zeros(n_series, dtype=bool),
+    )
+
+
+def _croston_rate(d_hat: np.ndarray, p_hat: np.ndarray, seen: np.ndarray) -> np.ndarray:
+    rate = np.zeros(d_hat.shape)
+    np.divide(d_hat, p_hat, out=rate, where=seen & (p_hat != 0))
+    return rate
+
+
+def croston_path(demand: ArrayLike, alpha: ArrayLike = 0.1) -> np.ndarray:
+    """Croston forecast after each period: column ``t`` uses periods ``0..t``."""
+
+    data = _as_matrix(demand)
+    alpha_vec = _as_vector(alpha, data.shape[0], "alpha")
+    path = np.empty(data.shape)
+    state = _initial_state(data.shape[0])
+    for period in range(data.shape[1]):
+        state = _croston_step(data[:, period], state, alpha_vec)
+        path[:, period] = _croston_rate(state[0], state[1], state[3])
+    return path
+
+
+def intermittent_forecast_batch(
+    demand: ArrayLike,
+    alpha: ArrayLike = 0.1,
+    beta: ArrayLike | None = None,
+) -> IntermittentForecast:
+    """Croston, SBA and TSB estimates for every row of a demand matrix.
+
+    The recursion runs once over the periods and is vectorized across series,
+    using the same update order as the scalar ``_croston_forecast`` so Croston
+    results match it exactly. ``alpha`` and ``beta`` may be scalars or
+    per-series vectors; ``beta`` (the TSB occurrence smoothing) defaults to
+    ``alpha``. TSB reuses the Croston demand-size estimate and smooths the
+    demand occurrence probability every period.
+    """
+
+    data = _as_matrix(demand)
+    n_series = data.shape[0]
+    alpha_vec = _as_vector(alpha, n_series, "alpha")
+    beta_vec = alpha_vec.copy() if beta is None else _as_vector(beta, n_series, "beta")
+
+    state = _initial_state(n_series)
+    occurrence = (data[:, 0] > 0).astype(float)
+
+    for period in range(data.shape[1]):
+        value = data[:, period]
+        state = _croston_step(value, state, alpha_vec)
+        if period > 0:
+            occurrence = occurrence + beta_vec * ((value > 0).astype(float) - occurrence)
+
+    d_hat, p_hat, _, seen = state
+    croston = _croston_rate(d_hat, p_hat, seen)
+
+    return IntermittentForecast(
+        croston=croston,
+        sba=croston * (1.0 - alpha_vec / 2.0),
+        tsb=np.where(seen, occurrence * d_hat, 0.0),
+        alpha=alpha_vec,
+        beta=beta_vec,
+    )
+
+
+__all__ = ["IntermittentForecast", "croston_path", "intermittent_forecast_batch"]
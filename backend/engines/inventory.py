@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from math import sqrt
-from typing import Dict
+from typing import Dict, Mapping, Optional, Sequence, Union
 
+import numpy as np
+from numpy.typing import ArrayLike
 from scipy.stats import norm  # type: ignore[import-untyped]
 
 from backend.data.models import (
@@ -11,6 +14,16 @@ from backend.data.models import (
     InventoryPolicyResponse,
 )
 
+# One batch input column; ``None`` (or a ``None`` entry) marks missing values.
+PolicyColumn = Union[ArrayLike, Sequence[Optional[float]], None]
+
+
+_NOTES = {
+    InventoryMethod.EOQ: "Classical Economic Order Quantity model.",
+    InventoryMethod.QR: "Continuous review (Q,R) policy with normal demand assumption.",
+    InventoryMethod.NEWSVENDOR: "Single-period newsvendor solution with normal demand.",
+}
+
 
 def _require(params: Dict[str, float | None], method: str) -> Dict[str, float]:
     missing = [name for name, value in params.items() if value is None]
@@ -37,7 +50,7 @@ def _eoq(request: InventoryPolicyRequest) -> InventoryPolicyResponse:
         "cycle_stock": round(eoq / 2, 2),
         "inventory_turns": round(turns, 2),
     }
-    return InventoryPolicyResponse(policy=policy, notes="Classical Economic Order Quantity model.")
+    return InventoryPolicyResponse(policy=policy, notes=_NOTES[InventoryMethod.EOQ])
 
 
 def _qr(request: InventoryPolicyRequest) -> InventoryPolicyResponse:
@@ -65,7 +78,7 @@ def _qr(request: InventoryPolicyRequest) -> InventoryPolicyResponse:
         "reorder_point": round(reorder_point, 2),
         "safety_stock": round(z * sigma_lt, 2),
     }
-    return InventoryPolicyResponse(policy=policy, notes="Continuous review (Q,R) policy with normal demand assumption.")
+    return InventoryPolicyResponse(policy=policy, notes=_NOTES[InventoryMethod.QR])
 
 
 def _newsvendor(request: InventoryPolicyRequest) -> InventoryPolicyResponse:
@@ -87,7 +100,7 @@ def _newsvendor(request: InventoryPolicyRequest) -> InventoryPolicyResponse:
         "critical_ratio": round(critical_ratio, 3),
         "order_up_to_level": round(order_up_to, 2),
     }
-    return InventoryPolicyResponse(policy=policy, notes="Single-period newsvendor solution with normal demand.")
+    return InventoryPolicyResponse(policy=policy, notes=_NOTES[InventoryMethod.NEWSVENDOR])
 
 
 def compute_policy(request: InventoryPolicyRequest) -> InventoryPolicyResponse:
@@ -101,4 +114,240 @@ def compute_policy(request: InventoryPolicyRequest) -> InventoryPolicyResponse:
     raise ValueError(msg)
 
 
-__all__ = ["compute_policy"]
\ No newline at end of file
+def _column(columns: Mapping[str, PolicyColumn], name: str, size: int) -> np.ndarray:
+    values = columns.get(name)
+    if values is None:
+        return np.full(size, np.nan)
+    # ``None`` entries convert to NaN in the float cast itself.
+    return np.ravel(np.asarray(values, dtype=float))
+
+
+def _batch_size(columns: Mapping[str, PolicyColumn]) -> int:
+    lengths = {_column(columns, name, 0).size for name, values in columns.items() if values is not None}
+    if len(lengths) != 1:
+        msg = "Batch columns must be non-empty and share the same length."
+        raise ValueError(msg)
+    return lengths.pop()
+
+
+def _row_list(rows: np.ndarray) -> str:
+    shown = ", ".join(str(row) for row in rows[:5])
+    return f"rows {shown}{', ...' if rows.size > 5 else ''}"
+
+
+def _require_columns(
+    columns: Mapping[str, PolicyColumn], names: tuple[str, ...], method: str, size: int
+) -> Dict[str, np.ndarray]:
+    values = {name: _column(columns, name, size) for name in names}
+    missing = []
+    for name, column in values.items():
+        rows = np.flatnonzero(np.isnan(column))
+        if rows.size:
+            missing.append(f"{name} ({_row_list(rows)})")
+    if missing:
+        joined = "; ".join(missing)
+        msg = f"Missing parameters for {method}: {joined}"
+        raise ValueError(msg)
+    return values
+
+
+def _round(values: np.ndarray, digits: int) -> np.ndarray:
+    """``np.round`` that agrees with Python's ``round`` used by the per-request path.
+
+    The two only differ on values that sit on a decimal tie after scaling, so
+    just those elements are rounded individually.
+    """
+
+    rounded = np.round(values, digits)
+    scaled = values * 10.0**digits
+    for index in np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6):
+        rounded[index] = round(float(values[index]), digits)
+    return rounded
+
+
+def _eoq_columns(values: Mapping[str, np.ndarray]) -> np.ndarray:
+    return np.sqrt(2 * values["annual_demand"] * values["ordering_cost"] / values["holding_cost"])
+
+
+def compute_policy_batch(
+    method: InventoryMethod,
+    columns: Mapping[str, PolicyColumn],
+) -> Dict[str, np.ndarray]:
+    """Column-wise version of ``compute_policy`` for many SKUs at once.
+
+    ``columns`` maps ``InventoryPolicyRequest`` field names to equal-length
+    arrays (``None`` entries are missing values). ``norm.ppf`` runs once on the
+    whole service-level vector and outputs are rounded like the per-request
+    path.
+    """
+
+    size = _batch_size(columns)
+
+    service_level = _column(columns, "service_level", size)
+    service_level = np.where(np.isnan(service_level) | (service_level == 0), 0.95, service_level)
+
+    if method is InventoryMethod.EOQ:
+        values = _require_columns(columns, ("annual_demand", "ordering_cost", "holding_cost"), "EOQ", size)
+        eoq = _eoq_columns(values)
+        turns = np.divide(values["annual_demand"], eoq, out=np.zeros(size), where=eoq != 0)
+        return {
+            "order_quantity": _round(eoq, 2),
+            "cycle_stock": _round(eoq / 2, 2),
+            "inventory_turns": _round(turns, 2),
+        }
+
+    if method is InventoryMethod.QR:
+        values = _require_columns(columns, ("demand_rate", "lead_time", "demand_std"), "(Q,R)", size)
+        z = norm.ppf(service_level)
+        sigma_lt = values["demand_std"] * np.sqrt(values["lead_time"])
+        reorder_point = values["demand_rate"] * values["lead_time"] + z * sigma_lt
+
+        eoq_inputs = {
+            name: _column(columns, name, size)
+            for name in ("annual_demand", "ordering_cost", "holding_cost")
+        }
+        has_eoq = np.all([np.nan_to_num(column) != 0 for column in eoq_inputs.values()], axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            eoq = _round(_eoq_columns(eoq_inputs), 2)
+        order_quantity = np.where(has_eoq, eoq, values["demand_rate"] * values["lead_time"])
+        return {
+            "order_quantity": _round(order_quantity, 2),
+            "reorder_point": _round(reorder_point, 2),
+            "safety_stock": _round(z * sigma_lt, 2),
+        }
+
+    if method is InventoryMethod.NEWSVENDOR:
+        values = _require_columns(columns, ("demand_rate", "demand_std"), "newsvendor", size)
+        underage = _column(columns, "underage_cost", size)
+        overage = _column(columns, "overage_cost", size)
+        has_costs = ~np.isnan(underage) & ~np.isnan(overage)
+        zero_costs = np.flatnonzero(has_costs & (underage + overage == 0))
+        if zero_costs.size:
+            msg = f"Underage and overage costs sum to zero for newsvendor: {_row_list(zero_costs)}"
+            raise ValueError(msg)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cost_ratio = underage / (underage + overage)
+        critical_ratio = np.where(has_costs, cost_ratio, service_level)
+        order_up_to = values["demand_rate"] + norm.ppf(critical_ratio) * values["demand_std"]
+        return {
+            "critical_ratio": _round(critical_ratio, 3),
+            "order_up_to_level": _round(order_up_to, 2),
+        }
+
+    msg = f"Unsupported inventory method: {method}"
+    raise ValueError(msg)
+
+
+@dataclass
+class ServiceLevelFrontier:
+    """Cost/service tradeoff per SKU over a service-level grid.
+
+    Point arrays have shape ``(n_skus, n_levels)``; ``expected_shortage`` is
+    units short per replenishment cycle ((Q,R)) or per period (newsvendor).
+    """
+
+    service_levels: np.ndarray
+    safety_stock: np.ndarray
+    holding_cost: np.ndarray
+    expected_shortage: np.ndarray
+    shortage_cost: np.ndarray
+    total_cost: np.ndarray
+    optimal_service_level: np.ndarray
+    optimal_total_cost: np.ndarray
+
+
+def _standard_loss(z: np.ndarray) -> np.ndarray:
+    return norm.pdf(z) - z * norm.sf(z)
+
+
+def service_level_frontier(
+    method: InventoryMethod,
+    columns: Mapping[str, PolicyColumn],
+    service_levels: ArrayLike,
+) -> ServiceLevelFrontier:
+    """Evaluate every SKU at every service level in one broadcast computation.
+
+    (Q,R) prices annual holding of safety and cycle stock against annual
+    shortage cost (``shortage_cost`` per unit short times expected units short
+    per cycle times cycles per year). Newsvendor prices expected leftovers at
+    ``overage_cost`` against expected shortages at ``underage_cost``.
+    """
+
+    grid = np.asarray(service_levels, dtype=float).ravel()
+    if grid.size == 0 or np.any((grid <= 0) | (grid >= 1)):
+        msg = "Service levels must lie strictly between 0 and 1."
+        raise ValueError(msg)
+    size = _batch_size(columns)
+
+    z = norm.ppf(grid)[np.newaxis, :]
+    loss = _standard_loss(z)
+
+    if method is InventoryMethod.QR:
+        values = _require_columns(
+            columns,
+            ("annual_demand", "demand_rate", "lead_time", "demand_std", "holding_cost", "shortage_cost"),
+            "(Q,R) frontier",
+            size,
+        )
+        ordering_cost = _column(columns, "ordering_cost", size)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            eoq = _eoq_columns({**values, "ordering_cost": ordering_cost})
+        order_quantity = np.where(
+            np.isfinite(eoq) & (eoq > 0), eoq, values["demand_rate"] * values["lead_time"]
+        )[:, np.newaxis]
+        sigma = (values["demand_std"] * np.sqrt(values["lead_time"]))[:, np.newaxis]
+
+        safety_stock = z * sigma
+        expected_shortage = sigma * loss
+        # Zero-demand SKUs order nothing, so they run no cycles and cost no shortage.
+        cycles = np.divide(
+            values["annual_demand"][:, np.newaxis],
+            order_quantity,
+            out=np.zeros(order_quantity.shape),
+            where=order_quantity > 0,
+        )
+        holding = values["holding_cost"][:, np.newaxis] * (safety_stock + order_quantity / 2)
+        shortage = values["shortage_cost"][:, np.newaxis] * expected_shortage * cycles
+    elif method is InventoryMethod.NEWSVENDOR:
+        values = _require_columns(
+            columns,
+            ("demand_std", "underage_cost", "overage_cost"),
+            "newsvendor frontier",
+            size,
+        )
+        sigma = values["demand_std"][:, np.newaxis]
+        safety_stock = z * sigma
+        expected_shortage = sigma * loss
+        holding = values["overage_cost"][:, np.newaxis] * (safety_stock + expected_shortage)
+        shortage = values["underage_cost"][:, np.newaxis] * expected_shortage
+    else:
+        msg = f"Frontier is not defined for inventory method: {method}"
+        raise ValueError(msg)
+
+    total = holding + shortage
+    best = np.argmin(total, axis=1)
+    rows = np.arange(size)
+    return ServiceLevelFrontier(
+        service_levels=grid,
+        safety_stock=safety_stock,
+        holding_cost=holding,
+        expected_shortage=expected_shortage,
+        shortage_cost=shortage,
+        total_cost=total,
+        optimal_service_level=grid[best],
+        optimal_total_cost=total[rows, best],
+    )
+
+
+def policy_notes(method: InventoryMethod) -> str:
+    return _NOTES[method]
+
+
+__all__ = [
+    "PolicyColumn",
+    "ServiceLevelFrontier",
+    "compute_policy",
+    "compute_policy_batch",
+    "policy_notes",
+    "service_level_frontier",
+]
\ No newline at end of file
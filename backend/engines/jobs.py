@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable, Deque, Dict, List, Tuple
+
+from backend.data import job_repository
+from backend.data.models import JobModel, JobStatus
+
+JobHandler = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+_FINISHED = frozenset({JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED})
+# Waiters re-read the store at least this often, so jobs finished by another
+# API process are noticed too.
+_POLL_SECONDS = 0.5
+_DEFAULT_JOB_WORKERS = 2
+_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def default_job_workers() -> int:
+    """Concurrent jobs, from ``SUPPLYCHAINOS_JOB_WORKERS`` or a small default.
+
+    Heavy handlers start their own process pools (sized by the simulation,
+    forecast and optimization worker settings), so running one job per CPU
+    would oversubscribe the machine; a couple of concurrent jobs keeps the
+    queue moving while each job uses the cores.
+    """
+
+    configured = os.getenv("SUPPLYCHAINOS_JOB_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    return min(_DEFAULT_JOB_WORKERS, os.cpu_count() or 1)
+
+
+def _execute(handler: JobHandler, job_id: str, payload: Dict[str, Any]) -> None:
+    """Worker process entry point: run one job and persist its outcome."""
+
+    try:
+        result = handler(payload)
+    except Exception as exc:  # noqa: BLE001 - any failure is the job's outcome
+        job_repository.finish_job(job_id, JobStatus.FAILED, error=str(exc) or type(exc).__name__)
+    else:
+        job_repository.finish_job(job_id, JobStatus.SUCCEEDED, result=result)
+
+
+class JobQueue:
+    """Runs registered job handlers in worker processes, at most ``workers`` at a time.
+
+    Every job gets its own process, so a running job can be cancelled by
+    terminating it without disturbing the others; jobs beyond the limit wait
+    in FIFO order. Handlers receive the submitted payload and return a JSON
+    serializable dict, which the worker writes to the job store itself.
+
+    Pending jobs live only in this process, so a new queue marks jobs left
+    queued or running in the store by a previous process as failed.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self._handlers: Dict[str, JobHandler] = {}
+        self._pending: Deque[Tuple[str, str, Dict[str, Any]]] = deque()
+        self._running: Dict[str, BaseProcess] = {}
+        self._changed = threading.Condition()
+        # Spawned job workers import this module too (and build their own queue)
+        # while their job is running; only the main process owns the store.
+        if multiprocessing.current_process().name == "MainProcess":
+            job_repository.fail_unfinished_jobs("Interrupted: the job queue was restarted.")
+
+    @property
+    def kinds(self) -> List[str]:
+        return sorted(self._handlers)
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        self._handlers[kind] = handler
+
+    def submit(self, kind: str, payload: Dict[str, Any]) -> JobModel:
+        if kind not in self._handlers:
+            msg = f"Unknown job kind '{kind}'."
+            raise ValueError(msg)
+        job = job_repository.create_job(kind, payload)
+        with self._changed:
+            self._pending.append((job.id, kind, payload))
+            self._start_pending()
+        return job
+
+    def _start_pending(self) -> None:
+        # Caller holds ``self._changed``.
+        while self._pending and len(self._running) < self.workers:
+            job_id, kind, payload = self._pending.popleft()
+            if not job_repository.mark_running(job_id):
+                continue
+            process = _CONTEXT.Process(
+                target=_execute, args=(self._handlers[kind], job_id, payload), name=f"job-{job_id}"
+            )
+            process.start()
+            self._running[job_id] = process
+            threading.Thread(target=self._reap, args=(job_id, process), daemon=True).start()
+
+    def _reap(self, job_id: str, process: BaseProcess) -> None:
+        process.join()
+        if process.exitcode != 0:
+            # No-op when the job was cancelled or had already recorded its outcome.
+            job_repository.finish_job(
+                job_id, JobStatus.FAILED, error=f"Worker exited with code {process.exitcode}."
+            )
+        with self._changed:
+            self._running.pop(job_id, None)
+            self._start_pending()
+            self._changed.notify_all()
+
+    def cancel(self, job_id: str) -> JobModel | None:
+        """Cancel a queued or running job; finished jobs are returned unchanged."""
+
+        with self._changed:
+            self._pending = deque(item for item in self._pending if item[0] != job_id)
+            if job_repository.finish_job(job_id, JobStatus.CANCELLED):
+                process = self._running.get(job_id)
+                if process is not None:
+                    process.terminate()
+            self._changed.notify_all()
+        return job_repository.get_job(job_id)
+
+    def wait(self, job_id: str, timeout: float) -> JobModel | None:
+        """Return the job once it finishes or ``timeout`` seconds pass, whichever is first."""
+
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while True:
+                job = job_repository.get_job(job_id)
+                remaining = deadline - time.monotonic()
+                if job is None or job.status in _FINISHED or remaining <= 0:
+                    return job
+                self._changed.wait(min(remaining, _POLL_SECONDS))
+
+    def shutdown(self) -> None:
+        """Cancel every queued and running job."""
+
+        with self._changed:
+            job_ids = [item[0] for item in self._pending] + list(self._running)
+        for job_id in job_ids:
+            self.cancel(job_id)
+        # Reaper threads remove finished processes, so snapshot under the lock.
+        with self._changed:
+            processes = list(self._running.values())
+        for process in processes:
+            process.join()
+
+
+job_queue = JobQueue(workers=default_job_workers())
+# Worker processes are spawned rather than forked, so they never inherit locks
+# held by the API's request and reaper threads. They are not daemonic (handlers
+# may start their own pools), so stop them before multiprocessing's exit
+# handler waits on them.
+atexit.register(job_queue.shutdown)
+
+
+__all__ = ["JobHandler", "JobQueue", "default_job_workers", "job_queue"]
@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import os
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from backend.data.models import DistributionSummary
+
+_PERCENTILES = (5, 50, 95)
+# Below this many replications per task a worker process costs more than it saves.
+_MIN_REPLICATIONS_PER_TASK = 2_000
+# Replications drawn from one random stream in a single call. Fixed, so the
+# draws do not depend on how replications are split across workers.
+_STREAM_BLOCK = 256
+
+_ChunkTask = Tuple[int, int, int, List[float], float, float, float, int, float, float]
+
+
+@dataclass
+class MonteCarloReport:
+    """Per-replication outcomes of a vectorized inventory simulation."""
+
+    demand_served: np.ndarray
+    demand_lost: np.ndarray
+    stockout_periods: np.ndarray
+    on_hand_periods: np.ndarray
+    orders_placed: np.ndarray
+    periods: int
+
+    @property
+    def replications(self) -> int:
+        return int(self.demand_served.size)
+
+    @property
+    def fill_rate(self) -> np.ndarray:
+        total = self.demand_served + self.demand_lost
+        return np.divide(self.demand_served, total, out=np.ones_like(total), where=total > 0)
+
+    @property
+    def cycle_service_level(self) -> np.ndarray:
+        return 1.0 - self.stockout_periods / self.periods
+
+    def cost(self, holding_cost: float, shortage_cost: float, ordering_cost: float = 0.0) -> np.ndarray:
+        """Total cost per replication: end-of-period stock held, units lost and orders placed."""
+
+        return (
+            holding_cost * self.on_hand_periods
+            + shortage_cost * self.demand_lost
+            + ordering_cost * self.orders_placed
+        )
+
+    def summary(self) -> Dict[str, DistributionSummary]:
+        """Mean, standard deviation and 5/50/95th percentiles of each outcome."""
+
+        outcomes = {
+            "demand_served": self.demand_served,
+            "demand_lost": self.demand_lost,
+            "fill_rate": self.fill_rate,
+            "cycle_service_level": self.cycle_service_level,
+        }
+        result = {}
+        for name, values in outcomes.items():
+            low, median, high = np.percentile(values, _PERCENTILES)
+            result[name] = DistributionSummary(
+                mean=float(values.mean()),
+                std=float(values.std()),
+                p05=float(low),
+                p50=float(median),
+                p95=float(high),
+            )
+        return result
+
+
+def arrival_delay(lead_times: ArrayLike) -> np.ndarray:
+    """Periods until an order placed now can serve demand, as in the SimPy engine.
+
+    The SimPy demand process schedules its next period before a one-period
+    delivery is scheduled, so lead time 1 arrives after that period's demand;
+    lead time 0 is available next period.
+    """
+
+    lead = np.asarray(lead_times, dtype=np.int64)
+    return np.where(lead == 1, 2, np.maximum(lead, 1))
+
+
+def simulate_paths(
+    demand: ArrayLike,
+    lead_times: ArrayLike,
+    initial_inventory: float,
+    reorder_point: ArrayLike,
+    order_quantity: ArrayLike,
+) -> MonteCarloReport:
+    """Run (Q,R) replenishment over a (replications x periods) demand matrix.
+
+    ``lead_times`` holds the lead time of an order placed in each cell and
+    ``reorder_point`` / ``order_quantity`` may differ per replication. Orders
+    in transit live in a circular pipeline array indexed by arrival period, so
+    every period is a handful of vector operations across all replications.
+    """
+
+    demand_matrix = np.atleast_2d(np.asarray(demand, dtype=float))
+    n_paths, n_periods = demand_matrix.shape
+    delays = np.broadcast_to(arrival_delay(lead_times), demand_matrix.shape)
+    reorder = np.broadcast_to(np.asarray(reorder_point, dtype=float), (n_paths,))
+    quantity = np.broadcast_to(np.asarray(order_quantity, dtype=float), (n_paths,))
+
+    width = int(delays.max()) + 1
+    pipeline = np.zeros((n_paths, width))
+    rows = np.arange(n_paths)
+    on_hand = np.full(n_paths, float(initial_inventory))
+    on_order = np.zeros(n_paths)
+    served_total = np.zeros(n_paths)
+    lost_total = np.zeros(n_paths)
+    stockouts = np.zeros(n_paths, dtype=np.int64)
+    on_hand_total = np.zeros(n_paths)
+    order_count = np.zeros(n_paths, dtype=np.int64)
+
+    for period in range(n_periods):
+        slot = period % width
+        arriving = pipeline[:, slot]
+        on_hand += arriving
+        on_order -= arriving
+        arriving[:] = 0.0
+
+        served = np.minimum(on_hand, demand_matrix[:, period])
+        lost = demand_matrix[:, period] - served
+        on_hand -= served
+        served_total += served
+        lost_total += lost
+        stockouts += lost > 0
+        on_hand_total += on_hand
+
+        reorder_now = on_hand + on_order <= reorder
+        ordered = np.where(reorder_now, quantity, 0.0)
+        order_count += reorder_now
+        on_order += ordered
+        pipeline[rows, (period + delays[:, period]) % width] += ordered
+
+    return MonteCarloReport(
+        demand_served=served_total,
+        demand_lost=lost_total,
+        stockout_periods=stockouts,
+        on_hand_periods=on_hand_total,
+        orders_placed=order_count,
+        periods=n_periods,
+    )
+
+
+def sample_demand(
+    rng: np.random.Generator, demand_profile: List[float], replications: int, demand_cv: float
+) -> np.ndarray:
+    """Normal demand around the profile with standard deviation ``demand_cv * mean``, floored at 0."""
+
+    profile = np.asarray(demand_profile, dtype=float)
+    if demand_cv == 0:
+        return np.tile(profile, (replications, 1))
+    noise = rng.standard_normal((replications, profile.size))
+    return np.maximum(profile * (1.0 + demand_cv * noise), 0.0)
+
+
+def sample_lead_times(
+    rng: np.random.Generator, lead_time: int, lead_time_std: float, shape: tuple[int, int]
+) -> np.ndarray:
+    """Per-order lead times, normal around ``lead_time`` and rounded to whole periods."""
+
+    if lead_time_std == 0:
+        return np.full(shape, lead_time, dtype=np.int64)
+    draws = lead_time + lead_time_std * rng.standard_normal(shape)
+    return np.maximum(np.rint(draws), 0).astype(np.int64)
+
+
+def default_simulation_workers() -> int:
+    configured = os.getenv("SUPPLYCHAINOS_SIMULATION_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    return os.cpu_count() or 1
+
+
+def replication_entropy(seed: int | None) -> int:
+    """Root entropy of a run: ``seed`` itself, or fresh OS entropy like ``SeedSequence(None)``."""
+
+    return seed if seed is not None else secrets.randbits(128)
+
+
+def _block_rngs(entropy: int, block: int) -> Tuple[np.random.Generator, np.random.Generator]:
+    # Child ``block`` of SeedSequence(entropy), without spawning the others; demand
+    # and lead times get separate streams so a partial block is a prefix of a full one.
+    demand_seq, lead_seq = np.random.SeedSequence(entropy, spawn_key=(block,)).spawn(2)
+    return np.random.default_rng(demand_seq), np.random.default_rng(lead_seq)
+
+
+def sample_replications(
+    entropy: int,
+    start: int,
+    stop: int,
+    demand_profile: List[float],
+    demand_cv: float,
+    lead_time: int,
+    lead_time_std: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Demand and lead time matrices for replications ``start`` to ``stop`` of a run.
+
+    Replications come in blocks of ``_STREAM_BLOCK`` sharing one random
+    stream, each block drawn with one call per matrix; replication ``i`` gets
+    the same values whatever range it is requested in.
+    """
+
+    shape = (stop - start, len(demand_profile))
+    if demand_cv == 0 and lead_time_std == 0:
+        demand = np.tile(np.asarray(demand_profile, dtype=float), (shape[0], 1))
+        return demand, np.full(shape, lead_time, dtype=np.int64)
+    demand = np.empty(shape)
+    lead_times = np.empty(shape, dtype=np.int64)
+    for block in range(start // _STREAM_BLOCK, (stop - 1) // _STREAM_BLOCK + 1):
+        first = block * _STREAM_BLOCK
+        low, high = max(start, first), min(stop, first + _STREAM_BLOCK)
+        demand_rng, lead_rng = _block_rngs(entropy, block)
+        rows = slice(low - start, high - start)
+        demand[rows] = sample_demand(demand_rng, demand_profile, high - first, demand_cv)[low - first :]
+        lead_times[rows] = sample_lead_times(lead_rng, lead_time, lead_time_std, (high - first, shape[1]))[
+            low - first :
+        ]
+    return demand, lead_times
+
+
+def _simulate_chunk(task: _ChunkTask) -> MonteCarloReport:
+    (
+        entropy,
+        start,
+        stop,
+        demand_profile,
+        initial_inventory,
+        reorder_point,
+        order_quantity,
+        lead_time,
+        demand_cv,
+        lead_time_std,
+    ) = task
+    demand, lead_times = sample_replications(
+        entropy, start, stop, demand_profile, demand_cv, lead_time, lead_time_std
+    )
+    return simulate_paths(demand, lead_times, initial_inventory, reorder_point, order_quantity)
+
+
+def _merge_reports(reports: Sequence[MonteCarloReport]) -> MonteCarloReport:
+    return MonteCarloReport(
+        demand_served=np.concatenate([report.demand_served for report in reports]),
+        demand_lost=np.concatenate([report.demand_lost for report in reports]),
+        stockout_periods=np.concatenate([report.stockout_periods for report in reports]),
+        on_hand_periods=np.concatenate([report.on_hand_periods for report in reports]),
+        orders_placed=np.concatenate([report.orders_placed for report in reports]),
+        periods=reports[0].periods,
+    )
+
+
+def run_monte_carlo_simulation(
+    demand_profile: List[float],
+    initial_inventory: float,
+    reorder_point: float,
+    order_quantity: float,
+    lead_time: int,
+    replications: int = 1000,
+    demand_cv: float = 0.0,
+    lead_time_std: float = 0.0,
+    seed: int | None = None,
+    max_workers: int | None = None,
+) -> MonteCarloReport:
+    """Monte Carlo counterpart of ``run_single_item_simulation``.
+
+    Replication ``i`` draws from child ``i // _STREAM_BLOCK`` of
+    ``SeedSequence(seed)``, so results are bit-identical however the
+    replications are split across worker processes. Large runs fan out over
+    a process pool and are merged in replication order. With one replication
+    and no noise the result equals the SimPy engine's.
+    """
+
+    if not demand_profile:
+        msg = "Demand profile cannot be empty."
+        raise ValueError(msg)
+    if replications < 1 or demand_cv < 0 or lead_time_std < 0 or lead_time < 0:
+        msg = "Replications must be positive and noise parameters non-negative."
+        raise ValueError(msg)
+
+    entropy = replication_entropy(seed)
+    workers = max_workers or default_simulation_workers()
+    n_blocks = -(-replications // _STREAM_BLOCK)
+    n_tasks = min(workers * 4, n_blocks, max(1, replications // _MIN_REPLICATIONS_PER_TASK))
+    # Task boundaries fall on stream blocks so no block is drawn twice.
+    bounds = np.minimum(np.linspace(0, n_blocks, n_tasks + 1).astype(int) * _STREAM_BLOCK, replications)
+    tasks: List[_ChunkTask] = [
+        (
+            entropy,
+            int(start),
+            int(stop),
+            list(demand_profile),
+            float(initial_inventory),
+            float(reorder_point),
+            float(order_quantity),
+            int(lead_time),
+            float(demand_cv),
+            float(lead_time_std),
+        )
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+
+    if workers <= 1 or len(tasks) == 1:
+        return _merge_reports([_simulate_chunk(task) for task in tasks])
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        return _merge_reports(list(pool.map(_simulate_chunk, tasks)))
+
+
+__all__ = [
+    "MonteCarloReport",
+    "arrival_delay",
+    "default_simulation_workers",
+    "replication_entropy",
+    "run_monte_carlo_simulation",
+    "sample_demand",
+    "sample_lead_times",
+    "sample_replications",
+    "simulate_paths",
+]
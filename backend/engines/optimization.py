@@ -1,9 +1,23 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple, Union
 
+import numpy as np
 import pulp  # type: ignore[import-untyped]
+from numpy.typing import ArrayLike
+from ortools.linear_solver import pywraplp  # type: ignore[import-untyped]
+from scipy import sparse  # type: ignore[import-untyped]
+
+# Sparse usage as a scipy matrix or (row, col, value) COO arrays, rows indexing capacities.
+SparseUsage = Union[sparse.spmatrix, sparse.sparray, Tuple[ArrayLike, ArrayLike, ArrayLike]]
 
 
 @dataclass
@@ -11,6 +25,8 @@ class OptimizationResult:
     objective: float
     production_plan: Dict[str, float]
     shadow_prices: Dict[str, float]
+    build_seconds: float = 0.0
+    solve_seconds: float = 0.0
 
 
 @dataclass
@@ -26,57 +42,605 @@ class Product:
     capacity_usage: Dict[str, float]
 
 
+def _usage_matrix(usage: SparseUsage, shape: Tuple[int, int]) -> sparse.csr_matrix:
+    if sparse.issparse(usage):
+        matrix = sparse.csr_matrix(usage, dtype=float)
+    else:
+        rows, cols, values = (np.asarray(part) for part in usage)
+        matrix = sparse.csr_matrix((values.astype(float), (rows, cols)), shape=shape)
+    if matrix.shape != shape:
+        msg = f"Usage matrix must have shape (capacities x products) = {shape}, got {matrix.shape}."
+        raise ValueError(msg)
+    matrix.sum_duplicates()
+    matrix.eliminate_zeros()
+    return matrix
+
+
+def solve_make_to_order_sparse(
+    product_names: Sequence[str],
+    contribution_margins: ArrayLike,
+    capacity_names: Sequence[str],
+    capacity_limits: ArrayLike,
+    usage: SparseUsage,
+) -> OptimizationResult:
+    """Make-to-order LP from a sparse (capacities x products) usage matrix.
+
+    Each capacity row is emitted from its CSR slice, so model build work is
+    proportional to the number of nonzero usage entries rather than
+    products x capacities. Build and solve wall times are reported
+    separately.
+    """
+
+    margins = np.asarray(contribution_margins, dtype=float)
+    limits = np.asarray(capacity_limits, dtype=float)
+    if margins.shape != (len(product_names),) or limits.shape != (len(capacity_names),):
+        msg = "Margins and limits must have one entry per product and capacity."
+        raise ValueError(msg)
+
+    started = time.perf_counter()
+    matrix = _usage_matrix(usage, (len(capacity_names), len(product_names)))
+    model = pulp.LpProblem("make_to_order", pulp.LpMaximize)
+    variables = [pulp.LpVariable(f"build_{name}", lowBound=0) for name in product_names]
+    model += pulp.LpAffineExpression(zip(variables, margins.tolist()))
+
+    indptr, indices, data = matrix.indptr, matrix.indices.tolist(), matrix.data.tolist()
+    for row, (name, limit) in enumerate(zip(capacity_names, limits.tolist())):
+        first, last = indptr[row], indptr[row + 1]
+        terms = pulp.LpAffineExpression(
+            zip([variables[column] for column in indices[first:last]], data[first:last])
+        )
+        model.addConstraint(pulp.LpConstraint(terms, pulp.LpConstraintLE, name, limit), name)
+    built = time.perf_counter()
+
+    model.solve(pulp.PULP_CBC_CMD(msg=False))
+    solved = time.perf_counter()
+
+    plan = {
+        name: float(var.value() or 0.0) for name, var in zip(product_names, variables)
+    }
+    duals = {name: float(constraint.pi) for name, constraint in model.constraints.items()}
+    return OptimizationResult(
+        objective=float(pulp.value(model.objective) or 0.0),
+        production_plan=plan,
+        shadow_prices=duals,
+        build_seconds=built - started,
+        solve_seconds=solved - built,
+    )
+
+
+def _product_columns(
+    products: Iterable[Product], capacities: Iterable[CapacityConstraint]
+) -> Tuple[List[str], List[float], List[str], List[float], SparseUsage]:
+    product_list = list(products)
+    capacity_list = list(capacities)
+    row_of = {capacity.name: row for row, capacity in enumerate(capacity_list)}
+    entries = [
+        (row_of[name], column, value)
+        for column, product in enumerate(product_list)
+        for name, value in product.capacity_usage.items()
+        if name in row_of and value
+    ]
+    rows, cols, values = zip(*entries) if entries else ((), (), ())
+    return (
+        [product.name for product in product_list],
+        [product.contribution_margin for product in product_list],
+        [capacity.name for capacity in capacity_list],
+        [capacity.limit for capacity in capacity_list],
+        (np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64), np.asarray(values, dtype=float)),
+    )
+
+
 def solve_make_to_order(
     products: Iterable[Product],
     capacities: Iterable[CapacityConstraint],
 ) -> OptimizationResult:
     """Solve a simple make-to-order allocation problem.
 
-    Maximize total contribution margin subject to resource capacities.
+    Maximize total contribution margin subject to resource capacities. Only
+    the usage entries each product lists are turned into constraint terms.
     """
 
-    model = pulp.LpProblem("make_to_order", pulp.LpMaximize)
-    decision_vars: Dict[str, pulp.LpVariable] = {}
+    return solve_make_to_order_sparse(*_product_columns(products, capacities))
+
+
+@dataclass
+class MilpSolution:
+    """Solution of ``solve_sparse_milp``; ``status`` is PuLP's solution status text."""
+
+    values: np.ndarray
+    objective: float
+    status: str
+    build_seconds: float
+    solve_seconds: float
+
 
-    for product in products:
-        decision_vars[product.name] = pulp.LpVariable(
-            f"build_{product.name}", lowBound=0
+_SENSES = {"=": pulp.LpConstraintEQ, "<": pulp.LpConstraintLE, ">": pulp.LpConstraintGE}
+
+
+def solve_sparse_milp(
+    cost: ArrayLike,
+    matrix: sparse.csr_matrix,
+    senses: Sequence[str],
+    rhs: ArrayLike,
+    lower: ArrayLike,
+    upper: ArrayLike,
+    integer: ArrayLike,
+    time_limit_seconds: float | None = None,
+    gap: float | None = None,
+    threads: int | None = None,
+    start: ArrayLike | None = None,
+) -> MilpSolution:
+    """Minimize ``cost @ x`` subject to ``matrix @ x (senses) rhs`` and bounds with CBC.
+
+    ``senses`` holds one of ``=``, ``<`` or ``>`` per row and ``upper`` may be
+    ``inf``. Rows are emitted from their CSR slices, so build work is
+    proportional to the nonzeros. ``time_limit_seconds``, ``gap`` (relative
+    MIP gap) and ``threads`` are passed to CBC; a run stopped by the limit
+    returns its best integer solution with status "Solution Found". A
+    feasible ``start`` is handed to CBC as its first incumbent, so a time
+    limit can never end the run without a solution.
+    """
+
+    started = time.perf_counter()
+    costs = np.asarray(cost, dtype=float)
+    lows = np.asarray(lower, dtype=float).tolist()
+    highs = [None if np.isinf(value) else value for value in np.asarray(upper, dtype=float).tolist()]
+    integers = np.asarray(integer, dtype=bool).tolist()
+    rows = sparse.csr_matrix(matrix)
+    if rows.shape[1] != costs.size or rows.shape[0] != len(senses):
+        msg = "Constraint matrix shape does not match costs and senses."
+        raise ValueError(msg)
+
+    model = pulp.LpProblem("sparse_milp", pulp.LpMinimize)
+    variables = [
+        pulp.LpVariable(f"x{index}", low, high, pulp.LpInteger if is_integer else pulp.LpContinuous)
+        for index, (low, high, is_integer) in enumerate(zip(lows, highs, integers))
+    ]
+    model += pulp.LpAffineExpression(
+        (variables[index], value) for index, value in zip(np.flatnonzero(costs).tolist(), costs[costs != 0].tolist())
+    )
+    indptr, indices, data = rows.indptr, rows.indices.tolist(), rows.data.tolist()
+    for row, (sense, bound) in enumerate(zip(senses, np.asarray(rhs, dtype=float).tolist())):
+        first, last = indptr[row], indptr[row + 1]
+        terms = pulp.LpAffineExpression(
+            zip([variables[column] for column in indices[first:last]], data[first:last])
         )
+        model.addConstraint(pulp.LpConstraint(terms, _SENSES[sense], f"r{row}", bound))
+    if start is not None:
+        for variable, value in zip(variables, np.asarray(start, dtype=float).tolist()):
+            variable.setInitialValue(value)
+    built = time.perf_counter()
 
-    model += pulp.lpSum(
-        decision_vars[p.name] * p.contribution_margin for p in products
+    model.solve(
+        pulp.PULP_CBC_CMD(
+            msg=False, timeLimit=time_limit_seconds, gapRel=gap, threads=threads, warmStart=start is not None
+        )
+    )
+    solved = time.perf_counter()
+    if model.sol_status not in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible):
+        msg = f"Solver finished without a solution: {pulp.LpSolution[model.sol_status]}."
+        raise ValueError(msg)
+
+    return MilpSolution(
+        values=np.array([variable.varValue or 0.0 for variable in variables]),
+        objective=float(pulp.value(model.objective) or 0.0),
+        status=pulp.LpSolution[model.sol_status],
+        build_seconds=built - started,
+        solve_seconds=solved - built,
     )
 
-    for capacity in capacities:
-        model += (
-            pulp.lpSum(
-                decision_vars[product.name]
-                * product.capacity_usage.get(capacity.name, 0.0)
-                for product in products
-            )
-            <= capacity.limit,
-            capacity.name,
+
+@dataclass
+class ParametricSweep:
+    """Optimal solutions as one capacity limit varies, everything else fixed.
+
+    ``production_plan`` and ``shadow_prices`` have one row per swept limit.
+    The objective is piecewise linear in the limit with slope equal to the
+    capacity's shadow price; ``breakpoints`` are where adjacent segments
+    intersect, i.e. where the optimal basis changes.
+    """
+
+    capacity: str
+    limits: np.ndarray
+    objective: np.ndarray
+    production_plan: np.ndarray
+    shadow_prices: np.ndarray
+    breakpoints: np.ndarray
+    iterations: np.ndarray
+
+
+class MakeToOrderSession:
+    """Make-to-order LP kept inside a GLOP solver between solves.
+
+    The model is built once. Changing capacity limits or margins only edits
+    bounds and objective coefficients, and GLOP re-solves from the previous
+    optimal basis instead of starting cold. Not thread-safe; callers hold
+    ``lock`` around use.
+    """
+
+    def __init__(
+        self,
+        product_names: Sequence[str],
+        contribution_margins: ArrayLike,
+        capacity_names: Sequence[str],
+        capacity_limits: ArrayLike,
+        usage: SparseUsage,
+    ) -> None:
+        margins = np.asarray(contribution_margins, dtype=float)
+        limits = np.asarray(capacity_limits, dtype=float)
+        if margins.shape != (len(product_names),) or limits.shape != (len(capacity_names),):
+            msg = "Margins and limits must have one entry per product and capacity."
+            raise ValueError(msg)
+
+        started = time.perf_counter()
+        matrix = _usage_matrix(usage, (len(capacity_names), len(product_names)))
+        solver = pywraplp.Solver.CreateSolver("GLOP")
+        infinity = solver.infinity()
+        self._variables = [solver.NumVar(0.0, infinity, f"build_{name}") for name in product_names]
+        self._constraints = []
+        indptr, indices, data = matrix.indptr, matrix.indices.tolist(), matrix.data.tolist()
+        for row, (name, limit) in enumerate(zip(capacity_names, limits.tolist())):
+            constraint = solver.Constraint(-infinity, limit, name)
+            for column, value in zip(indices[indptr[row] : indptr[row + 1]], data[indptr[row] : indptr[row + 1]]):
+                constraint.SetCoefficient(self._variables[column], value)
+            self._constraints.append(constraint)
+        objective = solver.Objective()
+        for variable, margin in zip(self._variables, margins.tolist()):
+            objective.SetCoefficient(variable, margin)
+        objective.SetMaximization()
+
+        self.solver = solver
+        self.product_names = list(product_names)
+        self.capacity_names = list(capacity_names)
+        self._product_index = {name: index for index, name in enumerate(self.product_names)}
+        self._capacity_index = {name: index for index, name in enumerate(self.capacity_names)}
+        self.lock = threading.Lock()
+        self._build_seconds = time.perf_counter() - started
+
+    @classmethod
+    def from_products(
+        cls, products: Iterable[Product], capacities: Iterable[CapacityConstraint]
+    ) -> "MakeToOrderSession":
+        return cls(*_product_columns(products, capacities))
+
+    def _capacity(self, name: str) -> int:
+        if name not in self._capacity_index:
+            msg = f"Unknown capacity: {name}"
+            raise ValueError(msg)
+        return self._capacity_index[name]
+
+    def _snapshot(self) -> Tuple[List[float], List[float]]:
+        objective = self.solver.Objective()
+        limits = [constraint.ub() for constraint in self._constraints]
+        margins = [objective.GetCoefficient(variable) for variable in self._variables]
+        return limits, margins
+
+    def _restore(self, snapshot: Tuple[List[float], List[float]]) -> None:
+        objective = self.solver.Objective()
+        for constraint, limit in zip(self._constraints, snapshot[0]):
+            constraint.SetUb(limit)
+        for variable, margin in zip(self._variables, snapshot[1]):
+            objective.SetCoefficient(variable, margin)
+
+    def _solve_arrays(self) -> Tuple[float, np.ndarray, np.ndarray]:
+        status = self.solver.Solve()
+        if status != pywraplp.Solver.OPTIMAL:
+            msg = "Make-to-order LP has no optimal solution (infeasible or unbounded)."
+            raise ValueError(msg)
+        plan = np.array([variable.solution_value() for variable in self._variables])
+        duals = np.array([constraint.dual_value() for constraint in self._constraints])
+        return self.solver.Objective().Value(), plan, duals
+
+    def solve(self) -> OptimizationResult:
+        started = time.perf_counter()
+        objective, plan, duals = self._solve_arrays()
+        build_seconds, self._build_seconds = self._build_seconds, 0.0
+        return OptimizationResult(
+            objective=objective,
+            production_plan=dict(zip(self.product_names, plan.tolist())),
+            shadow_prices=dict(zip(self.capacity_names, duals.tolist())),
+            build_seconds=build_seconds,
+            solve_seconds=time.perf_counter() - started,
         )
 
-    model.solve(pulp.PULP_CBC_CMD(msg=False))
+    def update(
+        self,
+        capacity_limits: Mapping[str, float] | None = None,
+        contribution_margins: Mapping[str, float] | None = None,
+    ) -> OptimizationResult:
+        """Apply new limits and margins for the named entries and re-solve warm.
 
-    plan = {
-        name: float(var.value() or 0.0) for name, var in decision_vars.items()
-    }
-    duals: Dict[str, float] = {}
-    for name, constraint in model.constraints.items():
-        duals[name] = float(constraint.pi)
+        When the update is rejected (unknown names or no optimal solution) the
+        previous limits and margins are restored before the error propagates.
+        """
 
-    return OptimizationResult(
-        objective=float(pulp.value(model.objective) or 0.0),
-        production_plan=plan,
-        shadow_prices=duals,
+        snapshot = self._snapshot()
+        try:
+            for name, limit in (capacity_limits or {}).items():
+                self._constraints[self._capacity(name)].SetUb(float(limit))
+            objective = self.solver.Objective()
+            for name, margin in (contribution_margins or {}).items():
+                if name not in self._product_index:
+                    msg = f"Unknown product: {name}"
+                    raise ValueError(msg)
+                objective.SetCoefficient(self._variables[self._product_index[name]], float(margin))
+            return self.solve()
+        except ValueError:
+            self._restore(snapshot)
+            raise
+
+    def solve_scenarios(
+        self, capacity_limits: np.ndarray, contribution_margins: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Re-solve warm for each row of limits and margins, then restore the model.
+
+        Returns (objective, production plan, shadow prices) with one row per
+        scenario; rows without an optimal solution are NaN.
+        """
+
+        objective = self.solver.Objective()
+        snapshot = self._snapshot()
+        count = capacity_limits.shape[0]
+        values = np.full(count, np.nan)
+        plans = np.full((count, len(self._variables)), np.nan)
+        duals = np.full((count, len(self._constraints)), np.nan)
+        try:
+            for index, (limits, margins) in enumerate(zip(capacity_limits.tolist(), contribution_margins.tolist())):
+                for constraint, limit in zip(self._constraints, limits):
+                    constraint.SetUb(limit)
+                for variable, margin in zip(self._variables, margins):
+                    objective.SetCoefficient(variable, margin)
+                try:
+                    values[index], plans[index], duals[index] = self._solve_arrays()
+                except ValueError:
+                    continue
+        finally:
+            self._restore(snapshot)
+        return values, plans, duals
+
+    def sweep(self, capacity: str, limits: Sequence[float]) -> ParametricSweep:
+        """Re-solve warm at each limit of ``capacity`` in ascending order, then restore it."""
+
+        constraint = self._constraints[self._capacity(capacity)]
+        original = constraint.ub()
+        grid = np.sort(np.asarray(limits, dtype=float))
+        if grid.size == 0:
+            msg = "Sweep needs at least one capacity limit."
+            raise ValueError(msg)
+
+        objective = np.empty(grid.size)
+        plans = np.empty((grid.size, len(self._variables)))
+        duals = np.empty((grid.size, len(self._constraints)))
+        iterations = np.empty(grid.size, dtype=np.int64)
+        try:
+            for index, limit in enumerate(grid.tolist()):
+                constraint.SetUb(limit)
+                objective[index], plans[index], duals[index] = self._solve_arrays()
+                iterations[index] = self.solver.iterations()
+        finally:
+            constraint.SetUb(original)
+
+        slope = duals[:, self._capacity(capacity)]
+        changed = np.flatnonzero(~np.isclose(slope[1:], slope[:-1], rtol=1e-9, atol=1e-9))
+        # Intersect the objective segments through adjacent points on either side of each change.
+        left, right = changed, changed + 1
+        breakpoints = (
+            objective[right] - objective[left] + slope[left] * grid[left] - slope[right] * grid[right]
+        ) / (slope[left] - slope[right])
+        return ParametricSweep(
+            capacity=capacity,
+            limits=grid,
+            objective=objective,
+            production_plan=plans,
+            shadow_prices=duals,
+            breakpoints=breakpoints,
+            iterations=iterations,
+        )
+
+
+@dataclass
+class ScenarioBatch:
+    """Make-to-order solutions for a batch of scenarios, one row per submitted scenario.
+
+    Rows of scenarios without an optimal solution are NaN. Scenarios with
+    identical limits and margins are solved once; ``unique_scenarios``
+    counts the distinct ones.
+    """
+
+    product_names: List[str]
+    capacity_names: List[str]
+    objective: np.ndarray
+    production_plan: np.ndarray
+    shadow_prices: np.ndarray
+    unique_scenarios: int
+    solve_seconds: float
+
+
+# Below this many scenarios per task a worker process costs more than it saves.
+_MIN_SCENARIOS_PER_TASK = 100
+
+_worker_session: MakeToOrderSession | None = None
+
+
+def default_optimization_workers() -> int:
+    configured = os.getenv("SUPPLYCHAINOS_OPTIMIZATION_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    return os.cpu_count() or 1
+
+
+def _init_scenario_worker(
+    product_names: List[str],
+    contribution_margins: np.ndarray,
+    capacity_names: List[str],
+    capacity_limits: np.ndarray,
+    usage: sparse.csr_matrix,
+) -> None:
+    # The base model is shipped once per worker; tasks only carry scenario rows.
+    global _worker_session
+    _worker_session = MakeToOrderSession(
+        product_names, contribution_margins, capacity_names, capacity_limits, usage
     )
 
 
+def _solve_scenario_chunk(
+    chunk: Tuple[np.ndarray, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    assert _worker_session is not None
+    return _worker_session.solve_scenarios(*chunk)
+
+
+def _scenario_rows(
+    names: Sequence[str], base: np.ndarray, overrides: Sequence[Mapping[str, float]], label: str
+) -> np.ndarray:
+    index = {name: position for position, name in enumerate(names)}
+    rows = np.tile(base, (len(overrides), 1))
+    for row, values in enumerate(overrides):
+        for name, value in values.items():
+            if name not in index:
+                msg = f"Unknown {label}: {name}"
+                raise ValueError(msg)
+            rows[row, index[name]] = value
+    return rows
+
+
+def solve_make_to_order_scenarios_sparse(
+    product_names: Sequence[str],
+    contribution_margins: ArrayLike,
+    capacity_names: Sequence[str],
+    capacity_limits: ArrayLike,
+    usage: SparseUsage,
+    scenarios: Sequence[Tuple[Mapping[str, float], Mapping[str, float]]],
+    max_workers: int | None = None,
+) -> ScenarioBatch:
+    """Solve the make-to-order LP under many (capacity limits, margins) overrides.
+
+    Each scenario overrides the named base limits and margins. Scenarios are
+    deduplicated by a hash of their full limit and margin vectors, and the
+    distinct ones are split into contiguous chunks. Every worker process
+    builds the base model once as a single-threaded GLOP session and solves
+    its chunks as warm-started edits of it.
+    """
+
+    margins = np.asarray(contribution_margins, dtype=float)
+    limits = np.asarray(capacity_limits, dtype=float)
+    if margins.shape != (len(product_names),) or limits.shape != (len(capacity_names),):
+        msg = "Margins and limits must have one entry per product and capacity."
+        raise ValueError(msg)
+    if not scenarios:
+        msg = "Scenario batch cannot be empty."
+        raise ValueError(msg)
+    matrix = _usage_matrix(usage, (len(capacity_names), len(product_names)))
+    limit_rows = _scenario_rows(capacity_names, limits, [limit for limit, _ in scenarios], "capacity")
+    margin_rows = _scenario_rows(product_names, margins, [margin for _, margin in scenarios], "product")
+
+    started = time.perf_counter()
+    # Adding 0.0 folds -0.0 into 0.0 so equal scenarios hash equally.
+    keys = [
+        hashlib.blake2b((limit + 0.0).tobytes() + (margin + 0.0).tobytes(), digest_size=16).digest()
+        for limit, margin in zip(limit_rows, margin_rows)
+    ]
+    slots: Dict[bytes, int] = {}
+    first_rows: List[int] = []
+    positions = np.empty(len(keys), dtype=np.int64)
+    for row, key in enumerate(keys):
+        if key not in slots:
+            slots[key] = len(first_rows)
+            first_rows.append(row)
+        positions[row] = slots[key]
+    distinct = np.asarray(first_rows, dtype=np.int64)
+    unique_limits, unique_margins = limit_rows[distinct], margin_rows[distinct]
+
+    base = (list(product_names), margins, list(capacity_names), limits, matrix)
+    workers = min(max_workers or default_optimization_workers(), distinct.size // _MIN_SCENARIOS_PER_TASK)
+    if workers <= 1:
+        session = MakeToOrderSession(*base)
+        objective, plans, duals = session.solve_scenarios(unique_limits, unique_margins)
+    else:
+        bounds = np.linspace(0, distinct.size, workers * 4 + 1).astype(np.int64)
+        chunks = [
+            (unique_limits[start:stop], unique_margins[start:stop])
+            for start, stop in zip(bounds[:-1], bounds[1:])
+            if stop > start
+        ]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_scenario_worker, initargs=base
+        ) as pool:
+            parts = list(pool.map(_solve_scenario_chunk, chunks))
+        objective = np.concatenate([part[0] for part in parts])
+        plans = np.concatenate([part[1] for part in parts])
+        duals = np.concatenate([part[2] for part in parts])
+
+    return ScenarioBatch(
+        product_names=list(product_names),
+        capacity_names=list(capacity_names),
+        objective=objective[positions],
+        production_plan=plans[positions],
+        shadow_prices=duals[positions],
+        unique_scenarios=int(distinct.size),
+        solve_seconds=time.perf_counter() - started,
+    )
+
+
+def solve_make_to_order_scenarios(
+    products: Iterable[Product],
+    capacities: Iterable[CapacityConstraint],
+    scenarios: Sequence[Tuple[Mapping[str, float], Mapping[str, float]]],
+    max_workers: int | None = None,
+) -> ScenarioBatch:
+    return solve_make_to_order_scenarios_sparse(
+        *_product_columns(products, capacities), scenarios=scenarios, max_workers=max_workers
+    )
+
+
+class SessionStore:
+    """Bounded, thread-safe registry of live sessions; the least recently used is evicted."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._sessions: "OrderedDict[str, MakeToOrderSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, session: MakeToOrderSession) -> str:
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self._sessions[session_id] = session
+            while len(self._sessions) > self._maxsize:
+                self._sessions.popitem(last=False)
+        return session_id
+
+    def get(self, session_id: str) -> MakeToOrderSession | None:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def remove(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+
+optimization_sessions = SessionStore(
+    maxsize=int(os.getenv("SUPPLYCHAINOS_OPTIMIZATION_SESSIONS", "32")),
+)
+
+
 __all__ = [
     "CapacityConstraint",
+    "MakeToOrderSession",
+    "MilpSolution",
     "OptimizationResult",
+    "ParametricSweep",
     "Product",
+    "ScenarioBatch",
+    "SessionStore",
+    "SparseUsage",
+    "default_optimization_workers",
+    "optimization_sessions",
     "solve_make_to_order",
+    "solve_make_to_order_scenarios",
+    "solve_make_to_order_scenarios_sparse",
+    "solve_make_to_order_sparse",
+    "solve_sparse_milp",
 ]
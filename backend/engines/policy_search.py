@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Sequence
+
+import numpy as np
+from scipy.stats import norm  # type: ignore[import-untyped]
+
+from backend.engines.monte_carlo import replication_entropy, sample_replications, simulate_paths
+
+# (candidate x replication x period) cells simulated per kernel call.
+_MAX_CELLS = 4_000_000
+
+
+@dataclass
+class PolicySearchResult:
+    """Outcome of a racing search over (reorder point, order quantity) candidates.
+
+    Candidate arrays are aligned; ``replications`` is how many common paths
+    each candidate was simulated on before it was eliminated or the budget
+    ran out, and ``mean_cost`` is its average cost over those paths.
+    """
+
+    reorder_point: np.ndarray
+    order_quantity: np.ndarray
+    mean_cost: np.ndarray
+    replications: np.ndarray
+    best_index: int
+    best_std_error: float
+    rounds: int
+
+    @property
+    def paths_simulated(self) -> int:
+        return int(self.replications.sum())
+
+
+def _candidate_costs(
+    demand: np.ndarray,
+    lead_times: np.ndarray,
+    initial_inventory: float,
+    reorder_point: np.ndarray,
+    order_quantity: np.ndarray,
+    costs: Sequence[float],
+) -> np.ndarray:
+    """(candidates x replications) costs, every candidate run on the same paths."""
+
+    n_paths, n_periods = demand.shape
+    per_call = max(1, _MAX_CELLS // (n_paths * n_periods))
+    result = np.empty((reorder_point.size, n_paths))
+    for start in range(0, reorder_point.size, per_call):
+        stop = min(start + per_call, reorder_point.size)
+        count = stop - start
+        report = simulate_paths(
+            np.tile(demand, (count, 1)),
+            np.tile(lead_times, (count, 1)),
+            initial_inventory,
+            np.repeat(reorder_point[start:stop], n_paths),
+            np.repeat(order_quantity[start:stop], n_paths),
+        )
+        result[start:stop] = report.cost(*costs).reshape(count, n_paths)
+    return result
+
+
+def optimize_qr_policy(
+    demand_profile: List[float],
+    initial_inventory: float,
+    lead_time: int,
+    reorder_points: Sequence[float],
+    order_quantities: Sequence[float],
+    holding_cost: float,
+    shortage_cost: float,
+    ordering_cost: float = 0.0,
+    demand_cv: float = 0.0,
+    lead_time_std: float = 0.0,
+    initial_replications: int = 50,
+    max_replications: int = 2000,
+    confidence: float = 0.95,
+    seed: int | None = None,
+) -> PolicySearchResult:
+    """Race every (reorder point, order quantity) pair on simulated cost.
+
+    All candidates share the same replication streams (common random
+    numbers), so they are compared through paired cost differences whose
+    noise is far smaller than that of the costs themselves. Each round
+    doubles the number of paths; after each round any candidate whose mean
+    paired difference to the current leader exceeds ``z * standard error``
+    is dropped and simulated no further. Only the survivors' cost samples
+    are kept; eliminated candidates keep just their running cost total.
+    """
+
+    if not demand_profile or not reorder_points or not order_quantities:
+        msg = "Demand profile and candidate grids cannot be empty."
+        raise ValueError(msg)
+    if initial_replications < 2 or max_replications < initial_replications:
+        msg = "Replication budget must be at least two and no smaller than the first round."
+        raise ValueError(msg)
+    if min(holding_cost, shortage_cost, ordering_cost, demand_cv, lead_time_std) < 0 or lead_time < 0:
+        msg = "Costs, noise and lead time must be non-negative."
+        raise ValueError(msg)
+    if any(quantity <= 0 for quantity in order_quantities):
+        msg = "Order quantities must be positive."
+        raise ValueError(msg)
+
+    grid_r, grid_q = np.meshgrid(
+        np.asarray(reorder_points, dtype=float), np.asarray(order_quantities, dtype=float), indexing="ij"
+    )
+    reorder, quantity = grid_r.ravel(), grid_q.ravel()
+    entropy = replication_entropy(seed)
+    threshold = float(norm.ppf(confidence))
+    costs = (holding_cost, shortage_cost, ordering_cost)
+
+    # ``observed`` holds the cost samples of the candidates in ``racing`` only.
+    racing = np.arange(reorder.size)
+    observed = np.empty((reorder.size, 0))
+    total_cost = np.zeros(reorder.size)
+    replications = np.zeros(reorder.size, dtype=np.int64)
+    done, batch, rounds = 0, initial_replications, 0
+    while done < max_replications and (rounds == 0 or racing.size > 1):
+        stop = min(done + batch, max_replications)
+        demand, lead_times = sample_replications(
+            entropy, done, stop, demand_profile, demand_cv, lead_time, lead_time_std
+        )
+        sample = _candidate_costs(demand, lead_times, initial_inventory, reorder[racing], quantity[racing], costs)
+        observed = np.concatenate([observed, sample], axis=1)
+        total_cost[racing] += sample.sum(axis=1)
+        done, batch, rounds = stop, stop, rounds + 1
+        replications[racing] = done
+
+        leader = int(np.argmin(total_cost[racing]))
+        differences = observed - observed[leader]
+        margin = differences.mean(axis=1) - threshold * differences.std(axis=1, ddof=1) / np.sqrt(done)
+        survivors = margin <= 0
+        racing, observed = racing[survivors], observed[survivors]
+
+    mean_cost = total_cost / replications
+    position = int(np.argmin(mean_cost[racing]))
+    best = int(racing[position])
+    best_costs = observed[position]
+    std_error = float(best_costs.std(ddof=1) / np.sqrt(best_costs.size)) if best_costs.size > 1 else 0.0
+    return PolicySearchResult(
+        reorder_point=reorder,
+        order_quantity=quantity,
+        mean_cost=mean_cost,
+        replications=replications,
+        best_index=best,
+        best_std_error=std_error,
+        rounds=rounds,
+    )
+
+
+__all__ = ["PolicySearchResult", "optimize_qr_policy"]
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy import sparse  # type: ignore[import-untyped]
+from scipy.sparse.linalg import splu  # type: ignore[import-untyped]
+
+from backend.data.adapters.sample_loader import series_key
+
+
+@dataclass
+class Hierarchy:
+    """Product / location hierarchy with its sparse summing matrix.
+
+    Nodes are ordered total, locations, products, then leaves, so the first
+    ``n_aggregates`` rows of ``summing`` are aggregates and the rest is an
+    identity block over the leaves.
+    """
+
+    labels: List[str]
+    leaves: List[Tuple[str, str]]
+    summing: sparse.csr_matrix
+
+    @property
+    def n_aggregates(self) -> int:
+        return len(self.labels) - len(self.leaves)
+
+    @property
+    def aggregation(self) -> sparse.csr_matrix:
+        return self.summing[: self.n_aggregates]
+
+
+def build_hierarchy(leaves: Sequence[Tuple[str, str]]) -> Hierarchy:
+    """Build the total / location / product / SKU-location hierarchy for ``leaves``."""
+
+    unique = list(dict.fromkeys((str(product), str(location)) for product, location in leaves))
+    if not unique:
+        msg = "Hierarchy requires at least one (product, location) leaf."
+        raise ValueError(msg)
+
+    locations = list(dict.fromkeys(location for _, location in unique))
+    products = list(dict.fromkeys(product for product, _ in unique))
+    location_row = {location: 1 + index for index, location in enumerate(locations)}
+    product_row = {product: 1 + len(locations) + index for index, product in enumerate(products)}
+    n_aggregates = 1 + len(locations) + len(products)
+
+    n_leaves = len(unique)
+    leaf_index = np.arange(n_leaves)
+    rows = np.concatenate(
+        [
+            np.zeros(n_leaves, dtype=np.int64),
+            [location_row[location] for _, location in unique],
+            [product_row[product] for product, _ in unique],
+            n_aggregates + leaf_index,
+        ]
+    )
+    cols = np.tile(leaf_index, 4)
+    summing = sparse.csr_matrix(
+        (np.ones(rows.size), (rows, cols)),
+        shape=(n_aggregates + n_leaves, n_leaves),
+    )
+
+    labels = (
+        ["total"]
+        + [f"location:{location}" for location in locations]
+        + [f"product:{product}" for product in products]
+        + [series_key(product, location) for product, location in unique]
+    )
+    return Hierarchy(labels=labels, leaves=unique, summing=summing)
+
+
+def _as_forecasts(hierarchy: Hierarchy, base: ArrayLike) -> np.ndarray:
+    forecasts = np.asarray(base, dtype=float)
+    if forecasts.ndim == 1:
+        forecasts = forecasts[:, np.newaxis]
+    if forecasts.shape[0] != len(hierarchy.labels):
+        msg = "Base forecasts must have one row per hierarchy node."
+        raise ValueError(msg)
+    return forecasts
+
+
+def reconcile_bottom_up(hierarchy: Hierarchy, base: ArrayLike) -> np.ndarray:
+    """Aggregate the leaf forecasts up the hierarchy."""
+
+    forecasts = _as_forecasts(hierarchy, base)
+    return np.asarray(hierarchy.summing @ forecasts[hierarchy.n_aggregates :])
+
+
+def reconcile_top_down(
+    hierarchy: Hierarchy,
+    base: ArrayLike,
+    history: ArrayLike,
+) -> np.ndarray:
+    """Split the total forecast by each leaf's share of historical demand.
+
+    ``history`` is a (n_leaves x n_periods) matrix of leaf actuals.
+    """
+
+    forecasts = _as_forecasts(hierarchy, base)
+    leaf_history = np.asarray(history, dtype=float)
+    if leaf_history.ndim != 2 or leaf_history.shape[0] != len(hierarchy.leaves):
+        msg = "History must be a (n_leaves x n_periods) matrix."
+        raise ValueError(msg)
+    totals = leaf_history.sum(axis=1)
+    grand_total = totals.sum()
+    if grand_total == 0:
+        proportions = np.full(totals.size, 1.0 / totals.size)
+    else:
+        proportions = totals / grand_total
+    return np.asarray(hierarchy.summing @ np.outer(proportions, forecasts[0]))
+
+
+def shrinkage_intensity(residuals: np.ndarray) -> float:
+    """Schäfer-Strimmer shrinkage of the residual correlation towards the diagonal.
+
+    Sums over all node pairs are rewritten through the (T x T) Gram matrix so
+    no (n x n) matrix is formed.
+    """
+
+    n_obs = residuals.shape[0]
+    if n_obs < 2:
+        return 1.0
+    scale = np.sqrt(np.einsum("ij,ij->j", residuals, residuals) / n_obs)
+    scaled = residuals / np.where(scale > 0, scale, 1.0)
+
+    squares = scaled * scaled
+    gram = scaled @ scaled.T
+    gram_norm = float(np.einsum("ij,ij->", gram, gram))
+    diagonal_norm = float(np.sum(squares.sum(axis=0) ** 2))
+
+    fourth_all = float(np.sum(squares.sum(axis=1) ** 2))
+    fourth_diagonal = float(np.sum(squares * squares))
+    variance = (
+        (fourth_all - fourth_diagonal) - (gram_norm - diagonal_norm) / n_obs
+    ) / (n_obs * (n_obs - 1))
+    correlation = (gram_norm - diagonal_norm) / n_obs**2
+    if correlation <= 0:
+        return 1.0
+    return float(min(max(variance / correlation, 0.0), 1.0))
+
+
+def reconcile_mint(
+    hierarchy: Hierarchy,
+    base: ArrayLike,
+    residuals: ArrayLike,
+    shrinkage: float | None = None,
+) -> Tuple[np.ndarray, float]:
+    """MinT reconciliation with a shrinkage covariance estimate.
+
+    ``residuals`` is a (T x n_nodes) matrix of in-sample one-step errors. The
+    covariance is ``W = lam * D + (1 - lam) * R'R / T`` with ``D`` its
+    diagonal, i.e. a diagonal plus a rank-T term. Reconciled forecasts use the
+    projection ``y - W C' (C W C')^-1 C y`` with ``C = [I, -S_agg]``: only the
+    sparse (aggregates x aggregates) matrix ``C D C'`` is factorized and the
+    low-rank part is handled through the Woodbury identity. Returns the
+    reconciled forecasts and the shrinkage intensity used.
+    """
+
+    forecasts = _as_forecasts(hierarchy, base)
+    errors = np.asarray(residuals, dtype=float)
+    if errors.ndim != 2 or errors.shape[1] != len(hierarchy.labels):
+        msg = "Residuals must be a (n_obs x n_nodes) matrix."
+        raise ValueError(msg)
+
+    n_obs = errors.shape[0]
+    lam = shrinkage_intensity(errors) if shrinkage is None else float(shrinkage)
+    # Keep W invertible when the sample covariance is rank deficient.
+    lam = min(max(lam, 1e-8), 1.0)
+    low_rank_weight = 1.0 - lam
+
+    variances = np.einsum("ij,ij->j", errors, errors) / n_obs
+    floor = max(float(variances.max()), 1.0) * 1e-12
+    diagonal = lam * np.maximum(variances, floor)
+    factor = errors.T / np.sqrt(n_obs)
+
+    n_aggregates = hierarchy.n_aggregates
+    constraint = sparse.hstack(
+        [sparse.identity(n_aggregates, format="csr"), -hierarchy.aggregation],
+        format="csr",
+    )
+    inner = (constraint @ sparse.diags(diagonal) @ constraint.T).tocsc()
+    solver = splu(inner)
+
+    rhs = np.asarray(constraint @ forecasts)
+    if low_rank_weight > 0:
+        projected = np.asarray(constraint @ factor)
+        solved_projected = solver.solve(projected)
+        core = np.identity(n_obs) / low_rank_weight + projected.T @ solved_projected
+        solved_rhs = solver.solve(rhs)
+        correction = np.linalg.solve(core, projected.T @ solved_rhs)
+        multipliers = solved_rhs - solved_projected @ correction
+    else:
+        multipliers = solver.solve(rhs)
+
+    back = np.asarray(constraint.T @ multipliers)
+    adjustment = diagonal[:, np.newaxis] * back
+    if low_rank_weight > 0:
+        adjustment += low_rank_weight * (factor @ (factor.T @ back))
+    return forecasts - adjustment, lam
+
+
+def reconciled_by_label(hierarchy: Hierarchy, reconciled: np.ndarray) -> Dict[str, List[float]]:
+    return {label: row.tolist() for label, row in zip(hierarchy.labels, reconciled)}
+
+
+__all__ = [
+    "Hierarchy",
+    "build_hierarchy",
+    "reconcile_bottom_up",
+    "reconcile_mint",
+    "reconcile_top_down",
+    "reconciled_by_label",
+    "shrinkage_intensity",
+]
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, TypedDict
 
-import random
+import numpy as np
 import simpy
 
 
@@ -13,11 +13,64 @@ class StockoutEvent:
     shortfall: float
 
 
+class TraceColumns(TypedDict):
+    period: List[int]
+    demand: List[float]
+    on_hand: List[float]
+    on_order: List[float]
+    served: List[float]
+    lost: List[float]
+
+
+@dataclass
+class SimulationTrace:
+    """End-of-period state, one array entry per demand period."""
+
+    demand: np.ndarray
+    on_hand: np.ndarray
+    on_order: np.ndarray
+    served: np.ndarray
+    lost: np.ndarray
+
+    @classmethod
+    def allocate(cls, demand_profile: List[float]) -> "SimulationTrace":
+        periods = len(demand_profile)
+        return cls(
+            demand=np.asarray(demand_profile, dtype=float),
+            on_hand=np.zeros(periods),
+            on_order=np.zeros(periods),
+            served=np.zeros(periods),
+            lost=np.zeros(periods),
+        )
+
+    def to_columns(self) -> TraceColumns:
+        return {
+            "period": list(range(1, self.demand.size + 1)),
+            "demand": self.demand.tolist(),
+            "on_hand": self.on_hand.tolist(),
+            "on_order": self.on_order.tolist(),
+            "served": self.served.tolist(),
+            "lost": self.lost.tolist(),
+        }
+
+
 @dataclass
 class SimulationReport:
     demand_served: float
     demand_lost: float
-    stockouts: List[StockoutEvent]
+    trace: SimulationTrace
+
+    @property
+    def stockout_periods(self) -> np.ndarray:
+        return np.flatnonzero(self.trace.lost > 0) + 1
+
+    @property
+    def stockouts(self) -> List[StockoutEvent]:
+        periods = self.stockout_periods
+        return [
+            StockoutEvent(time=float(period), shortfall=float(shortfall))
+            for period, shortfall in zip(periods, self.trace.lost[periods - 1])
+        ]
 
 
 def run_single_item_simulation(
@@ -28,13 +81,17 @@ def run_single_item_simulation(
     lead_time: int,
     seed: int | None = None,
 ) -> SimulationReport:
-    """Simulate a single-item inventory system with periodic demand."""
+    """Simulate a single-item inventory system with periodic demand.
+
+    The path is deterministic; ``seed`` is accepted for API compatibility.
+    Stochastic runs go through ``run_monte_carlo_simulation``. Per-period
+    state is written into preallocated arrays rather than event objects.
+    """
 
-    random.seed(seed)
     env = simpy.Environment()
 
     inventory = {"on_hand": initial_inventory, "on_order": 0.0}
-    stockouts: List[StockoutEvent] = []
+    trace = SimulationTrace.allocate(demand_profile)
     demand_served = 0.0
     demand_lost = 0.0
 
@@ -53,22 +110,26 @@ def run_single_item_simulation(
 
     def demand_process():  # type: ignore[no-untyped-def]
         nonlocal demand_served, demand_lost
-        for period, demand in enumerate(demand_profile, start=1):
+        for index, demand in enumerate(demand_profile):
             yield env.timeout(1)
             available = inventory["on_hand"]
             if available >= demand:
                 inventory["on_hand"] -= demand
                 demand_served += demand
+                trace.served[index] = demand
             else:
                 demand_served += available
                 shortfall = demand - available
                 demand_lost += shortfall
                 inventory["on_hand"] = 0.0
-                stockouts.append(StockoutEvent(time=period, shortfall=shortfall))
+                trace.served[index] = available
+                trace.lost[index] = shortfall
 
             projected = inventory["on_hand"] + inventory["on_order"]
             if projected <= reorder_point:
                 place_order(order_quantity)
+            trace.on_hand[index] = inventory["on_hand"]
+            trace.on_order[index] = inventory["on_order"]
 
     env.process(demand_process())
     env.run()
@@ -76,12 +137,13 @@ def run_single_item_simulation(
     return SimulationReport(
         demand_served=demand_served,
         demand_lost=demand_lost,
-        stockouts=stockouts,
+        trace=trace,
     )
 
 
 __all__ = [
     "SimulationReport",
+    "SimulationTrace",
     "StockoutEvent",
     "run_single_item_simulation",
-]
\ No newline at end of file
+]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+_DEFAULT_ALPHAS = np.linspace(0.01, 1.0, 100)
+# (series x alpha) cells per chunk; small enough for the working set to stay in cache.
+_MAX_CELLS = 32_768
+
+
+@dataclass
+class SESBatchResult:
+    """Best simple exponential smoothing fit per series.
+
+    ``level`` is the final smoothed level, i.e. the flat forecast for every
+    future period.
+    """
+
+    alpha: np.ndarray
+    initial_level: np.ndarray
+    level: np.ndarray
+    sse: np.ndarray
+
+
+def _fit_chunk(
+    data: np.ndarray, alphas: np.ndarray, estimate_initial: bool
+) -> Tuple[np.ndarray, ...]:
+    n_series = data.shape[0]
+    # Run the recursion from a zero initial level; every error is linear in the
+    # true initial level l0 with coefficient (1 - alpha)^t, so SSE is quadratic
+    # in l0 and follows from three running sums for any choice of l0.
+    level = np.zeros((n_series, alphas.size))
+    sum_ee = np.zeros_like(level)
+    sum_ec = np.zeros_like(level)
+    sum_cc = np.zeros(alphas.size)
+    decay = np.ones(alphas.size)
+    error = np.empty_like(level)
+    scratch = np.empty_like(level)
+
+    for observed in np.ascontiguousarray(data.T):
+        np.subtract(observed[:, np.newaxis], level, out=error)
+        np.multiply(error, error, out=scratch)
+        sum_ee += scratch
+        np.multiply(error, decay, out=scratch)
+        sum_ec += scratch
+        sum_cc += decay * decay
+        np.multiply(error, alphas, out=scratch)
+        level += scratch
+        decay = decay * (1.0 - alphas)
+
+    if estimate_initial:
+        initial = sum_ec / sum_cc
+    else:
+        initial = np.broadcast_to(data[:, :1], level.shape)
+    sse = sum_ee - 2.0 * initial * sum_ec + initial * initial * sum_cc
+    final = level + decay * initial
+
+    best = np.argmin(sse, axis=1)
+    rows = np.arange(n_series)
+    return alphas[best], initial[rows, best], final[rows, best], sse[rows, best]
+
+
+def ses_batch(
+    demand: ArrayLike,
+    alphas: ArrayLike | None = None,
+    chunk_size: int | None = None,
+    estimate_initial: bool = False,
+) -> SESBatchResult:
+    """Fit simple exponential smoothing to every row of a demand matrix.
+
+    All candidate ``alphas`` are evaluated for a chunk of series at once and
+    each series keeps the alpha with the lowest in-sample SSE. The initial
+    level is the first observation, as in the statsmodels path used by
+    ``_ets_forecast``; ``estimate_initial`` instead solves for the SSE-optimal
+    initial level per alpha. Rows are processed in chunks so memory stays
+    bounded.
+    """
+
+    data = np.asarray(demand, dtype=float)
+    if data.ndim == 1:
+        data = data[np.newaxis, :]
+    if data.ndim != 2 or data.shape[1] < 2:
+        msg = "Demand must be a (n_series x n_periods) array with at least two periods."
+        raise ValueError(msg)
+
+    grid = _DEFAULT_ALPHAS if alphas is None else np.asarray(alphas, dtype=float).ravel()
+    if grid.size == 0 or np.any((grid <= 0) | (grid > 1)):
+        msg = "Alpha grid must be non-empty with values in (0, 1]."
+        raise ValueError(msg)
+
+    rows = chunk_size or max(1, _MAX_CELLS // grid.size)
+    parts = [
+        _fit_chunk(data[start : start + rows], grid, estimate_initial)
+        for start in range(0, data.shape[0], rows)
+    ]
+    alpha, initial, level, sse = (np.concatenate(columns) for columns in zip(*parts))
+    return SESBatchResult(alpha=alpha, initial_level=initial, level=level, sse=sse)
+
+
+__all__ = ["SESBatchResult", "ses_batch"]
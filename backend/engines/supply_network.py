@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+
+from backend.data.models import SupplyNodePlanModel, SupplyPlanModel, SupplySourceModel
+
+
+@dataclass
+class SupplyNetwork:
+    """Array view of a supply plan's node graph.
+
+    Nodes are indexed in topological order (every upstream node comes before
+    the nodes it supplies). ``parent`` holds the index of the internal node
+    that supplies each node, or -1 when supply is external. Source attributes
+    describe each node's primary source: its internal supplier if it has one,
+    otherwise the first listed source.
+    """
+
+    node_ids: List[str]
+    parent: np.ndarray
+    depth: np.ndarray
+    lead_time_days: np.ndarray
+    reliability: np.ndarray
+    unit_cost: np.ndarray
+    demand: List[np.ndarray]
+
+    @property
+    def size(self) -> int:
+        return len(self.node_ids)
+
+    def children(self) -> List[List[int]]:
+        result: List[List[int]] = [[] for _ in self.node_ids]
+        for index, parent in enumerate(self.parent):
+            if parent >= 0:
+                result[int(parent)].append(index)
+        return result
+
+
+def primary_source(
+    node: SupplyNodePlanModel, node_ids: Dict[str, SupplyNodePlanModel]
+) -> SupplySourceModel | None:
+    """The node's internal supplier if it has one, otherwise its first listed source."""
+
+    internal = [source for source in node.supply_sources if source.supplier_id in node_ids]
+    if len(internal) > 1:
+        msg = f"Node {node.node_id} is supplied by more than one internal node."
+        raise ValueError(msg)
+    if internal:
+        return internal[0]
+    return node.supply_sources[0] if node.supply_sources else None
+
+
+def build_supply_network(plan: SupplyPlanModel) -> SupplyNetwork:
+    """Resolve internal supply links (``supplier_id`` equal to a ``node_id``) into a forest."""
+
+    if not plan.nodes:
+        msg = "Supply plan has no nodes."
+        raise ValueError(msg)
+    by_id = {node.node_id: node for node in plan.nodes}
+    if len(by_id) != len(plan.nodes):
+        msg = "Supply plan node identifiers must be unique."
+        raise ValueError(msg)
+
+    sources = {node.node_id: primary_source(node, by_id) for node in plan.nodes}
+    parent_of = {
+        node_id: source.supplier_id if source is not None and source.supplier_id in by_id else None
+        for node_id, source in sources.items()
+    }
+
+    depth: Dict[str, int] = {}
+    for node_id in by_id:
+        path: List[str] = []
+        current: str | None = node_id
+        while current is not None and current not in depth:
+            if current in path:
+                msg = f"Supply plan contains a supply cycle through node {current}."
+                raise ValueError(msg)
+            path.append(current)
+            current = parent_of[current]
+        base = -1 if current is None else depth[current]
+        for offset, visited in enumerate(reversed(path), start=1):
+            depth[visited] = base + offset
+
+    order = sorted(by_id, key=lambda node_id: depth[node_id])
+    position = {node_id: index for index, node_id in enumerate(order)}
+
+    def source_value(node_id: str, field: str, default: float) -> float:
+        source = sources[node_id]
+        value = getattr(source, field) if source is not None else None
+        return default if value is None else float(value)
+
+    return SupplyNetwork(
+        node_ids=order,
+        parent=np.array(
+            [position.get(parent_of[node_id] or "", -1) for node_id in order],
+            dtype=np.int64,
+        ),
+        depth=np.array([depth[node_id] for node_id in order], dtype=np.int64),
+        lead_time_days=np.array([source_value(node_id, "lead_time_days", 0.0) for node_id in order]),
+        reliability=np.array([source_value(node_id, "reliability_score", 1.0) for node_id in order]),
+        unit_cost=np.array([source_value(node_id, "unit_cost", np.nan) for node_id in order]),
+        demand=[
+            np.array([period.forecast_units for period in by_id[node_id].demand_profile], dtype=float)
+            for node_id in order
+        ],
+    )
+
+
+__all__ = ["SupplyNetwork", "build_supply_network", "primary_source"]
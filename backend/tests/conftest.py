@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List
 
 import pytest
 from fastapi.testclient import TestClient
@@ -16,4 +18,71 @@ def client() -> TestClient:
 
 @pytest.fixture(scope="session")
 def sample_series() -> List[float]:
-    return load_demand_series("SKU-001", "LOC-001")
\ No newline at end of file
+    return load_demand_series("SKU-001", "LOC-001")
+
+
+@pytest.fixture()
+def forecast_states(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "forecast_states.sqlite3"
+    monkeypatch.setenv("SUPPLYCHAINOS_FORECAST_STATE_PATH", str(path))
+    return path
+
+
+def _supply_node(
+    node_id: str,
+    units: List[float],
+    supplier: str = "SUP-EXT",
+    lead_time: float = 0,
+    policy: Dict[str, Any] | None = None,
+    **source: Any,
+) -> Dict[str, Any]:
+    return {
+        "node_id": node_id,
+        "name": node_id,
+        "demand_profile": [
+            {"period": f"2025-{month + 1:02d}", "forecast_units": value} for month, value in enumerate(units)
+        ],
+        "inventory_policy": {"policy_type": "qr", **(policy or {})},
+        "supply_sources": [{"supplier_id": supplier, "lead_time_days": lead_time, **source}],
+    }
+
+
+def _supply_plan_payload(nodes: List[Dict[str, Any]], **fields: Any) -> Dict[str, Any]:
+    return {
+        "id": "plan-network",
+        "sku": "SKU-NET",
+        "product_name": "Network",
+        "planning_horizon_start": "2025-01-01",
+        "planning_horizon_end": "2025-12-31",
+        "nodes": nodes,
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-01T00:00:00Z",
+        **fields,
+    }
+
+
+@pytest.fixture()
+def supply_node() -> Callable[..., Dict[str, Any]]:
+    """Factory for supply plan node payloads with monthly demand and a single source."""
+
+    return _supply_node
+
+
+@pytest.fixture()
+def supply_plan_payload() -> Callable[..., Dict[str, Any]]:
+    """Factory for supply plan payloads; keyword arguments override plan fields."""
+
+    return _supply_plan_payload
+
+
+@pytest.fixture()
+def supply_plan_store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Callable[[List[Dict[str, Any]]], Path]:
+    """Point the supply plan repository at a temporary file holding the given plans."""
+
+    def _store(plans: List[Dict[str, Any]]) -> Path:
+        store = tmp_path / "supply_plans.json"
+        store.write_text(json.dumps(plans), encoding="utf-8")
+        monkeypatch.setenv("SUPPLYCHAINOS_SUPPLY_PLANS_PATH", str(store))
+        return store
+
+    return _store
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.data.models import SupplyPlanModel
+from backend.engines.aggregate_planning import apply_aggregate_plan, plan_aggregate_supply
+
+
+@pytest.fixture()
+def aggregate_plan(supply_node: Callable[..., Dict], supply_plan_payload: Callable[..., Dict]) -> Dict:
+    return supply_plan_payload(
+        [
+            supply_node(
+                "store",
+                [120.0, 80.0, 150.0, 90.0, 60.0, 110.0],
+                "dc",
+                30,
+                {"safety_stock": 150.0},
+                unit_cost=2.0,
+                lot_size=25.0,
+            ),
+            supply_node("dc", [], "SUP-EXT", 0, {"safety_stock": 100.0}, unit_cost=5.0, min_order_qty=200.0),
+        ],
+        id="plan-aggregate",
+        sku="SKU-AGG",
+        product_name="Aggregate",
+        planning_horizon_end="2025-06-30",
+    )
+
+
+def test_aggregate_plan_respects_lots_and_minimums(aggregate_plan: Dict) -> None:
+    plan = SupplyPlanModel(**aggregate_plan)
+    result = plan_aggregate_supply(plan, order_cost=50.0, gap=0.0, threads=1)
+
+    assert result.status == "Optimal Solution Found"
+    store, dc = result.orders
+    assert np.allclose(store / 25.0, np.round(store / 25.0), atol=1e-6)
+    assert np.all((dc < 1e-6) | (dc >= 200.0 - 1e-6))
+    assert np.all(result.inventory >= -1e-6)
+
+    # Store stock: carried in + receipts (ordered one period earlier) - served demand.
+    demand = np.array([120.0, 80.0, 150.0, 90.0, 60.0, 110.0])
+    carried = np.concatenate([[150.0], result.inventory[0, :-1]])
+    receipts = np.concatenate([[0.0], store[:-1]])
+    served = demand - result.shortage[0]
+    assert np.allclose(carried + receipts - served, result.inventory[0], atol=1e-6)
+    # The DC ships whatever the store orders in the same period.
+    carried_dc = np.concatenate([[100.0], result.inventory[1, :-1]])
+    assert np.allclose(carried_dc + dc - store, result.inventory[1], atol=1e-6)
+    assert np.allclose(result.receipts[0], receipts)
+
+    nodes = apply_aggregate_plan(plan, result)
+    assert [event.planned_order_units for event in nodes[1].schedule] == pytest.approx(dc.round(2).tolist())
+
+
+def test_aggregate_plan_caps_orders_at_source_capacity(aggregate_plan: Dict) -> None:
+    payload = aggregate_plan
+    payload["nodes"][1]["supply_sources"][0].update({"min_order_qty": None, "max_order_qty": 40.0})
+    result = plan_aggregate_supply(SupplyPlanModel(**payload), time_limit_seconds=10)
+
+    assert np.all(result.orders[1] <= 40.0 + 1e-6)
+    assert result.shortage.sum() > 0
+
+
+def test_aggregate_plan_returns_feasible_plan_within_time_limit(
+    aggregate_plan: Dict, supply_node: Callable[..., Dict]
+) -> None:
+    rng = np.random.default_rng(7)
+    payload = aggregate_plan
+    payload["nodes"] = [supply_node("dc", [], "SUP-EXT", 30, lot_size=10.0)] + [
+        supply_node(f"store-{index}", rng.integers(0, 100, 52).astype(float).tolist(), "dc", lot_size=10.0)
+        for index in range(4)
+    ]
+    started = time.perf_counter()
+    result = plan_aggregate_supply(SupplyPlanModel(**payload), time_limit_seconds=2)
+
+    # Relaxation and MILP share the limit instead of getting it twice.
+    assert time.perf_counter() - started < 3.5
+
+    assert result.status in {"Optimal Solution Found", "Solution Found"}
+    assert np.allclose(result.orders / 10.0, np.round(result.orders / 10.0), atol=1e-6)
+    assert np.all(result.inventory >= -1e-6)
+    # Beyond the DC's first lead time, lot rounding is all that costs demand.
+    demand = np.array([[period["forecast_units"] for period in node["demand_profile"]] for node in payload["nodes"][1:]])
+    assert result.shortage[1:].sum() < 0.05 * demand.sum()
+
+
+def test_aggregate_plan_rejects_inconsistent_sources(aggregate_plan: Dict) -> None:
+    payload = aggregate_plan
+    payload["nodes"][1]["supply_sources"][0]["max_order_qty"] = 100.0
+    with pytest.raises(ValueError):
+        plan_aggregate_supply(SupplyPlanModel(**payload))
+
+
+def test_aggregate_plan_endpoint_persists_schedule(
+    client: TestClient, aggregate_plan: Dict, supply_plan_store: Callable[[List[Dict]], Path]
+) -> None:
+    supply_plan_store([aggregate_plan])
+
+    response = client.post("/supply-plans/plan-aggregate/aggregate-plan", json={"time_limit_seconds": 30})
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["periods"] == [f"2025-{month:02d}" for month in range(1, 7)]
+    assert [link["supplier_id"] for link in payload["links"]] == ["dc", "SUP-EXT"]
+    assert payload["unmet_demand"]["store"] == pytest.approx(0.0, abs=1e-6)
+    saved = client.get("/supply-plans/plan-aggregate").json()
+    assert len(saved["nodes"][0]["schedule"]) == 6
+
+    assert client.post("/supply-plans/unknown/aggregate-plan", json={}).status_code == 404
+    invalid = client.post("/supply-plans/plan-aggregate/aggregate-plan", json={"gap": 2})
+    assert invalid.status_code == 422
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from fastapi.testclient import TestClient
 
 from backend.api.main import app
@@ -51,4 +53,71 @@ def test_kpi_summary_endpoint() -> None:
     response = client.get("/kpi/summary")
     payload = response.json()
     assert response.status_code == 200
-    assert 0 <= payload["fill_rate"] <= 1
\ No newline at end of file
+    assert 0 <= payload["fill_rate"] <= 1
+
+
+def test_forecast_batch_endpoint_resolves_filter() -> None:
+    response = client.post(
+        "/forecast/batch",
+        json={"method": "naive", "horizon": 3, "product_id": "SKU-001", "max_workers": 1},
+    )
+    payload = response.json()
+    assert response.status_code == 200
+    assert payload["failed"] == 0
+    assert {item["series_id"] for item in payload["results"]} == {
+        "SKU-001:LOC-001",
+        "SKU-001:LOC-002",
+    }
+
+
+def test_forecast_update_endpoint(forecast_states) -> None:
+    series = load_demand_series("SKU-001", "LOC-001")
+    response = client.post(
+        "/forecast/update",
+        json={
+            "method": "ets",
+            "series": series[:-1],
+            "new_observations": series[-1:],
+            "horizon": 3,
+        },
+    )
+    assert response.status_code == 200
+    assert len(response.json()["forecast"]) == 3
+
+
+def test_forecast_batch_stream_yields_ndjson_lines() -> None:
+    series = load_demand_series("SKU-001", "LOC-001")
+    with client.stream(
+        "POST",
+        "/forecast/batch/stream",
+        json={
+            "method": "naive",
+            "horizon": 3,
+            "series": [{"series_id": "a", "series": series}, {"series_id": "b", "series": series[:3]}],
+            "max_workers": 2,
+        },
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    by_id = {line["series_id"]: line for line in lines}
+    assert len(by_id["a"]["result"]["forecast"]) == 3
+    assert by_id["b"]["error"]
+
+
+def test_inventory_simulation_stream() -> None:
+    scenario = {
+        "demand_profile": [40, 60, 80, 100],
+        "initial_inventory": 120,
+        "reorder_point": 60,
+        "order_quantity": 100,
+        "lead_time": 2,
+    }
+    response = client.post(
+        "/inventory/simulate/stream",
+        json={"scenarios": [{**scenario, "scenario_id": "base"}, {**scenario, "scenario_id": "lean", "initial_inventory": 0}]},
+    )
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["scenario_id"] for line in lines] == ["base", "lean"]
+    assert lines[1]["result"]["demand_lost"] > lines[0]["result"]["demand_lost"]
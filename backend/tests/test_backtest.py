@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from backend.data.models import ForecastMethod
+from backend.engines.backtest import rolling_origins, run_backtest
+from backend.engines.forecasting import (
+    calculate_metrics,
+    clear_forecast_cache,
+    fit_forecast,
+    forecast_cache_stats,
+)
+
+
+def test_rolling_origins_are_views() -> None:
+    data = np.arange(20, dtype=float).reshape(2, 10)
+    origins, windows = rolling_origins(data, horizon=3, min_train_size=4, step=2)
+
+    assert origins.tolist() == [4, 6]
+    assert windows.shape == (2, 2, 3)
+    assert np.shares_memory(windows, data)
+    np.testing.assert_array_equal(windows[1, 1], data[1, 6:9])
+
+
+@pytest.mark.parametrize("method", [ForecastMethod.NAIVE, ForecastMethod.CROSTON])
+def test_vectorized_backtest_matches_per_origin_metrics(method) -> None:
+    rng = np.random.default_rng(3)
+    data = np.where(rng.random((5, 24)) < 0.5, rng.poisson(20, (5, 24)), 0).astype(float)
+    result = run_backtest(method, data, horizon=4, min_train_size=6)
+
+    for row, series in enumerate(data):
+        for col, origin in enumerate(result.origins):
+            train = series[:origin]
+            forecast, _ = fit_forecast(method, train, 4)
+            expected = calculate_metrics(train, series[origin : origin + 4], forecast)
+            assert result.mape[row, col] == pytest.approx(expected.mape)
+            assert result.mase[row, col] == pytest.approx(expected.mase)
+            assert result.bias[row, col] == pytest.approx(expected.bias)
+
+
+def test_model_backtest_bypasses_fit_cache(sample_series) -> None:
+    clear_forecast_cache()
+    result = run_backtest(ForecastMethod.ETS, sample_series, horizon=2, min_train_size=6)
+
+    assert not np.isnan(result.mase).all()
+    assert forecast_cache_stats().size == 0
+
+
+def test_backtest_endpoint(client, sample_series) -> None:
+    response = client.post(
+        "/forecast/backtest",
+        json={"methods": ["naive", "ets"], "series": sample_series, "horizon": 2, "min_train_size": 6},
+    )
+    payload = response.json()
+    assert response.status_code == 200
+    assert [item["method"] for item in payload["results"]] == ["naive", "ets"]
+    assert payload["results"][0]["origins"] == [6, 7, 8, 9, 10]
+    assert payload["results"][1]["aggregate"]["mase"] >= 0
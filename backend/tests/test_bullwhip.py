@@ -1,10 +1,120 @@
 from __future__ import annotations
 
-from backend.engines.bullwhip import compute_bullwhip_index
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.data.models import SupplyPlanModel
+from backend.engines.bullwhip import (
+    BullwhipTracker,
+    RollingMoments,
+    bullwhip_table,
+    compute_bullwhip_index,
+    echelon_frame,
+)
 
 
 def test_bullwhip_amplification_calculated() -> None:
     demand = [100, 110, 120, 115, 130]
     orders = [105, 120, 135, 125, 140]
     response = compute_bullwhip_index(demand, orders)
-    assert response.amplification_index > 1
\ No newline at end of file
+    assert response.amplification_index > 1
+
+
+def test_running_moments_match_numpy() -> None:
+    rng = np.random.default_rng(0)
+    demand = rng.normal(100, 10, 500)
+    orders = demand * 1.5 + rng.normal(0, 5, 500)
+    tracker = BullwhipTracker.create(alpha=0.1, window=52)
+    for demand_value, order_value in zip(demand, orders):
+        tracker.push(demand_value, order_value)
+
+    snapshot = tracker.snapshot("SKU-001", "dc")
+    expected = compute_bullwhip_index(demand, orders).amplification_index
+    assert snapshot.amplification_index == pytest.approx(expected)
+    rolling = np.var(orders[-52:], ddof=1) / np.var(demand[-52:], ddof=1)
+    assert snapshot.rolling_amplification_index == pytest.approx(rolling)
+    assert snapshot.ew_amplification_index is not None
+
+
+def test_rolling_window_memory_is_bounded() -> None:
+    moments = RollingMoments(window=4)
+    for value in range(1_000):
+        moments.push(float(value))
+    assert moments.variance == pytest.approx(np.var([996, 997, 998, 999], ddof=1))
+    assert moments.count == 1_000
+
+
+def test_bullwhip_monitor_endpoints(client) -> None:
+    client.delete("/bullwhip/monitor/SKU-MON/store")
+    first = client.post(
+        "/bullwhip/monitor/SKU-MON/store",
+        json={"demand": [100, 110], "orders": [100, 130], "window": 4},
+    )
+    assert first.status_code == 200
+    second = client.post("/bullwhip/monitor/SKU-MON/store", json={"demand": [95, 120], "orders": [80, 150]})
+    payload = second.json()
+    assert payload["observations"] == 4
+    assert payload["amplification_index"] > 1
+    assert payload["rolling_amplification_index"] == pytest.approx(payload["amplification_index"])
+
+    assert client.get("/bullwhip/monitor/SKU-MON/store").json()["observations"] == 4
+    assert client.delete("/bullwhip/monitor/SKU-MON/store").status_code == 200
+    assert client.get("/bullwhip/monitor/SKU-MON/store").status_code == 404
+
+
+def test_bullwhip_table_matches_pairwise_index() -> None:
+    rng = np.random.default_rng(1)
+    frames = []
+    for index, scale in enumerate([1.0, 3.0, 0.5]):
+        demand = rng.normal(100, 10, 24)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "product_id": f"SKU-{index}",
+                    "location_id": "LOC-001",
+                    "demand": demand,
+                    "orders": demand * scale + rng.normal(0, 1, 24),
+                }
+            )
+        )
+    frame = pd.concat(frames, ignore_index=True)
+    table = bullwhip_table(frame, ["product_id", "location_id"])
+
+    assert table["product_id"].tolist() == ["SKU-1", "SKU-0", "SKU-2"]
+    assert table["rank"].tolist() == [1, 2, 3]
+    expected = compute_bullwhip_index(frames[1]["demand"], frames[1]["orders"]).amplification_index
+    assert table.loc[0, "amplification_index"] == pytest.approx(expected)
+
+
+def test_bullwhip_batch_endpoint(client) -> None:
+    response = client.post(
+        "/bullwhip/diagnostics/batch",
+        json={
+            "product_id": ["SKU-A"] * 4 + ["SKU-B"] * 4 + ["SKU-C"],
+            "location_id": ["LOC-1"] * 9,
+            "demand": [10, 12, 11, 13, 10, 12, 11, 13, 5],
+            "orders": [10, 12, 11, 13, 5, 20, 2, 25, 5],
+            "top": 2,
+        },
+    )
+    payload = response.json()
+    assert response.status_code == 200
+    assert payload["keys"]["product_id"] == ["SKU-B", "SKU-A"]
+    assert payload["amplification_index"][1] == pytest.approx(1.0)
+
+
+def test_echelon_frame_pairs_demand_with_planned_orders(
+    supply_node: Callable[..., Dict], supply_plan_payload: Callable[..., Dict]
+) -> None:
+    store = supply_node("store", [100.0, 110.0, 90.0, 105.0], "dc")
+    store["schedule"] = [
+        {"period": f"2025-0{month}", "planned_order_units": units}
+        for month, units in enumerate([150, 60, 140, 80], start=1)
+    ]
+    plan = SupplyPlanModel(**supply_plan_payload([store, supply_node("dc", [])], id="plan-bw"))
+    table = bullwhip_table(echelon_frame([plan]), ["plan_id", "supplier_id", "node_id"])
+    assert table[["supplier_id", "node_id"]].values.tolist() == [["dc", "store"]]
+    assert table["amplification_index"].to_numpy()[0] > 1
@@ -2,8 +2,20 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+import pytest
+
+from backend.data import forecast_state_repository
 from backend.data.models import ForecastMethod
-from backend.engines.forecasting import run_forecast
+from backend.engines import forecasting
+from backend.engines.forecasting import (
+    _FitCache,
+    clear_forecast_cache,
+    forecast_cache_stats,
+    run_forecast,
+    run_forecast_batch,
+    update_forecast,
+)
 
 
 def test_naive_forecast_returns_horizon(sample_series) -> None:
@@ -22,4 +34,124 @@ def test_ets_forecast_produces_metrics(sample_series) -> None:
 def test_arima_forecast_generates_values(sample_series) -> None:
     response = run_forecast(ForecastMethod.ARIMA, sample_series, horizon=4)
     assert len(response.forecast) == 4
-    assert response.model_summary["sigma2"] >= 0
\ No newline at end of file
+    assert response.model_summary["sigma2"] >= 0
+
+
+def test_forecast_batch_reports_errors_per_series(sample_series) -> None:
+    series = {
+        "good": sample_series,
+        "too-short": sample_series[:3],
+        "also-good": [float(v) * 2 for v in sample_series],
+    }
+    results = run_forecast_batch(ForecastMethod.ETS, series, horizon=4, max_workers=2)
+
+    assert [item.series_id for item in results] == ["good", "too-short", "also-good"]
+    assert results[0].result is not None and len(results[0].result.forecast) == 4
+    assert results[1].result is None and results[1].error
+    assert results[2].error is None
+
+
+def test_repeat_arima_forecast_reuses_cached_fit(sample_series) -> None:
+    clear_forecast_cache()
+    first = run_forecast(ForecastMethod.ARIMA, sample_series, horizon=4)
+    second = run_forecast(ForecastMethod.ARIMA, sample_series, horizon=4)
+
+    stats = forecast_cache_stats()
+    assert stats.misses == 1
+    assert stats.hits == 1
+    assert first.forecast == second.forecast
+
+
+def test_fit_cache_evicts_least_recent_and_expires() -> None:
+    cache = _FitCache(maxsize=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    expired = _FitCache(maxsize=2, ttl_seconds=-1)
+    expired.put("a", 1)
+    assert expired.get("a") is None
+
+
+def test_update_forecast_filters_stored_state(sample_series, forecast_states, monkeypatch) -> None:
+    clear_forecast_cache()
+    history, new_observations = sample_series[:-1], sample_series[-1:]
+    update_forecast(ForecastMethod.ARIMA, history[:-1], history[-1:], horizon=3)
+
+    def _no_refit(train):
+        raise AssertionError("stored state should be reused")
+
+    monkeypatch.setattr(forecasting, "_fit_arima", _no_refit)
+    updated = update_forecast(
+        ForecastMethod.ARIMA, history, new_observations, horizon=3, interval_paths=500
+    )
+    monkeypatch.undo()
+    assert len(updated.forecast) == 3
+    assert updated.intervals is not None
+    assert updated.intervals["p95"] != updated.intervals["p50"]
+
+    # Filtered fits never replace the cached fit of the full window.
+    repeat = run_forecast(ForecastMethod.ARIMA, sample_series, horizon=3)
+    assert forecast_cache_stats().hits == 0
+    assert repeat.forecast != updated.forecast
+
+
+@pytest.mark.parametrize("method", [ForecastMethod.ETS, ForecastMethod.ARIMA])
+def test_update_forecast_keeps_stored_residuals_bounded(
+    method, forecast_states, monkeypatch
+) -> None:
+    monkeypatch.setattr(forecasting, "_MAX_STORED_RESIDUALS", 12)
+    series = (50 + 10 * np.sin(np.arange(60) / 3.0)).tolist()
+    for end in range(30, 60, 5):
+        update_forecast(method, series[:end], series[end : end + 5], horizon=3)
+
+    train = np.asarray(series[:-3], dtype=float)
+    state = forecast_state_repository.get_state(forecasting._fingerprint(method, train))
+    assert state is not None
+    assert len(state.residuals) == 12
+
+
+def test_update_ets_continues_smoothing(sample_series, forecast_states) -> None:
+    history, new_observations = sample_series[:-2], sample_series[-2:]
+    updated = update_forecast(ForecastMethod.ETS, history, new_observations, horizon=2)
+    alpha = updated.model_summary["alpha"]
+    assert 0 < alpha <= 1
+    assert len(set(updated.forecast)) == 1
+
+
+def test_auto_forecast_selects_lowest_mase(sample_series) -> None:
+    response = run_forecast(ForecastMethod.AUTO, sample_series, horizon=4)
+    report = response.selection
+
+    assert report is not None
+    assert report.demand_class == "smooth"
+    assert response.metrics.mase == min(report.scores.values())
+    assert set(report.timings_ms) == {method.value for method in report.fitted}
+
+
+def test_auto_forecast_prunes_arima_for_intermittent_demand() -> None:
+    series = [0, 0, 12, 0, 0, 0, 30, 0, 0, 5, 0, 0, 0, 22, 0, 0]
+    report = run_forecast(ForecastMethod.AUTO, series, horizon=4).selection
+
+    assert report is not None
+    assert report.demand_class in ("intermittent", "lumpy")
+    assert ForecastMethod.ARIMA not in report.fitted
+    assert "arima" in report.skipped
+
+
+def test_prediction_intervals_are_ordered_and_reproducible(sample_series) -> None:
+    for method in (ForecastMethod.NAIVE, ForecastMethod.CROSTON, ForecastMethod.ARIMA):
+        first = run_forecast(method, sample_series, horizon=4, interval_paths=500, interval_seed=3)
+        again = run_forecast(method, sample_series, horizon=4, interval_paths=500, interval_seed=3)
+
+        assert first.intervals == again.intervals
+        for p50, p90, p95 in zip(first.intervals["p50"], first.intervals["p90"], first.intervals["p95"]):
+            assert p50 <= p90 <= p95
+
+    naive = run_forecast(ForecastMethod.NAIVE, sample_series, horizon=4, interval_paths=500)
+    widths = [high - low for high, low in zip(naive.intervals["p95"], naive.intervals["p50"])]
+    assert widths[-1] > widths[0]
+    assert run_forecast(ForecastMethod.NAIVE, sample_series, horizon=4).intervals == {}
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import numpy as np
+
+from backend.engines.forecasting import _croston_forecast
+from backend.engines.intermittent import intermittent_forecast_batch
+
+
+def _intermittent_matrix() -> np.ndarray:
+    rng = np.random.default_rng(7)
+    sizes = rng.poisson(12, size=(40, 30)).astype(float)
+    occurs = rng.random((40, 30)) < 0.3
+    demand = np.where(occurs, sizes, 0.0)
+    demand[0] = 0.0
+    return demand
+
+
+def test_croston_batch_matches_scalar_path() -> None:
+    demand = _intermittent_matrix()
+    alpha = np.linspace(0.05, 0.5, demand.shape[0])
+
+    result = intermittent_forecast_batch(demand, alpha=alpha)
+
+    for row, series_alpha, batched in zip(demand, alpha, result.croston):
+        expected, _ = _croston_forecast(row, 1, alpha=float(series_alpha))
+        assert batched == expected[0]
+    assert result.croston[0] == 0.0
+
+
+def test_sba_and_tsb_estimates() -> None:
+    demand = np.array([[0.0, 10.0, 0.0, 0.0, 10.0, 0.0], [5.0, 5.0, 5.0, 5.0, 5.0, 5.0]])
+    result = intermittent_forecast_batch(demand, alpha=0.2)
+
+    np.testing.assert_allclose(result.sba, result.croston * 0.9)
+    assert result.tsb[1] == 5.0
+    assert 0 < result.tsb[0] < 10.0
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from typing import Dict, List
+
+import pytest
+
 from backend.data.models import InventoryMethod, InventoryPolicyRequest
-from backend.engines.inventory import compute_policy
+from backend.engines.inventory import compute_policy, compute_policy_batch, service_level_frontier
 
 
 def test_eoq_policy_calculates_quantity() -> None:
@@ -39,4 +43,114 @@ def test_newsvendor_returns_level() -> None:
         overage_cost=2,
     )
     response = compute_policy(request)
-    assert 0 < response.policy["critical_ratio"] < 1
\ No newline at end of file
+    assert 0 < response.policy["critical_ratio"] < 1
+
+
+def test_batch_policy_matches_per_request_path() -> None:
+    columns: Dict[str, List[float | None]] = {
+        "demand_rate": [400.0, 120.0, 35.5],
+        "lead_time": [2.0, 1.5, 4.0],
+        "demand_std": [30.0, 12.0, 9.0],
+        "service_level": [0.95, 0.9, 0.99],
+        "annual_demand": [12000.0, None, 900.0],
+        "ordering_cost": [150.0, None, 40.0],
+        "holding_cost": [3.0, None, 1.2],
+        "underage_cost": [10.0, None, 4.0],
+        "overage_cost": [2.0, None, 1.0],
+    }
+    for method in InventoryMethod:
+        if method is InventoryMethod.EOQ:
+            rows = [0, 2]
+            batch = compute_policy_batch(method, {name: [values[i] for i in rows] for name, values in columns.items()})
+        else:
+            rows = [0, 1, 2]
+            batch = compute_policy_batch(method, columns)
+        for position, row in enumerate(rows):
+            request = InventoryPolicyRequest(method=method, **{name: values[row] for name, values in columns.items()})
+            for name, value in compute_policy(request).policy.items():
+                assert batch[name][position] == value
+
+
+def test_batch_policy_reports_missing_rows() -> None:
+    with pytest.raises(ValueError, match="annual_demand"):
+        compute_policy_batch(
+            InventoryMethod.EOQ,
+            {"annual_demand": [100.0, None], "ordering_cost": [10.0, 10.0], "holding_cost": [1.0, 1.0]},
+        )
+
+
+def test_batch_newsvendor_rejects_zero_costs() -> None:
+    with pytest.raises(ValueError, match="rows 1"):
+        compute_policy_batch(
+            InventoryMethod.NEWSVENDOR,
+            {
+                "demand_rate": [100.0, 80.0],
+                "demand_std": [10.0, 8.0],
+                "underage_cost": [4.0, 0.0],
+                "overage_cost": [1.0, 0.0],
+            },
+        )
+
+
+def test_batch_policy_endpoint(client) -> None:
+    response = client.post(
+        "/inventory/policy/batch",
+        json={"method": "qr", "sku": ["A", "B"], "demand_rate": [400, 50], "lead_time": [2, 3], "demand_std": [30, 5]},
+    )
+    payload = response.json()
+    assert response.status_code == 200
+    assert payload["sku"] == ["A", "B"]
+    assert len(payload["policy"]["reorder_point"]) == 2
+
+
+def test_newsvendor_frontier_minimum_at_critical_ratio() -> None:
+    frontier = service_level_frontier(
+        InventoryMethod.NEWSVENDOR,
+        {"demand_std": [10.0, 25.0], "underage_cost": [8.0, 1.0], "overage_cost": [2.0, 1.0]},
+        [round(0.5 + 0.01 * step, 2) for step in range(50)],
+    )
+    assert frontier.total_cost.shape == (2, 50)
+    assert frontier.optimal_service_level.tolist() == [0.8, 0.5]
+
+
+def test_qr_frontier_endpoint(client) -> None:
+    response = client.post(
+        "/inventory/policy/frontier",
+        json={
+            "method": "qr",
+            "annual_demand": [12000, 3000],
+            "demand_rate": [400, 100],
+            "lead_time": [2, 1],
+            "demand_std": [30, 20],
+            "holding_cost": [3, 1],
+            "ordering_cost": [150, 80],
+            "shortage_cost": [20, 2],
+            "service_levels": [0.8, 0.9, 0.95, 0.99],
+        },
+    )
+    payload = response.json()
+    assert response.status_code == 200
+    assert len(payload["safety_stock"][0]) == 4
+    assert payload["safety_stock"][0] == sorted(payload["safety_stock"][0])
+    assert payload["optimal_service_level"][0] >= payload["optimal_service_level"][1]
+
+
+def test_qr_frontier_handles_zero_demand_sku(client) -> None:
+    response = client.post(
+        "/inventory/policy/frontier",
+        json={
+            "method": "qr",
+            "annual_demand": [1000, 0],
+            "demand_rate": [20, 0],
+            "lead_time": [2, 2],
+            "demand_std": [5, 0],
+            "holding_cost": [1, 1],
+            "ordering_cost": [50, 50],
+            "shortage_cost": [10, 10],
+            "service_levels": [0.9, 0.95],
+        },
+    )
+    payload = response.json()
+    assert response.status_code == 200
+    assert payload["optimal_total_cost"][1] == 0.0
+    assert payload["optimal_total_cost"][0] > 0
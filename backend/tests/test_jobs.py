@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.data import job_repository
+from backend.data.models import JobModel, JobStatus
+from backend.engines.jobs import JobQueue
+
+
+def _double(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {"value": payload["value"] * 2}
+
+
+def _sleep(payload: Dict[str, Any]) -> Dict[str, Any]:
+    time.sleep(payload["seconds"])
+    return {}
+
+
+def _fail(payload: Dict[str, Any]) -> Dict[str, Any]:
+    msg = "Bad scenario."
+    raise ValueError(msg)
+
+
+@pytest.fixture()
+def jobs_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "jobs.sqlite3"
+    monkeypatch.setenv("SUPPLYCHAINOS_JOBS_PATH", str(path))
+    return path
+
+
+@pytest.fixture()
+def queue(jobs_path: Path) -> Iterator[JobQueue]:
+    queue = JobQueue(workers=1)
+    queue.register("double", _double)
+    queue.register("sleep", _sleep)
+    queue.register("fail", _fail)
+    yield queue
+    queue.shutdown()
+
+
+def _wait(queue: JobQueue, job_id: str, timeout: float) -> JobModel:
+    job = queue.wait(job_id, timeout)
+    assert job is not None
+    return job
+
+
+def test_new_queue_fails_jobs_left_unfinished(jobs_path: Path) -> None:
+    running = job_repository.create_job("double", {"value": 1})
+    job_repository.mark_running(running.id)
+    queued = job_repository.create_job("double", {"value": 2})
+
+    JobQueue(workers=1)
+
+    for job_id in (running.id, queued.id):
+        job = job_repository.get_job(job_id)
+        assert job is not None
+        assert job.status == JobStatus.FAILED
+        assert job.error and "restarted" in job.error
+
+
+def test_jobs_run_in_order_and_persist_results(queue: JobQueue) -> None:
+    first = queue.submit("double", {"value": 2})
+    second = queue.submit("double", {"value": 5})
+
+    assert _wait(queue, first.id, 30).result == {"value": 4}
+    finished = _wait(queue, second.id, 30)
+    assert finished.status == JobStatus.SUCCEEDED
+    assert finished.result == {"value": 10}
+    assert finished.started_at is not None and finished.finished_at is not None
+
+    failed = _wait(queue, queue.submit("fail", {}).id, 30)
+    assert failed.status == JobStatus.FAILED
+    assert failed.error == "Bad scenario."
+
+    with pytest.raises(ValueError):
+        queue.submit("unknown", {})
+
+
+def test_cancel_stops_running_job_and_frees_worker(queue: JobQueue) -> None:
+    running = queue.submit("sleep", {"seconds": 60})
+    queued = queue.submit("double", {"value": 1})
+    assert _wait(queue, queued.id, 0.2).status == JobStatus.QUEUED
+
+    started = time.monotonic()
+    cancelled = queue.cancel(running.id)
+    assert cancelled is not None
+    assert cancelled.status == JobStatus.CANCELLED
+    assert _wait(queue, queued.id, 30).status == JobStatus.SUCCEEDED
+    assert time.monotonic() - started < 30
+
+    # Finished jobs are left as they are.
+    finished = queue.cancel(queued.id)
+    assert finished is not None
+    assert finished.status == JobStatus.SUCCEEDED
+
+
+def test_jobs_endpoints(client: TestClient, jobs_path: Path) -> None:
+    request = {
+        "demand_profile": [40, 55, 60, 35],
+        "initial_inventory": 80,
+        "reorder_point": 50,
+        "order_quantity": 100,
+        "lead_time": 1,
+    }
+    response = client.post("/jobs/", json={"kind": "inventory.simulate", "payload": request})
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+
+    job = client.get(f"/jobs/{job_id}", params={"wait": 30}).json()
+    assert job["status"] == "succeeded"
+    assert job["result"] == client.post("/inventory/simulate", json=request).json()
+    assert [item["id"] for item in client.get("/jobs/", params={"status": "succeeded"}).json()] == [job_id]
+    assert client.delete(f"/jobs/{job_id}").json()["status"] == "succeeded"
+    assert "inventory.monte-carlo" in client.get("/jobs/kinds").json()
+
+    assert client.post("/jobs/", json={"kind": "unknown"}).status_code == 400
+    invalid = {"kind": "inventory.simulate", "payload": {"demand_profile": []}}
+    assert client.post("/jobs/", json=invalid).status_code == 422
+    missing_plan = {"kind": "supply-plans.simulate", "payload": {}}
+    assert client.post("/jobs/", json=missing_plan).status_code == 400
+    assert client.get("/jobs/unknown").status_code == 404
+    assert client.delete("/jobs/unknown").status_code == 404
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import itertools
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from scipy.stats import norm  # type: ignore[import-untyped]
+
+from backend.data.models import SupplyPlanModel
+from backend.engines.multi_echelon import apply_placement, optimize_safety_stock
+from backend.engines.supply_network import build_supply_network
+
+
+@pytest.fixture()
+def network_plan(supply_node: Callable[..., Dict], supply_plan_payload: Callable[..., Dict]) -> Dict:
+    return supply_plan_payload(
+        [
+            supply_node("store", [300.0, 360.0, 240.0], "dc-north", 2, {"service_level": 0.95}, unit_cost=10.0),
+            supply_node("dc-north", [], "plant", 3, {"service_level": 0.95}, unit_cost=10.0),
+            supply_node("dc-south", [600.0, 500.0, 800.0], "plant", 5, {"service_level": 0.95}, unit_cost=12.0),
+            supply_node("plant", [], "SUP-EXT", 10, {"service_level": 0.95}, unit_cost=6.0),
+        ]
+    )
+
+
+def test_network_is_topologically_ordered(network_plan: Dict) -> None:
+    network = build_supply_network(SupplyPlanModel(**network_plan))
+    assert network.node_ids[0] == "plant"
+    for index, parent in enumerate(network.parent):
+        assert parent < index
+    assert network.depth[network.node_ids.index("store")] == 2
+
+
+def test_network_rejects_cycles(
+    supply_node: Callable[..., Dict], supply_plan_payload: Callable[..., Dict]
+) -> None:
+    nodes = [supply_node("a", [10.0], "b", 1), supply_node("b", [], "a", 1)]
+    with pytest.raises(ValueError):
+        build_supply_network(SupplyPlanModel(**supply_plan_payload(nodes)))
+
+
+def test_placement_matches_exhaustive_search(network_plan: Dict) -> None:
+    plan = SupplyPlanModel(**network_plan)
+    placement = optimize_safety_stock(plan)
+    network = build_supply_network(plan)
+
+    lead = network.lead_time_days.astype(int)
+    customer_facing = [units.size > 0 for units in network.demand]
+    variance = np.array([units.var(ddof=1) / 30.0 if units.size > 1 else 0.0 for units in network.demand])
+    for index in range(network.size - 1, -1, -1):
+        if network.parent[index] >= 0:
+            variance[network.parent[index]] += variance[index]
+    coefficient = 0.25 * network.unit_cost * norm.ppf(0.95) * np.sqrt(variance)
+
+    best = np.inf
+    for outbound in itertools.product(range(21), repeat=network.size):
+        if any(facing and service > 0 for facing, service in zip(customer_facing, outbound)):
+            continue
+        inbound = [outbound[parent] if parent >= 0 else 0 for parent in network.parent]
+        net = np.array(inbound) + lead - np.array(outbound)
+        if np.all(net >= 0):
+            best = min(best, float(np.sum(coefficient * np.sqrt(net))))
+
+    assert placement.total_holding_cost == pytest.approx(best)
+    assert placement.outbound_service_days[network.node_ids.index("store")] == 0
+    assert np.all(placement.net_replenishment_days >= 0)
+
+
+def test_apply_placement_updates_policies(network_plan: Dict) -> None:
+    plan = SupplyPlanModel(**network_plan)
+    placement = optimize_safety_stock(plan)
+    nodes = apply_placement(plan, placement)
+    assert [node.node_id for node in nodes] == [node.node_id for node in plan.nodes]
+    assert all(node.inventory_policy.safety_stock is not None for node in nodes)
+
+
+def test_safety_stock_endpoint_persists(
+    client: TestClient, network_plan: Dict, supply_plan_store: Callable[[List[Dict]], Path]
+) -> None:
+    supply_plan_store([network_plan])
+
+    response = client.post("/supply-plans/plan-network/safety-stock", json={"max_service_time_days": 0})
+    assert response.status_code == 200
+    payload = response.json()
+    assert len(payload["nodes"]) == 4
+    assert payload["plan"]["version"] == 2
+    saved = client.get("/supply-plans/plan-network").json()
+    assert saved["nodes"][0]["inventory_policy"]["safety_stock"] is not None
+
+    missing = client.post("/supply-plans/unknown/safety-stock", json={})
+    assert missing.status_code == 404
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.data.models import SupplyPlanModel
+from backend.engines.network_simulation import simulate_supply_network
+
+
+@pytest.fixture()
+def chain_plan(supply_node: Callable[..., Dict], supply_plan_payload: Callable[..., Dict]) -> Dict:
+    return supply_plan_payload(
+        [
+            supply_node("store", [400.0, 480.0, 360.0], "dc", 7, reliability_score=0.9),
+            supply_node("dc", [], "plant", 14, reliability_score=0.9),
+            supply_node("plant", [], "SUP-EXT", 21, reliability_score=0.9),
+        ]
+    )
+
+
+def test_network_simulation_reports_per_node_metrics(chain_plan: Dict) -> None:
+    plan = SupplyPlanModel(**chain_plan)
+    report = simulate_supply_network(plan, periods=52, demand_cv=0.3, seed=4)
+
+    assert report.node_ids == ["plant", "dc", "store"]
+    assert report.orders.shape == (52, 3)
+    assert np.all((report.fill_rate >= 0) & (report.fill_rate <= 1))
+    assert report.external_lost[2] <= report.external_demand[2]
+    assert report.external_demand[:2].sum() == 0
+    # The DC sees the store's orders one period after they are placed.
+    assert np.array_equal(report.demand[1:, 1], report.orders[:-1, 2])
+
+
+def test_network_simulation_is_reproducible(chain_plan: Dict) -> None:
+    plan = SupplyPlanModel(**chain_plan)
+    first = simulate_supply_network(plan, demand_cv=0.2, seed=9)
+    second = simulate_supply_network(plan, demand_cv=0.2, seed=9)
+    assert np.array_equal(first.orders, second.orders)
+
+
+def test_ample_stock_never_stocks_out(
+    supply_node: Callable[..., Dict], supply_plan_payload: Callable[..., Dict]
+) -> None:
+    nodes = [
+        supply_node("store", [100.0], "dc", 7, {"reorder_point": 1_000.0, "order_quantity": 1_000.0}),
+        supply_node("dc", [], "SUP-EXT", 7, {"reorder_point": 10_000.0, "order_quantity": 10_000.0}),
+    ]
+    report = simulate_supply_network(SupplyPlanModel(**supply_plan_payload(nodes)), periods=30)
+    assert report.stockout_periods.sum() == 0
+    assert report.external_lost.sum() == 0
+
+
+def test_simulate_supply_plan_endpoint(
+    client: TestClient, chain_plan: Dict, supply_plan_store: Callable[[List[Dict]], Path]
+) -> None:
+    supply_plan_store([chain_plan])
+
+    response = client.post("/supply-plans/plan-network/simulate", json={"periods": 26, "seed": 1})
+    assert response.status_code == 200
+    payload = response.json()
+    assert [node["node_id"] for node in payload["nodes"]] == ["plant", "dc", "store"]
+    assert client.post("/supply-plans/unknown/simulate", json={}).status_code == 404
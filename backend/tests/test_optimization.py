@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import numpy as np
+import pytest
+from scipy import sparse  # type: ignore[import-untyped]
+
+from backend.engines import optimization
 from backend.engines.optimization import (
     CapacityConstraint,
+    MakeToOrderSession,
     Product,
     solve_make_to_order,
+    solve_make_to_order_scenarios,
+    solve_make_to_order_sparse,
+    solve_sparse_milp,
 )
 
 
@@ -30,4 +39,186 @@ def test_make_to_order_solution() -> None:
     assert result.objective > 0
     assert result.production_plan["A"] >= 0
     assert result.production_plan["B"] >= 0
-    assert "machine" in result.shadow_prices
\ No newline at end of file
+    assert "machine" in result.shadow_prices
+
+
+def test_sparse_build_matches_product_path() -> None:
+    rng = np.random.default_rng(0)
+    usage = sparse.random(6, 20, density=0.3, random_state=2, format="csr") * 4
+    usage = usage + sparse.csr_matrix((np.ones(20), (np.arange(20) % 6, np.arange(20))), shape=(6, 20))
+    margins = rng.uniform(10, 50, 20)
+    limits = rng.uniform(50, 150, 6)
+    product_names = [f"P{index}" for index in range(20)]
+    capacity_names = [f"R{index}" for index in range(6)]
+
+    dense = usage.toarray()
+    products = [
+        Product(
+            name=name,
+            contribution_margin=float(margins[column]),
+            capacity_usage={capacity_names[row]: float(dense[row, column]) for row in range(6)},
+        )
+        for column, name in enumerate(product_names)
+    ]
+    capacities = [CapacityConstraint(name=name, limit=float(limit)) for name, limit in zip(capacity_names, limits)]
+    expected = solve_make_to_order(products, capacities)
+
+    coo = usage.tocoo()
+    for matrix in (usage, (coo.row, coo.col, coo.data)):
+        result = solve_make_to_order_sparse(product_names, margins, capacity_names, limits, matrix)
+        assert result.objective == pytest.approx(expected.objective)
+        assert result.shadow_prices == pytest.approx(expected.shadow_prices)
+        assert result.build_seconds >= 0
+        assert result.solve_seconds > 0
+
+
+def test_sparse_build_rejects_mismatched_shape() -> None:
+    with pytest.raises(ValueError):
+        solve_make_to_order_sparse(["A"], [1.0], ["R"], [1.0], sparse.identity(2, format="csr"))
+
+
+def _two_product_model() -> tuple[list[Product], list[CapacityConstraint]]:
+    products = [
+        Product(name="A", contribution_margin=50, capacity_usage={"machine": 2, "labor": 1}),
+        Product(name="B", contribution_margin=40, capacity_usage={"machine": 1, "labor": 1.5}),
+    ]
+    capacities = [
+        CapacityConstraint(name="machine", limit=100),
+        CapacityConstraint(name="labor", limit=80),
+    ]
+    return products, capacities
+
+
+def test_sparse_milp_honours_integrality_and_start() -> None:
+    # min -5a - 4b  s.t.  6a + 4b <= 24,  a + 2b <= 6,  a, b integer.
+    matrix = sparse.csr_matrix(np.array([[6.0, 4.0], [1.0, 2.0]]))
+    args = ([-5.0, -4.0], matrix, ["<", "<"], [24.0, 6.0], [0.0, 0.0], [np.inf, np.inf])
+
+    relaxed = solve_sparse_milp(*args, [False, False])
+    assert relaxed.objective == pytest.approx(-21.0)
+    solution = solve_sparse_milp(*args, [True, True], gap=0.0, threads=1, start=[0.0, 0.0])
+    assert solution.values == pytest.approx([4.0, 0.0])
+    assert solution.objective == pytest.approx(-20.0)
+
+    with pytest.raises(ValueError):
+        solve_sparse_milp([1.0], sparse.csr_matrix([[1.0]]), [">"], [2.0], [0.0], [1.0], [False])
+
+
+def test_session_resolves_match_cold_solves() -> None:
+    products, capacities = _two_product_model()
+    session = MakeToOrderSession.from_products(products, capacities)
+    first = session.solve()
+    assert first.objective == pytest.approx(solve_make_to_order(products, capacities).objective)
+
+    updated = session.update(capacity_limits={"machine": 120}, contribution_margins={"B": 45})
+    capacities[0] = CapacityConstraint(name="machine", limit=120)
+    products[1] = Product(name="B", contribution_margin=45, capacity_usage=products[1].capacity_usage)
+    expected = solve_make_to_order(products, capacities)
+    assert updated.objective == pytest.approx(expected.objective)
+    assert updated.shadow_prices == pytest.approx(expected.shadow_prices)
+
+    with pytest.raises(ValueError):
+        session.update(capacity_limits={"unknown": 1})
+    # A rejected update leaves the last accepted limits and margins in place.
+    with pytest.raises(ValueError):
+        session.update(capacity_limits={"machine": -1}, contribution_margins={"B": 1})
+    assert session.solve().objective == pytest.approx(expected.objective)
+
+
+def test_capacity_sweep_finds_breakpoints() -> None:
+    products, capacities = _two_product_model()
+    session = MakeToOrderSession.from_products(products, capacities)
+    sweep = session.sweep("machine", np.linspace(20, 200, 19).tolist())
+
+    # Objective is concave and piecewise linear in the limit with slope = shadow price.
+    slopes = sweep.shadow_prices[:, 0]
+    assert np.all(np.diff(slopes) <= 1e-9)
+    assert np.all(np.diff(sweep.objective) >= -1e-9)
+    # Machine stops binding alone once labor binds (at 2 * 80 = 160 units of A) and is slack beyond.
+    assert sweep.breakpoints.size >= 1
+    assert sweep.breakpoints.max() == pytest.approx(160.0)
+    # The session limit is restored after the sweep.
+    assert session.solve().objective == pytest.approx(solve_make_to_order(products, capacities).objective)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_scenario_batch_matches_cold_solves(workers: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(optimization, "_MIN_SCENARIOS_PER_TASK", 1)
+    products, capacities = _two_product_model()
+    scenarios = [
+        ({"machine": limit}, {"B": margin}) for limit in (60.0, 100.0, 140.0, 200.0) for margin in (30.0, 45.0, 70.0)
+    ]
+    scenarios += scenarios[:4] + [({"machine": -1.0}, {})]
+    batch = solve_make_to_order_scenarios(products, capacities, scenarios, max_workers=workers)
+
+    assert batch.unique_scenarios == 13
+    assert batch.production_plan.shape == (len(scenarios), 2)
+    for index, (limits, margins) in enumerate(scenarios[:-1]):
+        expected = solve_make_to_order(
+            [
+                Product(p.name, margins.get(p.name, p.contribution_margin), p.capacity_usage)
+                for p in products
+            ],
+            [CapacityConstraint(c.name, limits.get(c.name, c.limit)) for c in capacities],
+        )
+        assert batch.objective[index] == pytest.approx(expected.objective)
+        assert batch.shadow_prices[index] == pytest.approx([expected.shadow_prices[c.name] for c in capacities])
+    # A negative limit makes the LP infeasible; only that row is missing.
+    assert np.isnan(batch.objective[-1])
+
+    with pytest.raises(ValueError):
+        solve_make_to_order_scenarios(products, capacities, [({"unknown": 1.0}, {})])
+
+
+def test_optimization_scenario_endpoint(client) -> None:
+    payload = {
+        "products": [
+            {"name": "A", "contribution_margin": 50, "capacity_usage": {"machine": 2, "labor": 1}},
+            {"name": "B", "contribution_margin": 40, "capacity_usage": {"machine": 1, "labor": 1.5}},
+        ],
+        "capacities": [{"name": "machine", "limit": 100}, {"name": "labor", "limit": 80}],
+        "scenarios": [
+            {"name": "base"},
+            {"name": "overtime", "capacity_limits": {"labor": 100}},
+            {"name": "base-again"},
+            {"name": "broken", "capacity_limits": {"machine": -5}},
+        ],
+    }
+    response = client.post("/optimization/scenarios", json=payload)
+    assert response.status_code == 200
+    table = response.json()
+    assert table["scenarios"] == ["base", "overtime", "base-again", "broken"]
+    assert table["unique_scenarios"] == 3
+    assert table["objective"][0] == table["objective"][2]
+    assert table["objective"][1] > table["objective"][0]
+    assert table["objective"][3] is None
+    assert set(table["production_plan"]) == {"A", "B"}
+    assert len(table["shadow_prices"]["labor"]) == 4
+
+    payload["scenarios"] = [{"contribution_margins": {"unknown": 1}}]
+    assert client.post("/optimization/scenarios", json=payload).status_code == 400
+
+
+def test_optimization_session_endpoints(client) -> None:
+    payload = {
+        "products": [
+            {"name": "A", "contribution_margin": 50, "capacity_usage": {"machine": 2, "labor": 1}},
+            {"name": "B", "contribution_margin": 40, "capacity_usage": {"machine": 1, "labor": 1.5}},
+        ],
+        "capacities": [{"name": "machine", "limit": 100}, {"name": "labor", "limit": 80}],
+    }
+    created = client.post("/optimization/sessions", json=payload)
+    assert created.status_code == 201
+    session_id = created.json()["session_id"]
+
+    updated = client.patch(f"/optimization/sessions/{session_id}", json={"capacity_limits": {"machine": 110}})
+    assert updated.json()["result"]["objective"] > created.json()["result"]["objective"]
+
+    sweep = client.post(
+        f"/optimization/sessions/{session_id}/sweep", json={"capacity": "labor", "limits": [40, 80, 120]}
+    ).json()
+    assert sweep["limits"] == [40, 80, 120]
+    assert len(sweep["production_plan"]["A"]) == 3
+
+    assert client.delete(f"/optimization/sessions/{session_id}").status_code == 200
+    assert client.patch(f"/optimization/sessions/{session_id}", json={}).status_code == 404
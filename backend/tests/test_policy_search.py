@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+
+from backend.engines.monte_carlo import run_monte_carlo_simulation
+from backend.engines.policy_search import optimize_qr_policy
+
+_PARAMS: Dict[str, Any] = {
+    "demand_profile": [100.0] * 26,
+    "initial_inventory": 300.0,
+    "lead_time": 2,
+    "reorder_points": [100.0, 200.0, 300.0, 400.0],
+    "order_quantities": [150.0, 300.0, 600.0],
+    "holding_cost": 1.0,
+    "shortage_cost": 20.0,
+    "ordering_cost": 100.0,
+}
+
+
+def test_deterministic_search_matches_direct_simulation() -> None:
+    result = optimize_qr_policy(**_PARAMS, initial_replications=4, max_replications=4)
+
+    direct = [
+        run_monte_carlo_simulation(
+            _PARAMS["demand_profile"], 300.0, reorder_point, order_quantity, 2, replications=1
+        ).cost(1.0, 20.0, 100.0)[0]
+        for reorder_point, order_quantity in zip(result.reorder_point, result.order_quantity)
+    ]
+    assert result.mean_cost[result.best_index] == pytest.approx(min(direct))
+    # Without noise a single round separates every non-tied candidate.
+    assert result.rounds == 1
+
+
+def test_racing_spends_less_than_full_evaluation() -> None:
+    result = optimize_qr_policy(
+        **_PARAMS, demand_cv=0.3, lead_time_std=0.5, initial_replications=20, max_replications=640, seed=5
+    )
+    assert result.paths_simulated < result.reorder_point.size * 640
+    assert result.replications[result.best_index] == result.replications.max()
+    assert np.isfinite(result.best_std_error)
+
+
+def test_optimize_endpoint(client) -> None:
+    response = client.post(
+        "/inventory/optimize",
+        json={**_PARAMS, "demand_cv": 0.2, "max_replications": 200, "seed": 1},
+    )
+    payload = response.json()
+    assert response.status_code == 200
+    assert len(payload["candidates"]) == 12
+    assert payload["reorder_point"] in _PARAMS["reorder_points"]
+
+
+def test_optimize_endpoint_bounds_grid_times_budget(client) -> None:
+    grid = [float(value) for value in range(1, 201)]
+    payload = {**_PARAMS, "reorder_points": grid, "order_quantities": grid, "max_replications": 100_000}
+    response = client.post("/inventory/optimize", json=payload)
+    assert response.status_code == 422
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import numpy as np
+
+from backend.data.adapters.sample_loader import load_table
+from backend.engines.reconciliation import (
+    build_hierarchy,
+    reconcile_bottom_up,
+    reconcile_mint,
+    reconcile_top_down,
+)
+
+
+def test_hierarchy_from_demand_table() -> None:
+    demand = load_table("demand.csv")
+    leaves = list(demand[["product_id", "location_id"]].itertuples(index=False, name=None))
+    hierarchy = build_hierarchy(leaves)
+
+    assert hierarchy.labels[0] == "total"
+    assert "location:LOC-001" in hierarchy.labels
+    assert hierarchy.summing.shape == (len(hierarchy.labels), 3)
+    assert hierarchy.summing[0].sum() == 3
+
+
+def test_bottom_up_and_top_down_are_coherent() -> None:
+    hierarchy = build_hierarchy([("A", "X"), ("A", "Y"), ("B", "X")])
+    base = np.arange(len(hierarchy.labels) * 2, dtype=float).reshape(-1, 2)
+    leaf_rows = slice(hierarchy.n_aggregates, None)
+
+    bottom_up = reconcile_bottom_up(hierarchy, base)
+    np.testing.assert_allclose(bottom_up[leaf_rows], base[leaf_rows])
+    np.testing.assert_allclose(bottom_up[0], base[leaf_rows].sum(axis=0))
+
+    history = np.array([[10.0, 10.0], [30.0, 30.0], [60.0, 60.0]])
+    top_down = reconcile_top_down(hierarchy, base, history)
+    np.testing.assert_allclose(top_down[0], base[0])
+    np.testing.assert_allclose(top_down[leaf_rows][:, 0], base[0, 0] * np.array([0.1, 0.3, 0.6]))
+
+
+def test_mint_matches_dense_formula() -> None:
+    leaves = [(f"P{p}", f"L{loc}") for p in range(4) for loc in range(3) if (p + loc) % 4]
+    hierarchy = build_hierarchy(leaves)
+    summing = hierarchy.summing.toarray()
+    n_nodes = summing.shape[0]
+
+    rng = np.random.default_rng(0)
+    residuals = rng.normal(size=(20, n_nodes)) @ rng.normal(size=(n_nodes, n_nodes)) * 0.3
+    base = rng.normal(10, 3, (n_nodes, 3))
+
+    reconciled, lam = reconcile_mint(hierarchy, base, residuals)
+
+    covariance = residuals.T @ residuals / residuals.shape[0]
+    weights = lam * np.diag(np.diag(covariance)) + (1 - lam) * covariance
+    inverse = np.linalg.inv(weights)
+    projection = np.linalg.solve(summing.T @ inverse @ summing, summing.T @ inverse)
+    np.testing.assert_allclose(reconciled, summing @ projection @ base, atol=1e-9)
+    assert 0 < lam < 1
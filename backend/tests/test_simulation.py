@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+
+from backend.engines import monte_carlo
+from backend.engines.monte_carlo import run_monte_carlo_simulation, sample_replications
 from backend.engines.simulation import run_single_item_simulation
 
 
@@ -33,4 +40,126 @@ def test_simulate_inventory_endpoint(client) -> None:
     payload = response.json()
     assert response.status_code == 200
     assert payload["demand_served"] > 0
-    assert isinstance(payload["stockouts"], list)
\ No newline at end of file
+    assert isinstance(payload["stockouts"], list)
+
+
+@pytest.mark.parametrize("lead_time", [0, 1, 2, 3])
+def test_monte_carlo_matches_simpy_without_noise(lead_time: int) -> None:
+    params: Dict[str, Any] = {
+        "demand_profile": [40.0, 0.0, 75.5, 100.0, 20.0, 60.0, 90.0, 10.0],
+        "initial_inventory": 120.0,
+        "reorder_point": 60.0,
+        "order_quantity": 100.0,
+        "lead_time": lead_time,
+    }
+    expected = run_single_item_simulation(**params)
+    report = run_monte_carlo_simulation(replications=1, **params)
+
+    assert report.demand_served[0] == expected.demand_served
+    assert report.demand_lost[0] == expected.demand_lost
+    assert report.stockout_periods[0] == len(expected.stockouts)
+
+
+def test_monte_carlo_distributions_are_reproducible() -> None:
+    params: Dict[str, Any] = {
+        "demand_profile": [100.0] * 52,
+        "initial_inventory": 300.0,
+        "reorder_point": 250.0,
+        "order_quantity": 300.0,
+        "lead_time": 2,
+        "replications": 500,
+        "demand_cv": 0.3,
+        "lead_time_std": 1.0,
+        "seed": 7,
+    }
+    first = run_monte_carlo_simulation(**params)
+    second = run_monte_carlo_simulation(**params)
+
+    assert np.array_equal(first.demand_lost, second.demand_lost)
+    assert first.fill_rate.std() > 0
+    assert np.all((first.fill_rate >= 0) & (first.fill_rate <= 1))
+
+
+def test_monte_carlo_endpoint(client) -> None:
+    response = client.post(
+        "/inventory/simulate/monte-carlo",
+        json={
+            "demand_profile": [40, 60, 80, 100],
+            "initial_inventory": 120,
+            "reorder_point": 60,
+            "order_quantity": 100,
+            "lead_time": 2,
+            "replications": 200,
+            "demand_cv": 0.2,
+            "seed": 3,
+        },
+    )
+    payload = response.json()
+    assert response.status_code == 200
+    assert payload["replications"] == 200
+    assert payload["fill_rate"]["p05"] <= payload["fill_rate"]["p95"]
+
+
+def test_monte_carlo_is_identical_across_worker_counts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(monte_carlo, "_MIN_REPLICATIONS_PER_TASK", 10)
+    monkeypatch.setattr(monte_carlo, "_STREAM_BLOCK", 16)
+    params: Dict[str, Any] = {
+        "demand_profile": [100.0] * 26,
+        "initial_inventory": 250.0,
+        "reorder_point": 200.0,
+        "order_quantity": 250.0,
+        "lead_time": 3,
+        "replications": 120,
+        "demand_cv": 0.4,
+        "lead_time_std": 1.5,
+        "seed": 11,
+    }
+    serial = run_monte_carlo_simulation(max_workers=1, **params)
+    parallel = run_monte_carlo_simulation(max_workers=3, **params)
+
+    assert np.array_equal(serial.demand_served, parallel.demand_served)
+    assert np.array_equal(serial.demand_lost, parallel.demand_lost)
+    assert np.array_equal(serial.stockout_periods, parallel.stockout_periods)
+
+
+def test_sampled_replications_do_not_depend_on_range(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(monte_carlo, "_STREAM_BLOCK", 16)
+    args = ([100.0] * 12, 0.3, 2, 1.0)
+    demand, lead_times = sample_replications(5, 0, 100, *args)
+    part_demand, part_lead_times = sample_replications(5, 30, 70, *args)
+
+    assert np.array_equal(demand[30:70], part_demand)
+    assert np.array_equal(lead_times[30:70], part_lead_times)
+
+
+def test_simulation_trace_records_each_period() -> None:
+    report = run_single_item_simulation(
+        demand_profile=[40, 60, 80, 100],
+        initial_inventory=120,
+        reorder_point=60,
+        order_quantity=100,
+        lead_time=2,
+    )
+    trace = report.trace
+
+    assert np.allclose(trace.served + trace.lost, trace.demand)
+    assert trace.served.sum() == pytest.approx(report.demand_served)
+    assert [event.time for event in report.stockouts] == report.stockout_periods.tolist()
+    assert np.all(trace.on_hand >= 0)
+
+
+def test_simulate_endpoint_returns_trace_on_request(client) -> None:
+    payload = {
+        "demand_profile": [40, 60, 80, 100],
+        "initial_inventory": 120,
+        "reorder_point": 60,
+        "order_quantity": 100,
+        "lead_time": 2,
+    }
+    summary = client.post("/inventory/simulate", json=payload).json()
+    assert summary["trace"] is None
+
+    traced = client.post("/inventory/simulate", json={**payload, "trace": True}).json()
+    assert traced["trace"]["period"] == [1, 2, 3, 4]
+    assert len(traced["trace"]["on_order"]) == 4
+    assert traced["stockouts"] == summary["stockouts"]
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import numpy as np
+from statsmodels.tsa.holtwinters import SimpleExpSmoothing  # type: ignore[import-untyped]
+
+from backend.engines.smoothing import ses_batch
+
+
+def _series_matrix() -> np.ndarray:
+    rng = np.random.default_rng(1)
+    trend = np.cumsum(rng.normal(0, 5, (12, 36)), axis=1)
+    return 100 + trend + rng.normal(0, 10, (12, 36))
+
+
+def test_ses_batch_tracks_statsmodels_forecast() -> None:
+    data = _series_matrix()
+    result = ses_batch(data)
+
+    expected = np.array([SimpleExpSmoothing(row).fit(optimized=True).forecast(1)[0] for row in data])
+    np.testing.assert_allclose(result.level, expected, rtol=1e-2)
+    assert np.all((result.alpha > 0) & (result.alpha <= 1))
+
+
+def test_ses_batch_is_chunk_invariant() -> None:
+    data = _series_matrix()
+    whole = ses_batch(data, estimate_initial=True)
+    chunked = ses_batch(data, chunk_size=5, estimate_initial=True)
+
+    np.testing.assert_array_equal(whole.alpha, chunked.alpha)
+    np.testing.assert_allclose(whole.level, chunked.level)
+    assert np.all(whole.sse <= ses_batch(data).sse + 1e-6)